@@ -0,0 +1,72 @@
+"""Microbenchmark for decoding and shaping AniList Media responses
+
+Usage: python benchmarks/bench_media.py [iterations]
+"""
+import json
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from utils.media import MediaRecord, orjson, parse_graphql_response
+
+SAMPLE_MEDIA = {
+    "id": 16498,
+    "title": {"romaji": "Shingeki no Kyojin", "english": "Attack on Titan", "native": "進撃の巨人"},
+    "description": "Several hundred years ago, humans were nearly exterminated by titans.<br><br>" * 8,
+    "episodes": 25,
+    "duration": 24,
+    "status": "FINISHED",
+    "genres": ["Action", "Drama", "Fantasy", "Mystery"],
+    "averageScore": 85,
+    "popularity": 750000,
+    "siteUrl": "https://anilist.co/anime/16498",
+    "startDate": {"year": 2013, "month": 4, "day": 7},
+    "endDate": {"year": 2013, "month": 9, "day": 28},
+    "coverImage": {"large": "https://s4.anilist.co/file/anilistcdn/media/anime/cover/medium/bx16498.jpg"},
+    "bannerImage": "https://s4.anilist.co/file/anilistcdn/media/anime/banner/16498.jpg",
+    "studios": {"nodes": [{"name": "Wit Studio"}, {"name": "Production I.G"}]},
+    "seasonYear": 2013,
+    "season": "SPRING"
+}
+RAW = json.dumps({"data": {"Media": SAMPLE_MEDIA}}).encode()
+
+def stdlib_dict_path():
+    """Previous path: stdlib decode, then a fresh formatted dict per request"""
+    api_data = json.loads(RAW)["data"]["Media"]
+    return {
+        "title": api_data["title"]["romaji"],
+        "english_title": api_data["title"]["english"],
+        "native_title": api_data["title"]["native"],
+        "description": api_data["description"],
+        "episodes": api_data["episodes"],
+        "status": api_data["status"],
+        "genres": api_data["genres"],
+        "average_score": api_data["averageScore"],
+        "popularity": api_data["popularity"],
+        "site_url": api_data["siteUrl"],
+        "cover_image": api_data["coverImage"]["large"],
+        "banner_image": api_data["bannerImage"],
+        "studios": [studio["name"] for studio in api_data["studios"]["nodes"]],
+        "year": api_data["seasonYear"],
+        "season": api_data["season"]
+    }
+
+def record_path():
+    """Current path: fast decode straight into a MediaRecord
+
+    Includes the one-off description sanitizing the previous path skipped.
+    """
+    data, _ = parse_graphql_response(RAW)
+    return MediaRecord.from_api(data["Media"])
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print(f"decoder: {'orjson' if orjson is not None else 'json (stdlib fallback)'}")
+    for name, func in (("stdlib + dict", stdlib_dict_path), ("decode + record", record_path)):
+        seconds = min(timeit.repeat(func, number=iterations, repeat=3))
+        print(f"{name:>16}: {seconds / iterations * 1e6:.2f} us/op")
+
+if __name__ == "__main__":
+    main()
@@ -33,7 +33,9 @@ DB_SETTINGS = {
     'database': 'anime_watchlist',
     'collections': {
         'users': 'users',
-        'anime_lists': 'anime_lists'
+        'anime_lists': 'anime_lists',
+        'cluster_health': 'cluster_health',
+        'guild_settings': 'guild_settings'
     }
 }
 
@@ -44,16 +46,74 @@ MONGODB_URI = DBSTR
 # Database Configuration
 DB_NAME = DB_SETTINGS['database']
 COLLECTION_NAME = DB_SETTINGS['collections']['anime_lists']
+USERS_COLLECTION_NAME = DB_SETTINGS['collections']['users']
+CLUSTER_HEALTH_COLLECTION_NAME = DB_SETTINGS['collections']['cluster_health']
+GUILD_SETTINGS_COLLECTION_NAME = DB_SETTINGS['collections']['guild_settings']
 
 # AniList API
 ANILIST_API_URL = "https://graphql.anilist.co"
+ANILIST_CACHE_SIZE = 5000  # Media entries kept in the id lookup cache
+SEARCH_RESULTS_LIMIT = 10  # Candidates offered by the search picker
+SEARCH_CACHE_TTL = 300  # seconds a search's candidate list is reused
+CATALOG_PATH = 'data/catalog.idx'  # Offline title index built by the buildcatalog command
+CATALOG_CHECK_INTERVAL = 30  # seconds between checks for a catalog rebuilt by another process
 
 # Anime Status Configuration
 VALID_STATUSES = ["Watching", "Completed", "To Watch"]
 
 # Pagination Configuration
 ITEMS_PER_PAGE = 5
+MANAGE_PAGE_SIZE = 25  # Discord caps select menus at 25 options
 PAGINATION_TIMEOUT = 60.0  # seconds
+INTERACTION_ACK_BUDGET = 2.0  # seconds before a slow view callback is auto-deferred (Discord allows 3)
+EDIT_COALESCE_WINDOW = 0.75  # seconds rapid edits of one message are merged over
+
+# Sharding Configuration
+SHARD_COUNT = int(os.getenv('SHARD_COUNT', '0')) or None  # None asks Discord for the recommended count
+CLUSTER_COUNT = int(os.getenv('CLUSTER_COUNT', '1'))  # worker processes started by launcher.py
+CLUSTER_ID = os.getenv('CLUSTER_ID')  # set by launcher.py in each cluster process
+CLUSTER_HEALTH_INTERVAL = 30  # seconds between shard health reports
+CLUSTER_HEALTH_STALE_AFTER = 90  # seconds after which a cluster's report counts as missing
+
+# Metrics Configuration
+METRICS_HOST = os.getenv('METRICS_HOST', '127.0.0.1')  # keep the endpoint local; scrape through a proxy if needed
+METRICS_PORT = int(os.getenv('METRICS_PORT', '9108'))  # 0 disables the metrics endpoint
+
+# Shutdown Configuration
+DRAIN_TIMEOUT = 30.0  # seconds to wait for in-flight commands before closing anyway
+
+# Interactive Session Configuration
+SESSION_MAX_PER_USER = 3  # open views/confirmations per user before the oldest is closed
+SESSION_MAX_TOTAL = 500  # open views/confirmations across the bot
+
+# Airing Notification Configuration
+NOTIFIER_REFRESH_INTERVAL = 1800  # seconds between full airing schedule refreshes
+NOTIFY_BATCH_SIZE = 25  # DMs sent concurrently per batch
+NOTIFY_BATCH_DELAY = 1.0  # seconds between notification batches
+
+# Broadcast Configuration
+BROADCAST_CONCURRENCY = 10  # guilds sent to at once
+BROADCAST_RATE = 25.0  # messages per second, under Discord's global limit of 50
+BROADCAST_CHECKPOINT_PATH = 'data/broadcast_checkpoint.json'  # lets an interrupted broadcast resume
+
+# Guild Invite Configuration
+GUILD_INVITE_CONCURRENCY = 10  # guilds fetching or creating invites at once
+GUILD_INVITE_CACHE_TTL = 600  # seconds an invite lookup is reused
+GUILD_INVITE_FAILURE_TTL = 30  # seconds a failed invite lookup is reused before retrying
+GUILD_INVITES_PER_PAGE = 10
+
+# Cross-Guild Moderation Configuration
+MODERATION_CONCURRENCY = 5  # guilds (and channel overwrites per guild) handled at once
+
+# Slash Command Configuration
+AUTOCOMPLETE_TIMEOUT = 2.0  # seconds, under Discord's 3 second autocomplete deadline
+
+# Watchlist Card Configuration
+CARD_MAX_ENTRIES = 24  # Covers drawn on one card
+CARD_RENDER_WORKERS = 2  # Processes rendering cards with Pillow
+CARD_CACHE_TTL = 3600  # seconds a rendered card is kept for an unchanged list
+THUMBNAIL_CACHE_DIR = 'data/thumbnails'
+THUMBNAIL_CACHE_MAX_BYTES = 200 * 1024 * 1024  # 200MB
 
 # Embed Configuration
 EMBED_COLOR = 0x00ff00
@@ -61,8 +121,11 @@ EMBED_FOOTER = "Anime Watch Track Bot"
 
 # Logging Configuration
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-LOG_FILE = 'logs/bot.log'
+LOG_FILE = f'logs/bot.cluster{CLUSTER_ID}.log' if CLUSTER_ID else 'logs/bot.log'  # one file per process so rotations don't race
 LOG_LEVEL = 'INFO'
+LOG_JSON = os.getenv('LOG_JSON', 'false').lower() == 'true'  # one JSON object per line instead of LOG_FORMAT
+LOG_COMMAND_SAMPLE_RATE = float(os.getenv('LOG_COMMAND_SAMPLE_RATE', '1.0'))  # fraction of command usage lines kept
+LOG_COMMAND_RATE_LIMIT = float(os.getenv('LOG_COMMAND_RATE_LIMIT', '20'))  # command usage lines per second, 0 disables the cap
 
 # Error Messages
 ERRORS = {
@@ -0,0 +1,112 @@
+import asyncio
+import multiprocessing
+import sys
+import time
+import os
+import signal
+from typing import Dict, Iterable, List
+from dotenv import load_dotenv
+
+# Add src directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+
+# Load environment variables
+load_dotenv()
+
+from config.config import DISCORD_TOKEN, SHARD_COUNT, CLUSTER_COUNT, DRAIN_TIMEOUT
+from utils.cluster import fetch_recommended_shards, split_shards
+from utils.logger import logger
+
+RESTART_DELAY = 5.0  # seconds before restarting a cluster that exited
+RESTART_DELAY_MAX = 300.0  # cap for the backoff of a cluster that keeps crashing
+STABLE_AFTER = 600.0  # seconds a cluster must run before its backoff resets
+SHUTDOWN_TIMEOUT = DRAIN_TIMEOUT + 15.0  # seconds clusters get to drain and close before being killed
+
+def run_cluster(cluster_id: int, shard_ids: List[int], shard_count: int) -> None:
+    """Process entry point: run one bot over a range of shards"""
+    # Ctrl+C reaches the whole process group; let the launcher's SIGTERM drive a drained shutdown
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    import main
+    main.main(shard_ids=shard_ids, shard_count=shard_count, cluster_id=cluster_id)
+
+def start_cluster(cluster_id: int, shard_ids: List[int], shard_count: int) -> multiprocessing.Process:
+    # Spawned children inherit the environment; each cluster logs to its own file
+    os.environ["CLUSTER_ID"] = str(cluster_id)
+    process = multiprocessing.Process(
+        target=run_cluster,
+        args=(cluster_id, shard_ids, shard_count),
+        name=f"cluster-{cluster_id}"
+    )
+    process.start()
+    logger.info(f"Started cluster {cluster_id} (pid {process.pid}) with shards {shard_ids[0]}-{shard_ids[-1]}")
+    return process
+
+def stop_clusters(processes: Iterable[multiprocessing.Process]) -> None:
+    """Ask every cluster to drain and close, killing any that outlive SHUTDOWN_TIMEOUT"""
+    alive = [process for process in processes if process.is_alive()]
+    for process in alive:
+        process.terminate()  # SIGTERM, which main.main turns into a drained shutdown
+    deadline = time.monotonic() + SHUTDOWN_TIMEOUT
+    for process in alive:
+        process.join(timeout=max(deadline - time.monotonic(), 0))
+    for process in alive:
+        if process.is_alive():
+            logger.warning(f"Cluster {process.name} did not shut down in time; killing it")
+            process.kill()
+            process.join()
+
+def _raise_interrupt(signum, frame) -> None:
+    raise KeyboardInterrupt
+
+def launch() -> None:
+    """Start one process per cluster and restart any that exit unexpectedly"""
+    shard_count = SHARD_COUNT or asyncio.run(fetch_recommended_shards(DISCORD_TOKEN))
+    clusters = split_shards(shard_count, CLUSTER_COUNT)
+    logger.info(f"Launching {len(clusters)} cluster(s) for {shard_count} shard(s)")
+    # Stopping the launcher (e.g. by a service manager) stops the clusters the same way
+    signal.signal(signal.SIGTERM, _raise_interrupt)
+
+    processes: Dict[int, multiprocessing.Process] = {}
+    started_at: Dict[int, float] = {}
+    delays: Dict[int, float] = {}
+    # cluster_id -> monotonic time a crashed cluster is due to be restarted
+    restart_at: Dict[int, float] = {}
+    for cluster_id, shard_ids in enumerate(clusters):
+        processes[cluster_id] = start_cluster(cluster_id, shard_ids, shard_count)
+        started_at[cluster_id] = time.monotonic()
+        delays[cluster_id] = RESTART_DELAY
+
+    try:
+        while True:
+            time.sleep(1)
+            now = time.monotonic()
+            for cluster_id, process in processes.items():
+                if cluster_id in restart_at:
+                    if now >= restart_at[cluster_id]:
+                        del restart_at[cluster_id]
+                        processes[cluster_id] = start_cluster(cluster_id, clusters[cluster_id], shard_count)
+                        started_at[cluster_id] = time.monotonic()
+                    continue
+                if process.is_alive():
+                    continue
+                if process.exitcode == 0:
+                    # A clean exit (owner shutdown) stops the whole deployment
+                    logger.info(f"Cluster {cluster_id} shut down cleanly; stopping launcher")
+                    return
+                if now - started_at[cluster_id] > STABLE_AFTER:
+                    delays[cluster_id] = RESTART_DELAY
+                logger.warning(
+                    f"Cluster {cluster_id} exited with code {process.exitcode}; "
+                    f"restarting in {delays[cluster_id]:.0f}s"
+                )
+                # Restart by deadline so the other clusters stay watched meanwhile
+                restart_at[cluster_id] = now + delays[cluster_id]
+                delays[cluster_id] = min(delays[cluster_id] * 2, RESTART_DELAY_MAX)
+    except KeyboardInterrupt:
+        logger.info("Launcher stopped by keyboard interrupt or SIGTERM")
+    finally:
+        stop_clusters(processes.values())
+
+if __name__ == "__main__":
+    multiprocessing.set_start_method("spawn")
+    launch()
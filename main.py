@@ -1,9 +1,16 @@
+import time
+
+# Reference point for the time-to-ready breakdown logged on first ready
+PROCESS_STARTED = time.perf_counter()
+
 import discord
 from discord.ext import commands
 import asyncio
+import signal
 import sys
 import traceback
 from pathlib import Path
+from typing import List, Optional
 import os
 from dotenv import load_dotenv
 
@@ -13,31 +20,46 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
 # Load environment variables
 load_dotenv()
 
-from config.config import PREFIX, DESCRIPTION, DISCORD_TOKEN, OWNER_IDS
+from config.config import PREFIX, DESCRIPTION, DISCORD_TOKEN, OWNER_IDS, METRICS_HOST, METRICS_PORT
 from utils.logger import logger, log_startup, log_shutdown
+from utils.paginator import PageButton
+from utils.sessions import sessions
+from utils.metrics_server import MetricsServer
+from utils.drain import drain, BotDraining, DRAIN_MESSAGE
+from utils.edit_scheduler import edit_scheduler
+from utils.database import DatabaseManager
+from utils.anilist import AniListAPI
+from utils.cluster import ClusterHealthReporter, PartialDeployment
+from utils.prefixes import PrefixResolver
 
 async def get_prefix(bot, message):
-    """Get the command prefix for a message
+    """Get the command prefixes for a message
     
     This function allows for:
     1. Using mentions as a prefix (e.g. @bot help)
-    2. Using the configured prefix
+    2. Using the guild's prefix, or the configured default
     3. Owner can use ? as a prefix
-    """
-    # Get base prefixes
-    prefixes = [PREFIX]
-    
-    # Add bot mention as a prefix
-    prefixes.extend([f'<@!{bot.user.id}> ', f'<@{bot.user.id}> '])
     
-    # Add ? prefix for bot owners
-    if message.author.id in OWNER_IDS:
-        prefixes.append('?')
+    The candidates come precomputed from the bot's PrefixResolver.
+    """
+    return bot.prefixes.candidates(message.guild.id if message.guild else None, message.author.id)
+
+class AnimeTree(discord.app_commands.CommandTree):
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Turn slash commands away while the bot drains"""
+        if drain.draining and interaction.user.id not in OWNER_IDS:
+            if interaction.type == discord.InteractionType.application_command:
+                await interaction.response.send_message(DRAIN_MESSAGE, ephemeral=True)
+            return False
+        return True
     
-    return prefixes
+    async def _call(self, interaction: discord.Interaction) -> None:
+        """Run a slash command, counting it as in-flight work for draining"""
+        async with drain.track("app_command"):
+            await super()._call(interaction)
 
-class AnimeBot(commands.Bot):
-    def __init__(self):
+class AnimeBot(commands.AutoShardedBot):
+    def __init__(self, shard_ids: Optional[List[int]] = None, shard_count: Optional[int] = None, cluster_id: int = 0):
         intents = discord.Intents.default()
         intents.message_content = True
         intents.members = True
@@ -46,37 +68,149 @@ class AnimeBot(commands.Bot):
             command_prefix=get_prefix,
             description=DESCRIPTION,
             intents=intents,
-            case_insensitive=True
+            case_insensitive=True,
+            tree_cls=AnimeTree,
+            shard_ids=shard_ids,
+            shard_count=shard_count
         )
+        # Only cluster 0 runs process-wide singletons such as the airing notifier
+        self.cluster_id = cluster_id
+        self.default_prefix = PREFIX
+        self.prefixes = PrefixResolver(PREFIX, OWNER_IDS)
+        # Shared connections live as long as the bot, not any one cog
+        self.db = DatabaseManager()
+        self.anilist = AniListAPI()
+        self.metrics_server = MetricsServer(METRICS_HOST, METRICS_PORT + cluster_id) if METRICS_PORT else None
+        self.health_reporter = ClusterHealthReporter(self, self.db, cluster_id)
+        self._drain_task = None
+        # Seconds spent in each startup phase, logged once on the first ready
+        self._startup = {}
+        self._prefix_task = None
+        self.add_check(self.reject_while_draining)
         
     async def setup_hook(self) -> None:
         """Load extensions and perform any additional setup"""
+        self._startup["init"] = time.perf_counter() - PROCESS_STARTED
+        
+        # Connect to Mongo and build indexes while logging in; DB calls wait for it
+        self.db.start()
+        self._prefix_task = asyncio.create_task(self.load_guild_prefixes())
+        
+        # Register persistent components once so they survive restarts
+        self.add_dynamic_items(PageButton)
+        
         # Load all cogs
+        started = time.perf_counter()
         await self.load_extensions()
+        self._startup["extensions"] = time.perf_counter() - started
+        
+        if self.metrics_server:
+            await self.metrics_server.start()
+        self.health_reporter.start()
+        self._startup["setup_done"] = time.perf_counter()
         
+    async def load_guild_prefixes(self) -> None:
+        """Fill the in-memory prefix map from Mongo"""
+        try:
+            self.prefixes.load(await self.db.get_guild_prefixes())
+        except Exception as e:
+            logger.error(f"Failed to load guild prefixes: {str(e)}")
+    
+    async def on_message(self, message: discord.Message) -> None:
+        """Skip messages that cannot be commands before discord.py parses them"""
+        if message.author.bot:
+            return
+        guild_id = message.guild.id if message.guild else None
+        if not self.prefixes.may_be_command(message.content, guild_id, message.author.id):
+            return
+        await self.process_commands(message)
+    
+    async def _load_extension(self, extension: str) -> None:
+        try:
+            await self.load_extension(extension)
+            logger.info(f"Loaded extension: {extension}")
+        except Exception as e:
+            logger.error(f"Failed to load extension {extension}: {str(e)}")
+            traceback.print_exc()
+    
     async def load_extensions(self) -> None:
-        """Load all extensions from the cogs directory"""
+        """Load all extensions from the cogs directory concurrently"""
         cogs_dir = Path(__file__).parent / "src" / "cogs"
-        for file in cogs_dir.glob("*.py"):
-            if file.name != "base_cog.py" and not file.name.startswith("_"):
-                extension = f"src.cogs.{file.stem}"
-                try:
-                    await self.load_extension(extension)
-                    logger.info(f"Loaded extension: {extension}")
-                except Exception as e:
-                    logger.error(f"Failed to load extension {extension}: {str(e)}")
-                    traceback.print_exc()
+        extensions = [
+            f"src.cogs.{file.stem}"
+            for file in sorted(cogs_dir.glob("*.py"))
+            if file.name != "base_cog.py" and not file.name.startswith("_")
+        ]
+        await asyncio.gather(*(self._load_extension(extension) for extension in extensions))
+    
+    async def add_cog(self, cog: commands.Cog, /, **kwargs) -> None:
+        """Add a cog and notify listeners that the command set changed"""
+        await super().add_cog(cog, **kwargs)
+        self.dispatch("commands_changed")
+    
+    async def remove_cog(self, name: str, /, **kwargs):
+        """Remove a cog and notify listeners that the command set changed"""
+        cog = await super().remove_cog(name, **kwargs)
+        if cog is not None:
+            self.dispatch("commands_changed")
+        return cog
+    
+    async def reject_while_draining(self, ctx: commands.Context) -> bool:
+        """Global check failing fast for new commands during a drain; owners are let through"""
+        if drain.draining and ctx.author.id not in OWNER_IDS:
+            raise BotDraining(DRAIN_MESSAGE)
+        return True
+    
+    async def invoke(self, ctx: commands.Context) -> None:
+        """Invoke a command, counting it as in-flight work for draining"""
+        if ctx.command is None:
+            await super().invoke(ctx)
+            return
+        async with drain.track("command"):
+            await super().invoke(ctx)
+    
+    def request_shutdown(self) -> None:
+        """Drain and close in the background so the calling command can finish first"""
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self.drain_and_close())
+    
+    async def drain_and_close(self) -> None:
+        """Reject new work, let in-flight commands and pending edits finish, then close"""
+        drain.start()
+        await self.change_presence(status=discord.Status.dnd, activity=discord.Game("🛠️ Restarting"))
+        await drain.wait_idle()
+        await edit_scheduler.flush()
+        await self.close()
+    
+    def _log_time_to_ready(self) -> None:
+        """Log where startup time went, on the first ready only"""
+        setup_done = self._startup.pop("setup_done", None)
+        if setup_done is None:
+            return
+        now = time.perf_counter()
+        db_ready = (
+            f"{self.db.connect_seconds:.2f}s" if self.db.connect_seconds is not None else "still running"
+        )
+        logger.info(
+            f"Ready in {now - PROCESS_STARTED:.2f}s "
+            f"(imports and init {self._startup['init']:.2f}s, "
+            f"extensions {self._startup['extensions']:.2f}s, "
+            f"gateway {now - setup_done:.2f}s; "
+            f"database connect and indexes {db_ready} in the background)"
+        )
     
     async def on_ready(self):
         """Called when the bot is ready"""
         log_startup()
+        self._log_time_to_ready()
+        self.prefixes.set_mentions(self.user.id)
         logger.info(f"Logged in as {self.user.name} (ID: {self.user.id})")
-        logger.info(f"Connected to {len(self.guilds)} guilds")
+        logger.info(f"Connected to {len(self.guilds)} guilds on shards {sorted(self.shards)} (cluster {self.cluster_id})")
         
         # Set custom status
         activity = discord.Activity(
             type=discord.ActivityType.watching,
-            name=f"anime | {PREFIX}help"
+            name=f"anime | {self.default_prefix}help"
         )
         await self.change_presence(activity=activity)
     
@@ -85,6 +219,14 @@ class AnimeBot(commands.Bot):
         if isinstance(error, commands.CommandNotFound):
             return  # Ignore command not found errors
             
+        if isinstance(error, BotDraining):
+            await ctx.send(str(error))
+            return
+            
+        if isinstance(error, PartialDeployment):
+            await ctx.send(f"⚠️ {error}")
+            return
+            
         if isinstance(error, commands.MissingPermissions):
             await ctx.send(f"You don't have permission to use this command.")
             return
@@ -100,13 +242,27 @@ class AnimeBot(commands.Bot):
     async def close(self) -> None:
         """Clean up and close the bot"""
         log_shutdown()
+        sessions.close_all()
+        await self.health_reporter.stop()
+        if self.metrics_server:
+            await self.metrics_server.stop()
         await super().close()
+        await self.anilist.close()
+        self.db.close()
+
+async def run(bot: AnimeBot) -> None:
+    """Run the bot, turning SIGTERM (e.g. from launcher.py) into a drained shutdown"""
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, bot.request_shutdown)
+    except NotImplementedError:
+        pass  # No loop signal handlers on Windows
+    await bot.start(DISCORD_TOKEN)
 
-def main():
-    """Main entry point for the bot"""
+def main(shard_ids: Optional[List[int]] = None, shard_count: Optional[int] = None, cluster_id: int = 0):
+    """Main entry point for the bot, or for one cluster process started by launcher.py"""
     try:
-        bot = AnimeBot()
-        asyncio.run(bot.start(DISCORD_TOKEN))
+        bot = AnimeBot(shard_ids=shard_ids, shard_count=shard_count, cluster_id=cluster_id)
+        asyncio.run(run(bot))
     except KeyboardInterrupt:
         print("\nBot shutdown requested...")
         logger.info("Bot stopped by keyboard interrupt")
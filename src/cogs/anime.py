@@ -1,10 +1,29 @@
 from discord.ext import commands
 from .base_cog import BaseCog
 from datetime import datetime
-from config.config import VALID_STATUSES, ITEMS_PER_PAGE, ERRORS, SUCCESS, PREFIX
-from discord import SelectOption, Interaction, ButtonStyle, TextStyle
+from config.config import (
+    VALID_STATUSES, ITEMS_PER_PAGE, MANAGE_PAGE_SIZE, AUTOCOMPLETE_TIMEOUT, ERRORS, SUCCESS,
+    CARD_MAX_ENTRIES, CARD_RENDER_WORKERS, CARD_CACHE_TTL, THUMBNAIL_CACHE_DIR, THUMBNAIL_CACHE_MAX_BYTES
+)
+from discord import SelectOption, Interaction, ButtonStyle, TextStyle, app_commands
 from discord.ui import Select, View, Button, TextInput, Modal
 import discord
+import asyncio
+import importlib.util
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from utils.cache import TTLCache
+from utils.card_renderer import render_card
+from utils.thumbnails import ThumbnailCache
+from utils.edit_scheduler import edit_scheduler
+from utils.interactions import tracked_callback, respond, respond_edit, defer
+from utils.sessions import SessionView
+from utils.paginator import RenderedPageCache, build_page_view, register_page_source
+from typing import Awaitable, Callable, List, Optional
+
+# Autocomplete choices carry ids rather than titles, which Discord caps at 100 characters
+CHOICE_ID_PREFIX = "id:"
 
 class EpisodeModal(Modal):
     def __init__(self, title, current, total):
@@ -19,13 +38,12 @@ class EpisodeModal(Modal):
         )
         self.add_item(self.episodes)
 
-class AnimeControlPanel(View):
+class AnimeControlPanel(SessionView):
     def __init__(self, cog, anime_data, watchlist_data, user_id):
-        super().__init__(timeout=180)  # 3 minutes timeout
+        super().__init__(user_id, timeout=180)  # 3 minutes timeout
         self.cog = cog
         self.anime_data = anime_data
         self.watchlist_data = watchlist_data
-        self.user_id = user_id
         
         # Status row
         self.add_item(Button(
@@ -89,19 +107,28 @@ class AnimeControlPanel(View):
             if isinstance(child, Button):
                 child.callback = self.button_callback
 
+    async def interaction_check(self, interaction: Interaction) -> bool:
+        return interaction.user.id == self.user_id
+
+    @tracked_callback
     async def button_callback(self, interaction: Interaction):
         custom_id = interaction.data["custom_id"]
-        title = self.anime_data["title"]
+        title = self.anime_data.title
         
         if custom_id == "reload":
             # Fetch fresh data from both API and database
-            anime_data = await self.cog.handle_api_response(interaction, title)
+            anime_data = await self.cog.handle_api_response(
+                interaction,
+                title,
+                anilist_id=self.watchlist_data.get("anilist_id")
+            )
             if not anime_data:
                 return
             
             watchlist_data = await self.cog.db.get_anime(self.user_id, title)
             if not watchlist_data:
-                await interaction.response.send_message(
+                await respond(
+                    interaction,
                     f"**{title}** was not found in your watchlist!",
                     ephemeral=True
                 )
@@ -113,7 +140,7 @@ class AnimeControlPanel(View):
             
             # Update embed and view
             embed = self.cog.embed_creator.create_status_embed(anime_data, watchlist_data)
-            await interaction.response.edit_message(embed=embed, view=self)
+            await respond_edit(interaction, embed=embed, view=self)
             return
         
         elif custom_id.startswith("status_"):
@@ -126,7 +153,8 @@ class AnimeControlPanel(View):
                 update_data["completion_date"] = datetime.now().strftime('%Y-%m-%d')
             
             await self.cog.db.update_anime(self.user_id, title, update_data)
-            await interaction.response.send_message(
+            await respond(
+                interaction,
                 f"Updated status of **{title}** to **{status}**",
                 ephemeral=True
             )
@@ -135,17 +163,18 @@ class AnimeControlPanel(View):
             modal = EpisodeModal(
                 title,
                 self.watchlist_data.get('episodes_watched', 0),
-                self.anime_data.get('episodes', '?')
+                self.anime_data.episodes or '?'
             )
             
+            @tracked_callback
             async def modal_callback(interaction: Interaction):
                 try:
                     episodes = int(modal.episodes.value)
-                    if 0 <= episodes <= self.anime_data['episodes']:
+                    if 0 <= episodes <= self.anime_data.episodes:
                         await self.cog.db.update_anime(self.user_id, title, {"episodes_watched": episodes})
                         
                         # Update status if needed
-                        if episodes == self.anime_data['episodes']:
+                        if episodes == self.anime_data.episodes:
                             await self.cog.db.update_anime(self.user_id, title, {
                                 "status": "Completed",
                                 "completion_date": datetime.now().strftime('%Y-%m-%d')
@@ -156,17 +185,20 @@ class AnimeControlPanel(View):
                                 "start_date": datetime.now().strftime('%Y-%m-%d')
                             })
                         
-                        await interaction.response.send_message(
-                            f"Updated progress of **{title}** to **{episodes}/{self.anime_data['episodes']}** episodes",
+                        await respond(
+                            interaction,
+                            f"Updated progress of **{title}** to **{episodes}/{self.anime_data.episodes}** episodes",
                             ephemeral=True
                         )
                     else:
-                        await interaction.response.send_message(
-                            f"Invalid episode number! Must be between 0 and {self.anime_data['episodes']}",
+                        await respond(
+                            interaction,
+                            f"Invalid episode number! Must be between 0 and {self.anime_data.episodes}",
                             ephemeral=True
                         )
                 except ValueError:
-                    await interaction.response.send_message(
+                    await respond(
+                        interaction,
                         "Please enter a valid number!",
                         ephemeral=True
                     )
@@ -178,7 +210,8 @@ class AnimeControlPanel(View):
         elif custom_id == "toggle_favorite":
             new_status = not self.watchlist_data.get("is_favorite", False)
             await self.cog.db.update_anime(self.user_id, title, {"is_favorite": new_status})
-            await interaction.response.send_message(
+            await respond(
+                interaction,
                 f"**{title}** is {'now' if new_status else 'no longer'} marked as favorite!",
                 ephemeral=True
             )
@@ -188,31 +221,38 @@ class AnimeControlPanel(View):
                 self.anime_data,
                 self.watchlist_data
             )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await respond(interaction, embed=embed, ephemeral=True)
         
         elif custom_id == "delete":
             if self.watchlist_data.get("is_favorite"):
-                await interaction.response.send_message(
+                await respond(
+                    interaction,
                     f"Cannot delete **{title}** because it's marked as favorite!",
                     ephemeral=True
                 )
                 return
             
             # Create confirmation view
-            confirm_view = View(timeout=30)
+            confirm_view = SessionView(self.user_id, timeout=30)
             
+            @tracked_callback
             async def confirm_callback(i: Interaction):
                 await self.cog.db.delete_anime(self.user_id, title)
-                await i.response.send_message(
+                await respond(
+                    i,
                     f"Deleted **{title}** from your watchlist!",
                     ephemeral=True
                 )
+                confirm_view.stop()
             
+            @tracked_callback
             async def cancel_callback(i: Interaction):
-                await i.response.send_message(
+                await respond(
+                    i,
                     f"Cancelled deletion of **{title}**",
                     ephemeral=True
                 )
+                confirm_view.stop()
             
             confirm_button = Button(label="Confirm Delete", style=ButtonStyle.danger, emoji="✅")
             cancel_button = Button(label="Cancel", style=ButtonStyle.secondary, emoji="❌")
@@ -223,7 +263,8 @@ class AnimeControlPanel(View):
             confirm_view.add_item(confirm_button)
             confirm_view.add_item(cancel_button)
             
-            await interaction.response.send_message(
+            await respond(
+                interaction,
                 f"Are you sure you want to delete **{title}**?",
                 view=confirm_view,
                 ephemeral=True
@@ -241,53 +282,154 @@ class AnimeControlPanel(View):
                 elif child.custom_id == "delete":
                     child.disabled = self.watchlist_data.get("is_favorite", False)
         
-        try:
-            await interaction.message.edit(view=self)
-        except:
-            pass
+        edit_scheduler.schedule(interaction.message, view=self)
+
+STATUS_FILTERS = ["Watching", "Completed", "To Watch", "On Hold", "Dropped"]
+# Letter buckets keep the filter within Discord's 25-option limit
+LETTER_FILTERS = ["#"] + [f"{chr(c)}-{chr(c + 1)}" for c in range(ord("A"), ord("Z"), 2)]
 
 class AnimeSelect(Select):
     def __init__(self, anime_list):
         options = []
-        for idx, anime in enumerate(anime_list):
-            # Create a unique value by combining title with index
-            unique_value = f"{anime['title']}|{idx}"
+        for anime in anime_list:
             options.append(
                 SelectOption(
                     label=anime["title"][:100],  # Discord has 100 char limit for labels
                     description=f"{anime['status']} - {anime.get('episodes_watched', 0)}/{anime.get('total_episodes', '?')} eps",
-                    value=unique_value,
+                    value=str(anime["_id"]),
                     emoji="⭐" if anime.get("is_favorite") else "📺"
                 )
             )
         
+        if not options:
+            options.append(SelectOption(label="No anime match these filters", value="none"))
+        
         super().__init__(
             placeholder="Select an anime to manage...",
             min_values=1,
             max_values=1,
-            options=options
+            options=options,
+            disabled=not anime_list,
+            row=2
         )
 
-class AnimeView(View):
-    def __init__(self, cog, anime_list, user_id):
-        super().__init__(timeout=60)
+class AnimeView(SessionView):
+    """Paged, filterable picker that only keeps the ids of the visible page"""
+
+    def __init__(self, cog, user_id):
+        super().__init__(user_id, timeout=60)
         self.cog = cog
-        self.anime_list = anime_list
-        self.user_id = user_id
+        self.page = 0
+        self.total_pages = 1
+        self.total = 0
+        self.status_filter = None
+        self.letter_filter = None
+        self.page_ids = []
+        self.select = None
         
-        # Add select menu
-        self.select = AnimeSelect(anime_list)
+        self.status_select = Select(
+            placeholder="Filter by status...",
+            options=[SelectOption(label="All statuses", value="all")] + [
+                SelectOption(label=status, value=status) for status in STATUS_FILTERS
+            ],
+            row=0
+        )
+        self.letter_select = Select(
+            placeholder="Filter by first letter...",
+            options=[SelectOption(label="All letters", value="all")] + [
+                SelectOption(label=letters, value=letters) for letters in LETTER_FILTERS
+            ],
+            row=1
+        )
+        self.prev_button = Button(emoji="⬅️", style=ButtonStyle.secondary, row=3)
+        self.page_button = Button(label="1/1", style=ButtonStyle.secondary, disabled=True, row=3)
+        self.next_button = Button(emoji="➡️", style=ButtonStyle.secondary, row=3)
+        
+        self.status_select.callback = self.status_filter_callback
+        self.letter_select.callback = self.letter_filter_callback
+        self.prev_button.callback = self.prev_callback
+        self.next_button.callback = self.next_callback
+        for item in (self.status_select, self.letter_select, self.prev_button, self.page_button, self.next_button):
+            self.add_item(item)
+
+    async def interaction_check(self, interaction: Interaction) -> bool:
+        return interaction.user.id == self.user_id
+
+    def _query(self):
+        query = {}
+        if self.status_filter:
+            query["status"] = self.status_filter
+        if self.letter_filter == "#":
+            query["title"] = {"$regex": "^[^A-Za-z]"}
+        elif self.letter_filter:
+            first, last = self.letter_filter.split("-")
+            query["title"] = {"$regex": f"^[{first}-{last}{first.lower()}-{last.lower()}]"}
+        return query
+
+    async def load_page(self):
+        """Fetch the current page from the database and rebuild the anime select"""
+        query = self._query()
+        self.total = await self.cog.db.count_anime(self.user_id, query)
+        self.total_pages = max((self.total + MANAGE_PAGE_SIZE - 1) // MANAGE_PAGE_SIZE, 1)
+        self.page = min(self.page, self.total_pages - 1)
+        page_items = await self.cog.db.get_anime_page(self.user_id, self.page, MANAGE_PAGE_SIZE, query)
+        self.page_ids = [str(anime["_id"]) for anime in page_items]
+        
+        if self.select:
+            self.remove_item(self.select)
+        self.select = AnimeSelect(page_items)
         self.select.callback = self.select_callback
         self.add_item(self.select)
-
+        
+        self.page_button.label = f"{self.page + 1}/{self.total_pages}"
+        self.prev_button.disabled = self.page <= 0
+        self.next_button.disabled = self.page >= self.total_pages - 1
+
+    def content(self):
+        return f"Select an anime to manage ({self.total} shown by these filters):"
+
+    async def _refresh(self, interaction: Interaction):
+        await self.load_page()
+        await respond_edit(interaction, content=self.content(), view=self)
+
+    @tracked_callback
+    async def status_filter_callback(self, interaction: Interaction):
+        value = self.status_select.values[0]
+        self.status_filter = None if value == "all" else value
+        self.page = 0
+        await self._refresh(interaction)
+
+    @tracked_callback
+    async def letter_filter_callback(self, interaction: Interaction):
+        value = self.letter_select.values[0]
+        self.letter_filter = None if value == "all" else value
+        self.page = 0
+        await self._refresh(interaction)
+
+    @tracked_callback
+    async def prev_callback(self, interaction: Interaction):
+        self.page = max(self.page - 1, 0)
+        await self._refresh(interaction)
+
+    @tracked_callback
+    async def next_callback(self, interaction: Interaction):
+        self.page += 1
+        await self._refresh(interaction)
+
+    @tracked_callback
     async def select_callback(self, interaction: Interaction):
-        # Extract title from the unique value
-        anime_title = self.select.values[0].split("|")[0]
-        anime = next((a for a in self.anime_list if a["title"] == anime_title), None)
+        entry_id = self.select.values[0]
+        if entry_id not in self.page_ids:
+            return
+        anime = await self.cog.db.get_anime_by_id(self.user_id, entry_id)
         
         if anime:
             # Get fresh data
-            anime_data = await self.cog.handle_api_response(interaction, anime_title)
+            anime_data = await self.cog.handle_api_response(
+                interaction,
+                anime["title"],
+                anilist_id=anime.get("anilist_id")
+            )
             if not anime_data:
                 return
             
@@ -295,18 +437,18 @@ class AnimeView(View):
             control_panel = AnimeControlPanel(self.cog, anime_data, anime, self.user_id)
             embed = self.cog.embed_creator.create_status_embed(anime_data, anime)
             
-            await interaction.response.send_message(
+            await respond(
+                interaction,
                 embed=embed,
                 view=control_panel,
                 ephemeral=True
             )
 
-class AddAnimeView(View):
+class AddAnimeView(SessionView):
     def __init__(self, cog, anime_data, user_id):
-        super().__init__(timeout=180)  # 3 minutes timeout
+        super().__init__(user_id, timeout=180)  # 3 minutes timeout
         self.cog = cog
         self.anime_data = anime_data
-        self.user_id = user_id
         self.status = None
         self.rating = None
         self.start_date = datetime.now().strftime('%Y-%m-%d')  # Set default date to today
@@ -383,6 +525,7 @@ class AddAnimeView(View):
             if isinstance(child, Button) and child.custom_id == "confirm":
                 child.disabled = not self.status
 
+    @tracked_callback
     async def status_callback(self, interaction: Interaction):
         try:
             # Get the selected status
@@ -408,19 +551,22 @@ class AddAnimeView(View):
             emoji = status_emojis.get(self.status, "")
             
             # Send feedback message
-            await interaction.response.send_message(
+            await respond(
+                interaction,
                 f"{emoji} Status set to **{self.status}**",
                 ephemeral=True
             )
             
             # Update view
-            await interaction.message.edit(view=self)
+            edit_scheduler.schedule(interaction.message, view=self)
         except Exception as e:
-            await interaction.response.send_message(
+            await respond(
+                interaction,
                 f"❌ Error setting status: {str(e)}",
                 ephemeral=True
             )
 
+    @tracked_callback
     async def rating_callback(self, interaction: Interaction):
         try:
             # Get the selected rating
@@ -438,16 +584,19 @@ class AddAnimeView(View):
             description = rating_descriptions.get(self.rating, "")
             
             # Send feedback message
-            await interaction.response.send_message(
+            await respond(
+                interaction,
                 f"⭐ Rating set to **{stars}** - {description}",
                 ephemeral=True
             )
         except Exception as e:
-            await interaction.response.send_message(
+            await respond(
+                interaction,
                 f"❌ Error setting rating: {str(e)}",
                 ephemeral=True
             )
 
+    @tracked_callback
     async def button_callback(self, interaction: Interaction):
         custom_id = interaction.data["custom_id"]
         
@@ -502,7 +651,7 @@ class AddAnimeView(View):
             return
         
         elif custom_id == "toggle_favorite":
-            await interaction.response.defer(ephemeral=True)
+            await defer(interaction, ephemeral=True)
             button = [child for child in self.children if child.custom_id == "toggle_favorite"][0]
             button.style = ButtonStyle.danger if button.style == ButtonStyle.secondary else ButtonStyle.secondary
             self.is_favorite = button.style == ButtonStyle.danger
@@ -514,22 +663,24 @@ class AddAnimeView(View):
         
         elif custom_id == "confirm":
             if not self.status:
-                await interaction.response.send_message(
+                await respond(
+                    interaction,
                     "❌ Please select a status first!",
                     ephemeral=True
                 )
                 return
             
-            await interaction.response.defer()
+            await defer(interaction)
             
             # Prepare anime data for database with automatic date handling
             anime_entry = {
-                "title": self.anime_data["title"],
+                "title": self.anime_data.title,
+                "anilist_id": self.anime_data.id,
                 "status": self.status,
                 "rating": int(self.rating) if self.rating else None,
-                "total_episodes": self.anime_data["episodes"],
+                "total_episodes": self.anime_data.episodes,
                 "episodes_watched": 0,
-                "source_link": self.anime_data["site_url"],
+                "source_link": self.anime_data.site_url,
                 "is_favorite": self.is_favorite,
                 "start_date": self.start_date,  # Always include start_date
                 "completion_date": datetime.now().strftime('%Y-%m-%d') if self.status == "Completed" else None
@@ -550,21 +701,138 @@ class AddAnimeView(View):
             )
         
         elif custom_id == "cancel":
-            await interaction.response.defer()
+            await defer(interaction)
             await interaction.edit_original_response(
                 content="❌ Add anime cancelled.",
                 embed=None,
                 view=None
             )
 
+class CandidateSelect(Select):
+    def __init__(self, candidates):
+        options = []
+        for idx, anime in enumerate(candidates):
+            details = [
+                str(anime.year or "?"),
+                f"{anime.episodes or '?'} eps"
+            ]
+            if anime.english_title:
+                details.append(anime.english_title)
+            options.append(
+                SelectOption(
+                    label=anime.title[:100],
+                    description=" • ".join(details)[:100],
+                    value=str(idx)
+                )
+            )
+        
+        super().__init__(
+            placeholder="Select the matching anime...",
+            min_values=1,
+            max_values=1,
+            options=options
+        )
+
+class CandidatePickerView(SessionView):
+    """Lets the user pick from a multi-result search without another API call"""
+
+    def __init__(self, cog, candidates, user_id, mode):
+        super().__init__(user_id, timeout=60)
+        self.cog = cog
+        self.candidates = candidates
+        self.mode = mode  # "add" or "search"
+        
+        self.select = CandidateSelect(candidates)
+        self.select.callback = self.select_callback
+        self.add_item(self.select)
+
+    async def interaction_check(self, interaction: Interaction) -> bool:
+        return interaction.user.id == self.user_id
+
+    @tracked_callback
+    async def select_callback(self, interaction: Interaction):
+        anime_data = self.candidates[int(self.select.values[0])]
+        watchlist_data = await self.cog.db.get_anime(self.user_id, anime_data.title)
+        
+        if self.mode == "add":
+            if watchlist_data:
+                await respond_edit(
+                    interaction,
+                    content=None,
+                    embed=self.cog.embed_creator.create_error_embed(
+                        "Already Exists",
+                        f"**{anime_data.title}** is already in your watchlist!"
+                    ),
+                    view=None
+                )
+            else:
+                await respond_edit(
+                    interaction,
+                    content="Found anime! Please fill in the details:",
+                    embed=self.cog.embed_creator.create_anime_details_embed(anime_data, None),
+                    view=AddAnimeView(self.cog, anime_data, self.user_id)
+                )
+        else:
+            await respond_edit(
+                interaction,
+                content=None,
+                embed=self.cog.embed_creator.create_anime_details_embed(anime_data, watchlist_data),
+                view=None
+            )
+        self.stop()
+
 class AnimeCog(BaseCog):
     """Commands for managing your anime watchlist"""
 
+    def __init__(self, bot: commands.Bot):
+        super().__init__(bot)
+        # Rendered watchlist pages so flipping back and forth skips the database
+        self._rendered_pages = RenderedPageCache()
+        # Rendered card PNGs keyed by (user_id, list_version)
+        self._cards = TTLCache(ttl=CARD_CACHE_TTL, maxsize=200)
+        self._thumbnails = ThumbnailCache(THUMBNAIL_CACHE_DIR, THUMBNAIL_CACHE_MAX_BYTES)
+        self._card_pool = None
+
+    async def cog_load(self) -> None:
+        """Register the watchlist page source with the shared paginator"""
+        register_page_source("watchlist", self.render_watchlist_page)
+
+    async def cog_unload(self) -> None:
+        """Stop card workers and close the thumbnail cache"""
+        if self._card_pool:
+            self._card_pool.shutdown(wait=False, cancel_futures=True)
+        await self._thumbnails.close()
+        await super().cog_unload()
+
+    async def _render_watchlist(self, user_id: int, page: int):
+        """Render one watchlist page, returning (embed, total pages, version, entry count)"""
+        version = await self.db.list_version(user_id)
+        rendered = self._rendered_pages.get(user_id, version, page)
+        if rendered is None:
+            total = await self.db.count_anime(user_id)
+            total_pages = max((total + ITEMS_PER_PAGE - 1) // ITEMS_PER_PAGE, 1)
+            page_items = await self.db.get_anime_page(user_id, min(page, total_pages - 1), ITEMS_PER_PAGE)
+            embed = self.embed_creator.create_list_embed(
+                f"📺 Your Anime Watchlist ({total} total)",
+                page_items,
+                min(page, total_pages - 1),
+                total_pages
+            )
+            rendered = (embed, total_pages, total)
+            self._rendered_pages.set(user_id, version, page, rendered)
+        embed, total_pages, total = rendered
+        return embed, total_pages, version, total
+
+    async def render_watchlist_page(self, user_id: int, page: int):
+        """Page source for the ``watchlist`` paginator"""
+        embed, total_pages, version, _ = await self._render_watchlist(user_id, page)
+        return embed, total_pages, version
+
     @commands.command(name="add_anime", aliases=["add"], help="Add an anime to your watchlist")
     async def add_anime(self, ctx, *, title=None):
         """Add an anime to your watchlist interactively
         
-        Usage: {PREFIX}add "Title"
+        Usage: {prefix}add "Title"
         Shows an interactive menu to:
         - Select status (👀 Watching, ✅ Completed, 📝 To Watch, ⏸️ On Hold, ⛔ Dropped)
         - Rate the anime (★★★★★)
@@ -574,23 +842,33 @@ class AnimeCog(BaseCog):
         if not title:
             await ctx.send(embed=self.embed_creator.create_error_embed(
                 "Missing Arguments",
-                f"Usage: {PREFIX}add \"Title\"\n"
-                f"Example: {PREFIX}add \"Naruto\""
+                f"Usage: {ctx.clean_prefix}add \"Title\"\n"
+                f"Example: {ctx.clean_prefix}add \"Naruto\""
             ))
             return
 
         try:
-            # Fetch anime details from AniList
-            anime_data = await self.handle_api_response(ctx, title)
-            if not anime_data:
+            # Fetch candidate matches from AniList in one request
+            candidates = await self.handle_search_response(ctx, title)
+            if not candidates:
                 return
 
+            if len(candidates) > 1:
+                view = CandidatePickerView(self, candidates, ctx.author.id, "add")
+                await ctx.send(
+                    f"Found **{len(candidates)}** matches for **{title}**. Pick the right one:",
+                    view=view
+                )
+                return
+
+            anime_data = candidates[0]
+
             # Check if anime already exists for this user
-            existing = await self.db.get_anime(ctx.author.id, anime_data["title"])
+            existing = await self.db.get_anime(ctx.author.id, anime_data.title)
             if existing:
                 await ctx.send(embed=self.embed_creator.create_error_embed(
                     "Already Exists",
-                    f"**{anime_data['title']}** is already in your watchlist!"
+                    f"**{anime_data.title}** is already in your watchlist!"
                 ))
                 return
 
@@ -620,7 +898,7 @@ class AnimeCog(BaseCog):
         if not title:
             await ctx.send(embed=self.embed_creator.create_error_embed(
                 "Missing Title",
-                f"Usage: {PREFIX}delete_anime \"Title\""
+                f"Usage: {ctx.clean_prefix}delete_anime \"Title\""
             ))
             return
 
@@ -664,77 +942,20 @@ class AnimeCog(BaseCog):
         
         Usage: {prefix}list_anime
         Shows a paginated list of all anime with status, progress, and preferences
-        Use ⬅️ ➡️ reactions to navigate pages
+        Use the ⬅️ ➡️ buttons to navigate pages
         """
         try:
-            anime_list = await self.db.get_all_anime(ctx.author.id)
-            if not anime_list:
+            embed, total_pages, version, total = await self._render_watchlist(ctx.author.id, 0)
+            if not total:
                 await ctx.send(embed=self.embed_creator.create_error_embed(
                     "Empty Watchlist",
-                    f"Your watchlist is empty! Use {PREFIX}add_anime to add some anime."
+                    f"Your watchlist is empty! Use {ctx.clean_prefix}add_anime to add some anime."
                 ))
                 return
 
-            total_pages = (len(anime_list) + ITEMS_PER_PAGE - 1) // ITEMS_PER_PAGE
-            page = 0
-
-            # Sort anime list by status and favorite
-            anime_list.sort(key=lambda x: (
-                not x.get('is_favorite', False),  # Favorites first
-                {'Watching': 0, 'To Watch': 1, 'Completed': 2}.get(x.get('status', ''), 3),  # Sort by status
-                x['title'].lower()  # Then alphabetically
-            ))
-
-            embed = self.embed_creator.create_list_embed(
-                f"📺 Your Anime Watchlist ({len(anime_list)} total)",  # Updated to say "Your"
-                anime_list,
-                page,
-                total_pages,
-                ITEMS_PER_PAGE
-            )
-            message = await ctx.send(embed=embed)
-
-            # Add navigation reactions
-            await message.add_reaction("⬅️")
-            await message.add_reaction("➡️")
-
-            def check(reaction, user):
-                return (
-                    user == ctx.author
-                    and str(reaction.emoji) in ["⬅️", "➡️"]
-                    and reaction.message.id == message.id
-                )
-
-            while True:
-                try:
-                    reaction, user = await self.bot.wait_for(
-                        "reaction_add",
-                        timeout=60.0,
-                        check=check
-                    )
-
-                    if str(reaction.emoji) == "➡️" and page < total_pages - 1:
-                        page += 1
-                    elif str(reaction.emoji) == "⬅️" and page > 0:
-                        page -= 1
-
-                    embed = self.embed_creator.create_list_embed(
-                        f"📺 Your Anime Watchlist ({len(anime_list)} total)",
-                        anime_list,
-                        page,
-                        total_pages,
-                        ITEMS_PER_PAGE
-                    )
-                    await message.edit(embed=embed)
-                    await message.remove_reaction(reaction, user)
-
-                except TimeoutError:
-                    # Remove reactions after timeout
-                    try:
-                        await message.clear_reactions()
-                    except:
-                        pass
-                    break
+            view = build_page_view("watchlist", ctx.author.id, version, 0, total_pages)
+            message = await ctx.send(embed=embed, view=view)
+            edit_scheduler.remember(message, embed=embed, view=view)
 
         except Exception as e:
             await self.cog_command_error(ctx, e)
@@ -749,23 +970,26 @@ class AnimeCog(BaseCog):
         if not args:
             await ctx.send(embed=self.embed_creator.create_error_embed(
                 "Missing Arguments",
-                f"Usage: {PREFIX}update_status \"Title\" \"New Status\""
+                f"Usage: {ctx.clean_prefix}update_status \"Title\" \"New Status\""
             ))
             return
 
-        try:
-            parts = args.split('"')
-            parts = [p.strip() for p in parts if p.strip()]
-            
-            if len(parts) < 2:
-                await ctx.send(embed=self.embed_creator.create_error_embed(
-                    "Missing Arguments",
-                    f"Please provide all arguments in quotes: {PREFIX}update_status \"Title\" \"New Status\""
-                ))
-                return
+        parts = args.split('"')
+        parts = [p.strip() for p in parts if p.strip()]
+        
+        if len(parts) < 2:
+            await ctx.send(embed=self.embed_creator.create_error_embed(
+                "Missing Arguments",
+                f"Please provide all arguments in quotes: {ctx.clean_prefix}update_status \"Title\" \"New Status\""
+            ))
+            return
 
-            title, new_status = parts[:2]
+        title, new_status = parts[:2]
+        await self._update_status(ctx, title=title, new_status=new_status)
 
+    async def _update_status(self, ctx, title: str, new_status: str):
+        """Set a watchlist entry's status; shared by the prefix and slash commands"""
+        try:
             if new_status not in VALID_STATUSES:
                 await ctx.send(embed=self.embed_creator.create_error_embed(
                     "Invalid Status",
@@ -793,7 +1017,11 @@ class AnimeCog(BaseCog):
             
             # Fetch updated anime data
             updated_anime = await self.db.get_anime(ctx.author.id, title)
-            anime_data = await self.handle_api_response(ctx, title)
+            anime_data = await self.handle_api_response(
+                ctx,
+                title,
+                anilist_id=updated_anime.get("anilist_id")
+            )
             
             await ctx.send(embed=self.embed_creator.create_anime_details_embed(
                 anime_data,
@@ -812,7 +1040,7 @@ class AnimeCog(BaseCog):
         if not title:
             await ctx.send(embed=self.embed_creator.create_error_embed(
                 "Missing Title",
-                f"Usage: {PREFIX}toggle_favorite \"Title\""
+                f"Usage: {ctx.clean_prefix}toggle_favorite \"Title\""
             ))
             return
 
@@ -841,24 +1069,36 @@ class AnimeCog(BaseCog):
         """Search for an anime on AniList
         
         Usage: {prefix}search_anime "Title"
-        Shows detailed information about the anime
+        Shows detailed information about the anime, with a picker when
+        several AniList entries match
         """
         if not title:
             await ctx.send(embed=self.embed_creator.create_error_embed(
                 "Missing Title",
-                f"Usage: {PREFIX}search_anime \"Title\""
+                f"Usage: {ctx.clean_prefix}search_anime \"Title\""
             ))
             return
 
         try:
-            anime_data = await self.handle_api_response(ctx, title)
-            if anime_data:
-                # Check if anime is in watchlist
-                watchlist_data = await self.db.get_anime(ctx.author.id, anime_data["title"])
-                await ctx.send(embed=self.embed_creator.create_anime_details_embed(
-                    anime_data,
-                    watchlist_data
-                ))
+            candidates = await self.handle_search_response(ctx, title)
+            if not candidates:
+                return
+
+            if len(candidates) > 1:
+                view = CandidatePickerView(self, candidates, ctx.author.id, "search")
+                await ctx.send(
+                    f"Found **{len(candidates)}** matches for **{title}**. Pick one to view:",
+                    view=view
+                )
+                return
+
+            anime_data = candidates[0]
+            # Check if anime is in watchlist
+            watchlist_data = await self.db.get_anime(ctx.author.id, anime_data.title)
+            await ctx.send(embed=self.embed_creator.create_anime_details_embed(
+                anime_data,
+                watchlist_data
+            ))
 
         except Exception as e:
             await self.cog_command_error(ctx, e)
@@ -869,16 +1109,16 @@ class AnimeCog(BaseCog):
         
         Usage: {prefix}status "Title"
         Shows progress bars, status, and quick actions
-        Use reactions to perform actions:
+        Use the buttons to perform actions:
+        👀 ✅ 📝 - Change status
         🎬 - Update progress
-        📝 - Change status
         ⭐ - Toggle favorite
         ℹ️ - View details
         """
         if not title:
             await ctx.send(embed=self.embed_creator.create_error_embed(
                 "Missing Title",
-                f"Usage: {PREFIX}status \"Title\""
+                f"Usage: {ctx.clean_prefix}status \"Title\""
             ))
             return
 
@@ -892,144 +1132,18 @@ class AnimeCog(BaseCog):
                 ))
                 return
 
-            anime_data = await self.handle_api_response(ctx, title)
+            anime_data = await self.handle_api_response(
+                ctx,
+                title,
+                anilist_id=watchlist_data.get("anilist_id")
+            )
             if not anime_data:
                 return
 
-            # Create and send status embed
+            # Create and send status embed with its button controls
             embed = self.embed_creator.create_status_embed(anime_data, watchlist_data)
-            message = await ctx.send(embed=embed)
-
-            # Add reaction controls
-            reactions = ["🎬", "📝", "⭐", "ℹ️"]
-            for reaction in reactions:
-                await message.add_reaction(reaction)
-
-            def check(reaction, user):
-                return (
-                    user == ctx.author
-                    and str(reaction.emoji) in reactions
-                    and reaction.message.id == message.id
-                )
-
-            while True:
-                try:
-                    reaction, user = await self.bot.wait_for(
-                        "reaction_add",
-                        timeout=60.0,
-                        check=check
-                    )
-
-                    emoji = str(reaction.emoji)
-                    if emoji == "🎬":
-                        # Update progress
-                        await message.clear_reactions()
-                        await ctx.send(f"How many episodes have you watched? (Current: {watchlist_data['episodes_watched']}/{anime_data['episodes']})")
-                        
-                        def check_msg(m):
-                            return m.author == ctx.author and m.channel == ctx.channel and m.content.isdigit()
-                        
-                        try:
-                            msg = await self.bot.wait_for("message", timeout=30.0, check=check_msg)
-                            episodes = int(msg.content)
-                            
-                            if 0 <= episodes <= anime_data['episodes']:
-                                await self.db.update_anime(ctx.author.id, title, {"episodes_watched": episodes})
-                                # Update status if completed
-                                if episodes == anime_data['episodes']:
-                                    await self.db.update_anime(ctx.author.id, title, {
-                                        "status": "Completed",
-                                        "completion_date": datetime.now().strftime('%Y-%m-%d')
-                                    })
-                                # Update status if started watching
-                                elif episodes > 0 and watchlist_data['status'] == "To Watch":
-                                    await self.db.update_anime(ctx.author.id, title, {
-                                        "status": "Watching",
-                                        "start_date": datetime.now().strftime('%Y-%m-%d')
-                                    })
-                                
-                                # Refresh the status view
-                                watchlist_data = await self.db.get_anime(ctx.author.id, title)
-                                embed = self.embed_creator.create_status_embed(anime_data, watchlist_data)
-                                await message.edit(embed=embed)
-                                for reaction in reactions:
-                                    await message.add_reaction(reaction)
-                            else:
-                                await ctx.send("Invalid episode number!")
-                        except TimeoutError:
-                            await ctx.send("Progress update cancelled.")
-
-                    elif emoji == "📝":
-                        # Change status
-                        status_msg = await ctx.send(
-                            f"Current status: {watchlist_data['status']}\n"
-                            f"React to change status:\n"
-                            f"👀 - Watching\n"
-                            f"✅ - Completed\n"
-                            f"📝 - To Watch"
-                        )
-                        
-                        status_reactions = {"👀": "Watching", "✅": "Completed", "📝": "To Watch"}
-                        for react in status_reactions.keys():
-                            await status_msg.add_reaction(react)
-                            
-                        def check_status(r, u):
-                            return (
-                                u == ctx.author
-                                and str(r.emoji) in status_reactions
-                                and r.message.id == status_msg.id
-                            )
-                            
-                        try:
-                            reaction, user = await self.bot.wait_for(
-                                "reaction_add",
-                                timeout=30.0,
-                                check=check_status
-                            )
-                            
-                            new_status = status_reactions[str(reaction.emoji)]
-                            update_data = {"status": new_status}
-                            
-                            if new_status == "Watching" and not watchlist_data.get("start_date"):
-                                update_data["start_date"] = datetime.now().strftime('%Y-%m-%d')
-                            elif new_status == "Completed":
-                                update_data["completion_date"] = datetime.now().strftime('%Y-%m-%d')
-                                
-                            await self.db.update_anime(ctx.author.id, title, update_data)
-                            await status_msg.delete()
-                            
-                            # Refresh the status view
-                            watchlist_data = await self.db.get_anime(ctx.author.id, title)
-                            embed = self.embed_creator.create_status_embed(anime_data, watchlist_data)
-                            await message.edit(embed=embed)
-                        except TimeoutError:
-                            await status_msg.delete()
-                            await ctx.send("Status update cancelled.")
-
-                    elif emoji == "⭐":
-                        # Toggle favorite
-                        new_status = not watchlist_data["is_favorite"]
-                        await self.db.update_anime(ctx.author.id, title, {"is_favorite": new_status})
-                        
-                        # Refresh the status view
-                        watchlist_data = await self.db.get_anime(ctx.author.id, title)
-                        embed = self.embed_creator.create_status_embed(anime_data, watchlist_data)
-                        await message.edit(embed=embed)
-
-                    elif emoji == "ℹ️":
-                        # Show detailed view
-                        await message.clear_reactions()
-                        await ctx.send(embed=self.embed_creator.create_anime_details_embed(
-                            anime_data,
-                            watchlist_data
-                        ))
-                        break
-
-                    await message.remove_reaction(reaction, user)
-
-                except TimeoutError:
-                    await message.clear_reactions()
-                    break
+            view = AnimeControlPanel(self, anime_data, watchlist_data, ctx.author.id)
+            await ctx.send(embed=embed, view=view)
 
         except Exception as e:
             await self.cog_command_error(ctx, e)
@@ -1040,34 +1154,215 @@ class AnimeCog(BaseCog):
         
         Usage: {prefix}manage
         Shows dropdown menus to:
+        - Filter by status or first letter
+        - Page through large lists
         - Update anime status
         - Delete anime from list
         """
         try:
-            anime_list = await self.db.get_all_anime(ctx.author.id)
-            if not anime_list:
+            if not await self.db.count_anime(ctx.author.id):
                 await ctx.send(embed=self.embed_creator.create_error_embed(
                     "Empty Watchlist",
-                    f"Your watchlist is empty! Use {PREFIX}add_anime to add some anime."
+                    f"Your watchlist is empty! Use {ctx.clean_prefix}add_anime to add some anime."
                 ))
                 return
 
-            # Sort anime list
-            anime_list.sort(key=lambda x: (
-                not x.get('is_favorite', False),
-                {'Watching': 0, 'To Watch': 1, 'Completed': 2}.get(x.get('status', ''), 3),
-                x['title'].lower()
+            view = AnimeView(self, ctx.author.id)
+            await view.load_page()
+            await ctx.send(view.content(), view=view)
+
+        except Exception as e:
+            await self.cog_command_error(ctx, e)
+
+    async def _render_card(self, user_id: int, name: str) -> bytes:
+        """Render a user's Watching list to PNG in the card process pool"""
+        entries = await self.db.get_all_anime(user_id, {"status": "Watching"})
+        entries.sort(key=lambda entry: entry["title"].lower())
+        entries = entries[:CARD_MAX_ENTRIES]
+
+        async def cover(entry):
+            record = await self.anilist.fetch_anime_by_id(entry["anilist_id"]) if entry.get("anilist_id") else None
+            return await self._thumbnails.get(record.cover_image if record else None)
+
+        covers = await asyncio.gather(*(cover(entry) for entry in entries))
+        card_entries = [
+            {
+                "title": entry["title"],
+                "episodes_watched": entry.get("episodes_watched", 0),
+                "total_episodes": entry.get("total_episodes")
+            }
+            for entry in entries
+        ]
+
+        if self._card_pool is None:
+            # Spawn rather than fork: this process already runs threads (log listener,
+            # Mongo monitors, to_thread workers) whose locks a forked child could inherit held
+            self._card_pool = ProcessPoolExecutor(
+                max_workers=CARD_RENDER_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return await asyncio.get_running_loop().run_in_executor(
+            self._card_pool,
+            render_card,
+            f"{name} is watching",
+            card_entries,
+            list(covers)
+        )
+
+    @commands.command(name="card", help="Share your Watching list as an image")
+    async def card(self, ctx):
+        """Render the anime you're watching as a shareable image card
+        
+        Usage: {prefix}card
+        Shows cover art and a progress bar for each anime you're watching
+        """
+        if importlib.util.find_spec("PIL") is None:
+            await ctx.send(embed=self.embed_creator.create_error_embed(
+                "Unavailable",
+                "Watchlist cards need Pillow installed on the bot host."
             ))
+            return
 
-            view = AnimeView(self, anime_list, ctx.author.id)  # Pass user_id to AnimeView
-            await ctx.send(
-                "Select an anime to manage:",
-                view=view
+        try:
+            if not await self.db.count_anime(ctx.author.id, {"status": "Watching"}):
+                await ctx.send(embed=self.embed_creator.create_error_embed(
+                    "Nothing to Show",
+                    "You're not watching anything right now!"
+                ))
+                return
+
+            key = (ctx.author.id, await self.db.list_version(ctx.author.id))
+            png = self._cards.get(key)
+            if png is None:
+                async with ctx.typing():
+                    png = await self._render_card(ctx.author.id, ctx.author.display_name)
+                self._cards.set(key, png)
+
+            embed = self.embed_creator.create_success_embed(
+                f"📺 {ctx.author.display_name}'s Watchlist",
+                "Currently watching"
             )
+            embed.set_image(url="attachment://watchlist.png")
+            await ctx.send(embed=embed, file=discord.File(BytesIO(png), filename="watchlist.png"))
 
         except Exception as e:
             await self.cog_command_error(ctx, e)
 
+    # Slash commands share the prefix command implementations
+
+    async def _invoke_slash(
+        self,
+        interaction: Interaction,
+        command: commands.Command,
+        run: Optional[Callable[..., Awaitable[None]]] = None,
+        **kwargs
+    ) -> None:
+        """Run a prefix command for a slash command, with the same checks, hooks and error handling
+
+        ``run`` replaces the command's callback when the slash arguments map onto
+        a shared helper rather than the prefix command's own parsing. Every
+        command here waits on the database or AniList, so the interaction is
+        deferred first to stay inside Discord's acknowledgement window. The
+        tree already counts the interaction as in-flight work for draining.
+        """
+        ctx = await commands.Context.from_interaction(interaction)
+        ctx.command = command
+        await ctx.defer()
+        try:
+            if not await command.can_run(ctx):
+                raise commands.CheckFailure(f"The check functions for command {command.qualified_name} failed.")
+            await command.call_before_hooks(ctx)
+            try:
+                if run is None:
+                    await ctx.invoke(command, **kwargs)
+                else:
+                    await run(ctx, **kwargs)
+            except Exception:
+                ctx.command_failed = True
+                raise
+            finally:
+                await command.call_after_hooks(ctx)
+        except Exception as e:
+            if not isinstance(e, commands.CommandError):
+                e = commands.CommandInvokeError(e)
+            await command.dispatch_error(ctx, e)
+
+    async def _watchlist_title(self, user_id: int, value: str) -> str:
+        """Resolve an autocompleted entry id back to its full title; typed text passes through"""
+        if value.startswith(CHOICE_ID_PREFIX):
+            entry = await self.db.get_anime_by_id(user_id, value[len(CHOICE_ID_PREFIX):])
+            if entry:
+                return entry["title"]
+        return value
+
+    async def _catalog_title(self, value: str) -> str:
+        """Resolve an autocompleted AniList id back to its full title; typed text passes through"""
+        media_id = value[len(CHOICE_ID_PREFIX):]
+        if value.startswith(CHOICE_ID_PREFIX) and media_id.isdigit():
+            record = await self.anilist.fetch_anime_by_id(int(media_id))
+            if record:
+                return record.title
+        return value
+
+    async def watchlist_title_autocomplete(self, interaction: Interaction, current: str) -> List[app_commands.Choice[str]]:
+        """Complete titles from the user's watchlist trie"""
+        titles = await self.db.titles.complete(interaction.user.id, current, timeout=AUTOCOMPLETE_TIMEOUT)
+        return [
+            app_commands.Choice(name=title[:100], value=f"{CHOICE_ID_PREFIX}{entry_id}")
+            for title, entry_id in titles
+        ]
+
+    async def catalog_title_autocomplete(self, interaction: Interaction, current: str) -> List[app_commands.Choice[str]]:
+        """Complete titles from the offline catalog, if one has been built"""
+        if not current or not self.anilist.catalog:
+            return []
+        records = self.anilist.catalog.search(current, limit=25)
+        return [
+            app_commands.Choice(name=record["title"][:100], value=f"{CHOICE_ID_PREFIX}{record['id']}")
+            for record in records
+        ]
+
+    @app_commands.command(name="add", description="Add an anime to your watchlist")
+    @app_commands.describe(title="Anime title to search for")
+    @app_commands.autocomplete(title=catalog_title_autocomplete)
+    async def add_slash(self, interaction: Interaction, title: str):
+        await self._invoke_slash(interaction, self.add_anime, title=await self._catalog_title(title))
+
+    @app_commands.command(name="status", description="Show detailed status of an anime")
+    @app_commands.describe(title="Anime in your watchlist")
+    @app_commands.autocomplete(title=watchlist_title_autocomplete)
+    async def status_slash(self, interaction: Interaction, title: str):
+        title = await self._watchlist_title(interaction.user.id, title)
+        await self._invoke_slash(interaction, self.status, title=title)
+
+    @app_commands.command(name="update_status", description="Update the status of an anime")
+    @app_commands.describe(title="Anime in your watchlist", status="New status")
+    @app_commands.autocomplete(title=watchlist_title_autocomplete)
+    @app_commands.choices(status=[app_commands.Choice(name=status, value=status) for status in VALID_STATUSES])
+    async def update_status_slash(self, interaction: Interaction, title: str, status: app_commands.Choice[str]):
+        title = await self._watchlist_title(interaction.user.id, title)
+        await self._invoke_slash(
+            interaction,
+            self.update_status,
+            run=self._update_status,
+            title=title,
+            new_status=status.value
+        )
+
+    @app_commands.command(name="delete", description="Delete an anime from your watchlist")
+    @app_commands.describe(title="Anime in your watchlist")
+    @app_commands.autocomplete(title=watchlist_title_autocomplete)
+    async def delete_slash(self, interaction: Interaction, title: str):
+        title = await self._watchlist_title(interaction.user.id, title)
+        await self._invoke_slash(interaction, self.delete_anime, title=title)
+
+    @app_commands.command(name="fav", description="Toggle favorite status of an anime")
+    @app_commands.describe(title="Anime in your watchlist")
+    @app_commands.autocomplete(title=watchlist_title_autocomplete)
+    async def fav_slash(self, interaction: Interaction, title: str):
+        title = await self._watchlist_title(interaction.user.id, title)
+        await self._invoke_slash(interaction, self.toggle_favorite, title=title)
+
 async def setup(bot):
     await bot.add_cog(AnimeCog(bot))
     return True 
\ No newline at end of file
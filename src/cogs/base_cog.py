@@ -2,26 +2,47 @@ from discord.ext import commands
 from utils.database import DatabaseManager
 from utils.anilist import AniListAPI
 from utils.embed_creator import EmbedCreator
+from utils.media import MediaRecord
 from utils.logger import log_command, log_error
-from typing import Optional, Any
+from utils.interactions import respond
+from utils.sessions import sessions
+from utils.metrics import registry
+from utils.drain import BotDraining
+from utils.cluster import PartialDeployment
+from discord import Interaction
+from typing import Optional, Any, List, Union
 import traceback
+import asyncio
+import time
+
+command_duration_seconds = registry.histogram(
+    "command_duration_seconds",
+    "Time from invoking a prefix command to it finishing",
+    labelnames=("command", "status")
+)
+commands_total = registry.counter(
+    "commands_total",
+    "Prefix commands invoked",
+    labelnames=("command", "status")
+)
 
 class BaseCog(commands.Cog):
     """Base cog class with common functionality"""
     
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.db = DatabaseManager()
-        self.anilist = AniListAPI()
+        # Connections are owned by the bot so reloading a cog keeps them warm
+        self.db: DatabaseManager = bot.db
+        self.anilist: AniListAPI = bot.anilist
         self.embed_creator = EmbedCreator()
         
     async def cog_unload(self) -> None:
-        """Clean up resources when cog is unloaded"""
-        await self.anilist.close()
-        self.db.close()
+        """Release cog-owned resources; shared connections stay open until the bot closes"""
+        pass
     
     async def cog_before_invoke(self, ctx: commands.Context) -> None:
         """Log command usage before execution"""
+        ctx.invoked_at = time.perf_counter()
         log_command(
             ctx.command.name,
             ctx.author.id,
@@ -29,11 +50,27 @@ class BaseCog(commands.Cog):
         )
     
     async def cog_after_invoke(self, ctx: commands.Context) -> None:
-        """Handle any cleanup after command execution"""
-        pass
+        """Record command latency and outcome"""
+        started = getattr(ctx, "invoked_at", None)
+        status = "error" if ctx.command_failed else "ok"
+        commands_total.inc(command=ctx.command.qualified_name, status=status)
+        if started is not None:
+            command_duration_seconds.observe(
+                time.perf_counter() - started,
+                command=ctx.command.qualified_name,
+                status=status
+            )
     
+    @staticmethod
+    def _mark_failed(target: Union[commands.Context, Interaction]) -> None:
+        """Record a handled error so the command's metrics report it as failed"""
+        if isinstance(target, commands.Context):
+            target.command_failed = True
+
     async def cog_command_error(self, ctx: commands.Context, error: Exception) -> None:
         """Handle command errors"""
+        # Commands that catch their own exceptions report them here too
+        self._mark_failed(ctx)
         if isinstance(error, commands.MissingPermissions):
             await ctx.send(
                 embed=self.embed_creator.create_error_embed(
@@ -48,6 +85,8 @@ class BaseCog(commands.Cog):
                     f"Required argument missing: {error.param.name}"
                 )
             )
+        elif isinstance(error, (BotDraining, PartialDeployment)):
+            return  # Answered by the bot's global error handler
         elif isinstance(error, commands.BadArgument):
             await ctx.send(
                 embed=self.embed_creator.create_error_embed(
@@ -64,17 +103,33 @@ class BaseCog(commands.Cog):
                 )
             )
             
+    async def _send(self, target: Union[commands.Context, Interaction], **kwargs: Any) -> None:
+        """Reply through a command context or, from a view callback, an interaction"""
+        if isinstance(target, Interaction):
+            await respond(target, ephemeral=True, **kwargs)
+        else:
+            await target.send(**kwargs)
+
     async def handle_api_response(
         self,
         ctx: commands.Context,
         title: str,
-        success_message: Optional[str] = None
-    ) -> Optional[Any]:
-        """Handle AniList API response with error handling"""
+        success_message: Optional[str] = None,
+        anilist_id: Optional[int] = None
+    ) -> Optional[MediaRecord]:
+        """Handle AniList API response with error handling
+        
+        Tracked entries should pass their stored ``anilist_id`` so the exact
+        show is fetched instead of re-running a fuzzy title search.
+        """
         try:
-            anime_data = await self.anilist.fetch_anime_details(title)
+            if anilist_id:
+                anime_data = await self.anilist.fetch_anime_by_id(anilist_id)
+            else:
+                anime_data = await self.anilist.fetch_anime_details(title)
             if not anime_data:
-                await ctx.send(
+                await self._send(
+                    ctx,
                     embed=self.embed_creator.create_error_embed(
                         "Not Found",
                         f"Could not find anime with title **{title}** on AniList."
@@ -83,18 +138,21 @@ class BaseCog(commands.Cog):
                 return None
                 
             if success_message:
-                await ctx.send(
+                await self._send(
+                    ctx,
                     embed=self.embed_creator.create_success_embed(
                         "Success",
                         success_message
                     )
                 )
             
-            return self.anilist.format_anime_data(anime_data)
+            return anime_data
             
         except Exception as e:
             log_error(e)
-            await ctx.send(
+            self._mark_failed(ctx)
+            await self._send(
+                ctx,
                 embed=self.embed_creator.create_error_embed(
                     "API Error",
                     "An error occurred while fetching anime details."
@@ -102,6 +160,48 @@ class BaseCog(commands.Cog):
             )
             return None
             
+    async def handle_search_response(
+        self,
+        ctx: commands.Context,
+        title: str
+    ) -> Optional[List[MediaRecord]]:
+        """Fetch AniList candidates for a title with error handling
+        
+        Titles found in the offline catalog resolve to a single id lookup,
+        which is usually already cached, instead of a live search.
+        """
+        try:
+            media_id = self.anilist.resolve_title(title)
+            if media_id:
+                record = await self.anilist.fetch_anime_by_id(media_id)
+                if record:
+                    return [record]
+            
+            candidates = await self.anilist.search_anime(title)
+            if not candidates:
+                await self._send(
+                    ctx,
+                    embed=self.embed_creator.create_error_embed(
+                        "Not Found",
+                        f"Could not find anime with title **{title}** on AniList."
+                    )
+                )
+                return None
+            
+            return candidates
+            
+        except Exception as e:
+            log_error(e)
+            self._mark_failed(ctx)
+            await self._send(
+                ctx,
+                embed=self.embed_creator.create_error_embed(
+                    "API Error",
+                    "An error occurred while searching AniList."
+                )
+            )
+            return None
+            
     async def confirm_action(
         self,
         ctx: commands.Context,
@@ -124,12 +224,22 @@ class BaseCog(commands.Cog):
                 and reaction.message.id == message.id
             )
         
+        # Tracked as a session so a newer one can supersede a forgotten prompt
+        waiter = asyncio.ensure_future(self.bot.wait_for(
+            "reaction_add",
+            timeout=timeout,
+            check=check
+        ))
+        sessions.open(ctx.author.id, waiter)
         try:
-            reaction, _ = await self.bot.wait_for(
-                "reaction_add",
-                timeout=timeout,
-                check=check
-            )
+            await asyncio.wait({waiter})
+        finally:
+            waiter.cancel()
+        
+        if waiter.cancelled():
+            return False
+        try:
+            reaction, _ = waiter.result()
             return str(reaction.emoji) == "✅"
         except TimeoutError:
             await ctx.send(
@@ -138,4 +248,4 @@ class BaseCog(commands.Cog):
                     "Confirmation timed out."
                 )
             )
-            return False 
\ No newline at end of file
+            return False
\ No newline at end of file
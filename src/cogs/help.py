@@ -1,50 +1,55 @@
 from discord.ext import commands
 from discord import Embed
-from config.config import OWNER_IDS, PREFIX
+from config.config import OWNER_IDS
+from typing import Dict, List, Tuple
+from utils.text import EMBED_FIELD_VALUE_LIMIT, chunk_lines
+
+def _add_command_fields(embed: Embed, name: str, prefix: str, command_list: List[commands.Command]) -> None:
+    """Add a command list, split over as many fields as Discord's field size limit needs"""
+    lines = [f"`{prefix}{cmd.name}` - {cmd.help}" for cmd in command_list]
+    for index, value in enumerate(chunk_lines(lines, EMBED_FIELD_VALUE_LIMIT)):
+        embed.add_field(name=name if index == 0 else f"{name} (cont.)", value=value, inline=False)
+
+def build_bot_help_embed(bot: commands.Bot, prefix: str, is_owner: bool) -> Embed:
+    """Build the command overview embed for one permission tier"""
+    embed = Embed(title="📚 Available Commands", color=0x3498db)
+    
+    anime_commands = []
+    owner_commands = []
+    
+    for cmd in bot.commands:
+        if not cmd.hidden:
+            if cmd.cog_name == "OwnerCog":
+                if is_owner:
+                    owner_commands.append(cmd)
+            elif cmd.cog_name != "HelpCog":
+                anime_commands.append(cmd)
+    
+    # Add anime commands
+    if anime_commands:
+        _add_command_fields(embed, "🎌 Anime Commands", prefix, anime_commands)
+    
+    # Add owner commands only for owners
+    if owner_commands and is_owner:
+        _add_command_fields(embed, "⚙️ Owner Commands", prefix, owner_commands)
+    
+    embed.set_footer(text=f"Type {prefix}help <command> for more info on a command.")
+    return embed
 
 class CustomHelpCommand(commands.HelpCommand):
     """Custom help command implementation"""
     
+    def _prefix(self) -> str:
+        guild = self.context.guild
+        return self.context.bot.prefixes.for_guild(guild.id if guild else None)
+
     def get_command_signature(self, command):
-        return f'{PREFIX}{command.qualified_name} {command.signature}'
+        return f'{self._prefix()}{command.qualified_name} {command.signature}'
 
     async def send_bot_help(self, mapping):
-        embed = Embed(title="📚 Available Commands", color=0x3498db)
-        
-        # Check if user is owner
+        # Served from the embeds HelpCog prebuilds per tier and prefix
         is_owner = self.context.author.id in OWNER_IDS
-        
-        anime_commands = []
-        owner_commands = []
-        
-        for cog, commands in mapping.items():
-            for cmd in commands:
-                if not cmd.hidden:
-                    if cmd.cog_name == "OwnerCog":
-                        if is_owner:
-                            owner_commands.append(cmd)
-                    elif cmd.cog_name != "HelpCog":
-                        anime_commands.append(cmd)
-        
-        # Add anime commands
-        if anime_commands:
-            command_list = [f"`{PREFIX}{cmd.name}` - {cmd.help}" for cmd in anime_commands]
-            embed.add_field(
-                name="🎌 Anime Commands",
-                value="\n".join(command_list),
-                inline=False
-            )
-        
-        # Add owner commands only for owners
-        if owner_commands and is_owner:
-            command_list = [f"`{PREFIX}{cmd.name}` - {cmd.help}" for cmd in owner_commands]
-            embed.add_field(
-                name="⚙️ Owner Commands",
-                value="\n".join(command_list),
-                inline=False
-            )
-        
-        embed.set_footer(text=f"Type {PREFIX}help <command> for more info on a command.")
+        embed = self.cog.get_bot_help(is_owner, self._prefix())
         await self.get_destination().send(embed=embed)
 
     async def send_command_help(self, command):
@@ -112,13 +117,39 @@ class CustomHelpCommand(commands.HelpCommand):
 
 class HelpCog(commands.Cog):
     def __init__(self, bot):
+        self.bot = bot
         self._original_help_command = bot.help_command
+        # Overview embeds keyed by (is_owner, prefix); rebuilt when commands or the prefix change
+        self._bot_help: Dict[Tuple[bool, str], Embed] = {}
         bot.help_command = CustomHelpCommand()
         bot.help_command.cog = self
         
     def cog_unload(self):
         self.bot.help_command = self._original_help_command
 
+    def rebuild_help(self) -> None:
+        """Drop cached overview embeds and prebuild both tiers for the default prefix"""
+        prefix = self.bot.default_prefix
+        self._bot_help = {
+            (is_owner, prefix): build_bot_help_embed(self.bot, prefix, is_owner)
+            for is_owner in (False, True)
+        }
+
+    def get_bot_help(self, is_owner: bool, prefix: str) -> Embed:
+        """Return the overview embed for a tier and prefix, building it on first use"""
+        key = (is_owner, prefix)
+        embed = self._bot_help.get(key)
+        if embed is None:
+            embed = self._bot_help[key] = build_bot_help_embed(self.bot, prefix, is_owner)
+        return embed
+
+    async def cog_load(self) -> None:
+        self.rebuild_help()
+
+    @commands.Cog.listener()
+    async def on_commands_changed(self):
+        self.rebuild_help()
+
 async def setup(bot):
     await bot.add_cog(HelpCog(bot))
     return True 
\ No newline at end of file
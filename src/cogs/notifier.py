@@ -0,0 +1,52 @@
+from discord.ext import commands
+from .base_cog import BaseCog
+from utils.notifier import AiringNotifier
+from config.config import NOTIFIER_REFRESH_INTERVAL
+
+class NotifierCog(BaseCog):
+    """New-episode notifications for anime you're watching"""
+
+    def __init__(self, bot: commands.Bot):
+        super().__init__(bot)
+        self.notifier = AiringNotifier(bot, self.db, self.anilist, self.embed_creator)
+
+    async def cog_load(self) -> None:
+        """Start the airing notifier when the cog loads"""
+        # One notifier for the whole deployment, or every cluster would DM each user
+        if getattr(self.bot, "cluster_id", 0) == 0:
+            self.notifier.start()
+
+    async def cog_unload(self) -> None:
+        """Stop the airing notifier"""
+        await self.notifier.stop()
+        await super().cog_unload()
+
+    @commands.command(name="notify", aliases=["notifications"], help="Toggle new-episode DMs for anime you're watching")
+    async def notify(self, ctx):
+        """Toggle direct messages when a new episode of an anime you're watching airs
+        
+        Usage: {prefix}notify
+        """
+        try:
+            enabled = not await self.db.get_airing_notifications(ctx.author.id)
+            await self.db.set_airing_notifications(ctx.author.id, enabled)
+            
+            message = f"New-episode notifications are now **{'ON' if enabled else 'OFF'}**."
+            if self.notifier.running:
+                media_ids = await self.db.get_watching_media_ids(ctx.author.id) if enabled else []
+                self.notifier.update_user(ctx.author.id, enabled, media_ids)
+            elif enabled:
+                # The notifier runs on cluster 0 and picks this up at its next refresh;
+                # turning notifications off applies right away everywhere
+                message += f"\nThey start within {NOTIFIER_REFRESH_INTERVAL // 60} minutes."
+            
+            await ctx.send(embed=self.embed_creator.create_success_embed(
+                "Notifications Updated",
+                message
+            ))
+        except Exception as e:
+            await self.cog_command_error(ctx, e)
+
+async def setup(bot):
+    await bot.add_cog(NotifierCog(bot))
+    return True
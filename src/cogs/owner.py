@@ -1,15 +1,46 @@
 from discord.ext import commands
-from .base_cog import BaseCog
-from config.config import OWNER_IDS
+from .base_cog import BaseCog, command_duration_seconds
+from config.config import (
+    OWNER_IDS, CATALOG_PATH, GUILD_INVITE_CONCURRENCY, GUILD_INVITE_CACHE_TTL, GUILD_INVITE_FAILURE_TTL, GUILD_INVITES_PER_PAGE,
+    MODERATION_CONCURRENCY, CLUSTER_HEALTH_STALE_AFTER
+)
+from utils.catalog import build_catalog, iter_jsonl_records
+from utils.sessions import sessions
+from utils.broadcast import BroadcastEngine
+from utils.drain import drain
+from utils.metrics import registry
+from utils.cache import TTLCache
+from utils.text import EMBED_FIELD_VALUE_LIMIT, truncate
+from utils.concurrency import bounded_gather
+from utils.paginator import register_page_source, render_page
+from utils.cluster import whole_deployment
 import discord
-from typing import Optional
-import sys
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
 import os
-from pathlib import Path
+
+extension_reload_seconds = registry.histogram(
+    "extension_reload_seconds",
+    "Time taken to reload an extension",
+    labelnames=("extension",)
+)
 
 class OwnerCog(BaseCog):
     """Owner-only commands for bot management"""
 
+    def __init__(self, bot: commands.Bot):
+        super().__init__(bot)
+        self.broadcaster = BroadcastEngine(bot)
+        # guild_id -> invite lookup result
+        self._invites = TTLCache(ttl=GUILD_INVITE_CACHE_TTL, maxsize=10000)
+        # owner id -> sorted results of their latest guildinvites, paged without new lookups
+        self._invite_snapshots = TTLCache(ttl=GUILD_INVITE_CACHE_TTL, maxsize=len(OWNER_IDS) or 1)
+
+    async def cog_load(self) -> None:
+        """Register the invites page source with the shared paginator"""
+        register_page_source("invites", self.render_invites_page)
+
     async def cog_check(self, ctx: commands.Context) -> bool:
         """Check if the user is a bot owner"""
         return ctx.author.id in OWNER_IDS
@@ -17,15 +48,18 @@ class OwnerCog(BaseCog):
     @commands.command(name="shutdown", aliases=["sd"], help="Shutdown the bot (Owner only)")
     async def shutdown(self, ctx):
         """Safely shuts down the bot"""
-        await ctx.send("⚠️ Shutting down bot...")
-        await self.bot.close()
+        await ctx.send(f"⚠️ Shutting down bot after {drain.inflight - 1} running command(s) finish...")
+        self.bot.request_shutdown()
 
     @commands.command(name="reload", aliases=["rl"], help="Reload a cog (Owner only)")
     async def reload(self, ctx, cog: str):
         """Reload a specific cog"""
         try:
+            started = time.perf_counter()
             await self.bot.reload_extension(f"src.cogs.{cog}")
-            await ctx.send(f"✅ Successfully reloaded `{cog}` cog!")
+            elapsed = time.perf_counter() - started
+            extension_reload_seconds.observe(elapsed, extension=cog)
+            await ctx.send(f"✅ Successfully reloaded `{cog}` cog in {elapsed * 1000:.0f}ms!")
         except Exception as e:
             await ctx.send(f"❌ Error reloading `{cog}` cog: {str(e)}")
 
@@ -47,6 +81,15 @@ class OwnerCog(BaseCog):
         except Exception as e:
             await ctx.send(f"❌ Error unloading `{cog}` cog: {str(e)}")
 
+    @commands.command(name="sync", help="Sync slash commands with Discord (Owner only)")
+    async def sync(self, ctx):
+        """Register the bot's slash commands with Discord"""
+        try:
+            synced = await self.bot.tree.sync()
+            await ctx.send(f"✅ Synced **{len(synced)}** slash commands!")
+        except Exception as e:
+            await ctx.send(f"❌ Error syncing slash commands: {str(e)}")
+
     @commands.command(name="setstatus", aliases=["ss"], help="Change bot status (Owner only)")
     async def setstatus(self, ctx, *, status: str):
         """Change the bot's status message"""
@@ -57,29 +100,64 @@ class OwnerCog(BaseCog):
             await ctx.send(f"❌ Error changing status: {str(e)}")
 
     @commands.command(name="broadcast", aliases=["dc"], help="Send a message to all servers (Owner only)")
+    @whole_deployment()
     async def broadcast(self, ctx, *, message: str):
         """Broadcast a message to all servers the bot is in"""
+        if self.broadcaster.running:
+            await ctx.send("❌ A broadcast is already running.")
+            return
+        if self.broadcaster.load_checkpoint():
+            await ctx.send(
+                "❌ An interrupted broadcast was found. Use `broadcastresume` to finish it "
+                "or `broadcastresume discard` to drop it."
+            )
+            return
+        
         try:
-            for guild in self.bot.guilds:
-                try:
-                    # Try to find a suitable channel to send the message
-                    channel = next((ch for ch in guild.text_channels if ch.permissions_for(guild.me).send_messages), None)
-                    if channel:
-                        embed = discord.Embed(
-                            title="📢 Bot Announcement",
-                            description=message,
-                            color=discord.Color.blue()
-                        )
-                        embed.set_footer(text=f"From: {ctx.author}")
-                        await channel.send(embed=embed)
-                except Exception as e:
-                    await ctx.send(f"❌ Failed to send to {guild.name}: {str(e)}")
-            
-            await ctx.send("✅ Broadcast complete!")
+            progress = await ctx.send("📢 Starting broadcast...")
+            await self.broadcaster.start(message, str(ctx.author), progress)
         except Exception as e:
             await ctx.send(f"❌ Error broadcasting message: {str(e)}")
 
+    @commands.command(name="broadcastresume", aliases=["dcr"], help="Resume or discard an interrupted broadcast (Owner only)")
+    @whole_deployment()
+    async def broadcastresume(self, ctx, action: Optional[str] = None):
+        """Resume the broadcast recorded in the checkpoint file
+        
+        Usage: {prefix}broadcastresume [discard]
+        """
+        if self.broadcaster.running:
+            await ctx.send("❌ A broadcast is already running.")
+            return
+        state = self.broadcaster.load_checkpoint()
+        if not state:
+            await ctx.send("❌ There is no interrupted broadcast.")
+            return
+        if action == "discard":
+            self.broadcaster.discard_checkpoint()
+            await ctx.send("✅ Discarded the interrupted broadcast.")
+            return
+        
+        try:
+            progress = await ctx.send(f"📢 Resuming broadcast ({len(state['done'])} servers already sent)...")
+            await self.broadcaster.run(state, progress)
+        except Exception as e:
+            await ctx.send(f"❌ Error resuming broadcast: {str(e)}")
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        self.broadcaster.invalidate(channel.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before, after):
+        self.broadcaster.invalidate(after.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild):
+        self.broadcaster.invalidate(guild.id)
+
     @commands.command(name="serverlist", aliases=["sl"], help="List all servers (Owner only)")
+    @whole_deployment()
     async def serverlist(self, ctx):
         """Show list of servers the bot is in"""
         embed = discord.Embed(
@@ -113,6 +191,11 @@ class OwnerCog(BaseCog):
         new_mode = not current_mode if mode is None else mode
         
         self.bot.maintenance_mode = new_mode
+        # Maintenance drains: new commands from non-owners are rejected up front
+        if new_mode:
+            drain.start()
+        else:
+            drain.stop()
         status = discord.Status.dnd if new_mode else discord.Status.online
         
         await self.bot.change_presence(
@@ -130,12 +213,43 @@ class OwnerCog(BaseCog):
             color=discord.Color.blue()
         )
         
+        # Cluster health, as reported by every process into Mongo
+        try:
+            reports = await self.db.get_cluster_health()
+        except Exception:
+            reports = []
+        now = time.time()
+        live = [report for report in reports if now - report["updated_at"] <= CLUSTER_HEALTH_STALE_AFTER]
+        
         # General stats
-        total_users = sum(guild.member_count for guild in self.bot.guilds)
-        embed.add_field(name="Servers", value=str(len(self.bot.guilds)), inline=True)
+        if live:
+            total_guilds = sum(report["guilds"] for report in live)
+            total_users = sum(report["users"] for report in live)
+        else:
+            total_guilds = len(self.bot.guilds)
+            total_users = sum(guild.member_count for guild in self.bot.guilds)
+        embed.add_field(name="Servers", value=str(total_guilds), inline=True)
         embed.add_field(name="Users", value=str(total_users), inline=True)
         embed.add_field(name="Latency", value=f"{round(self.bot.latency * 1000)}ms", inline=True)
         
+        # Per-shard latency and health
+        shard_lines = []
+        for report in reports:
+            stale = now - report["updated_at"] > CLUSTER_HEALTH_STALE_AFTER
+            shards = ", ".join(
+                f"#{shard['shard_id']} "
+                + ("❌" if shard["closed"] else f"{shard['latency_ms']}ms" if shard["latency_ms"] is not None else "…")
+                for shard in report["shards"]
+            )
+            status = f"⚠️ no report for {now - report['updated_at']:.0f}s" if stale else shards
+            shard_lines.append(f"**Cluster {report['cluster_id']}** ({report['guilds']} servers): {status}")
+        if shard_lines:
+            embed.add_field(
+                name=f"Shards ({self.bot.shard_count} total)",
+                value=truncate("\n".join(shard_lines), EMBED_FIELD_VALUE_LIMIT),
+                inline=False
+            )
+        
         # Database stats
         try:
             total_anime = len(await self.db.get_all_anime(None))  # Get all anime across all users
@@ -143,110 +257,112 @@ class OwnerCog(BaseCog):
         except Exception:
             embed.add_field(name="Total Anime Entries", value="Error fetching", inline=True)
         
+        # Command latency
+        quantiles = [command_duration_seconds.quantile(q) for q in (0.5, 0.95, 0.99)]
+        if quantiles[0] is None:
+            latency = "No commands yet"
+        else:
+            latency = " / ".join(f"{value * 1000:.0f}ms" for value in quantiles)
+        embed.add_field(name="Command Latency (p50/p95/p99)", value=latency, inline=False)
+        
+        # Interactive sessions
+        session_bytes = sessions.measure()
+        embed.add_field(
+            name="Open Sessions",
+            value=f"{len(sessions)} (~{session_bytes / 1024:.1f} KB)",
+            inline=True
+        )
+        
         await ctx.send(embed=embed)
 
-    @commands.command(name="setprefix", aliases=["p"], help="Change the bot's command prefix (Owner only)")
+    @commands.command(name="setprefix", aliases=["p"], help="Change this server's command prefix (Owner only)")
+    @commands.guild_only()
     async def setprefix(self, ctx, new_prefix: str):
-        """Change the bot's command prefix
+        """Change the command prefix used in this server
         
         Usage: {prefix}setprefix <new_prefix>
         Example: {prefix}setprefix !
+        Setting the default prefix again removes the override.
         """
         try:
-            # Update the prefix in the config first
-            import os
-            from pathlib import Path
+            # Persist per guild, then update the in-memory map get_prefix reads
+            stored = None if new_prefix == self.bot.default_prefix else new_prefix
+            await self.db.set_guild_prefix(ctx.guild.id, stored)
+            self.bot.prefixes.set(ctx.guild.id, stored)
             
-            # Update the .env file
-            env_path = Path(__file__).parent.parent.parent / '.env'
-            
-            # Read current .env content
-            if env_path.exists():
-                with open(env_path, 'r') as f:
-                    lines = f.readlines()
-            else:
-                lines = []
-            
-            # Find and update PREFIX line, or add it if not found
-            prefix_updated = False
-            for i, line in enumerate(lines):
-                if line.startswith('PREFIX='):
-                    lines[i] = f'PREFIX={new_prefix}\n'
-                    prefix_updated = True
-                    break
-            
-            if not prefix_updated:
-                lines.append(f'PREFIX={new_prefix}\n')
-            
-            # Write back to .env
-            with open(env_path, 'w') as f:
-                f.writelines(lines)
-            
-            # Update the prefix in memory
-            import sys
-            sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-            global PREFIX
-            from src.config.config import PREFIX
-            PREFIX = new_prefix
-            
-            # Create a new prefix getter function
-            async def new_prefix_getter(bot, message):
-                prefixes = [new_prefix]
-                prefixes.extend([f'<@!{bot.user.id}> ', f'<@{bot.user.id}> '])
-                if message.author.id in OWNER_IDS:
-                    prefixes.append('?')
-                return prefixes
-            
-            # Update the bot's command prefix
-            self.bot.command_prefix = new_prefix_getter
-            
-            # Update bot's status to show new prefix
-            await self.bot.change_presence(
-                activity=discord.Game(name=f"AniTrack | {new_prefix}help")
-            )
-            
-            # Force update help command
-            self.bot.help_command.context = ctx
-            
-            await ctx.send(f"✅ Command prefix updated to: `{new_prefix}`")
+            await ctx.send(f"✅ Command prefix for this server updated to: `{new_prefix}`")
             
         except Exception as e:
             await ctx.send(f"❌ Error changing prefix: {str(e)}")
             raise e  # Re-raise to see the full error in logs
 
+    async def _mutual_members(self, user_id: int) -> List[discord.Member]:
+        """Resolve a user's membership in every guild, from the member cache where possible
+
+        Only guilds that have not finished chunking fall back to an HTTP lookup.
+        """
+        members = []
+        unchunked = []
+        for guild in self.bot.guilds:
+            member = guild.get_member(user_id)
+            if member is not None:
+                members.append(member)
+            elif not guild.chunked:
+                unchunked.append(guild)
+        
+        async def fetch(guild: discord.Guild) -> Optional[discord.Member]:
+            try:
+                return await guild.fetch_member(user_id)
+            except discord.NotFound:
+                return None
+        
+        fetched = await bounded_gather((fetch(guild) for guild in unchunked), MODERATION_CONCURRENCY, return_exceptions=True)
+        members.extend(member for member in fetched if isinstance(member, discord.Member))
+        return members
+
+    async def _apply_across(self, targets, action) -> Tuple[int, int]:
+        """Run ``action`` on every target concurrently, returning (success, failure) counts
+
+        Actions return False when there was nothing to do for that target.
+        """
+        results = await bounded_gather((action(target) for target in targets), MODERATION_CONCURRENCY, return_exceptions=True)
+        success_count = sum(1 for result in results if result is True)
+        fail_count = sum(1 for result in results if isinstance(result, Exception))
+        return success_count, fail_count
+
+    async def _muted_role(self, guild: discord.Guild) -> discord.Role:
+        """Find or create the guild's muted role"""
+        muted_role = discord.utils.get(guild.roles, name="Muted")
+        if not muted_role:
+            # Create muted role with no permissions
+            permissions = discord.Permissions()
+            permissions.update(send_messages=False, speak=False)
+            muted_role = await guild.create_role(name="Muted", permissions=permissions)
+            
+            # Update channel permissions for muted role
+            await bounded_gather(
+                (channel.set_permissions(muted_role, send_messages=False, speak=False) for channel in guild.channels),
+                MODERATION_CONCURRENCY,
+                return_exceptions=True
+            )
+        return muted_role
+
     @commands.command(name="servermute", aliases=["sm"], help="Mute a user across all servers (Owner only)")
+    @whole_deployment()
     async def servermute(self, ctx, user_id: int, *, reason: str = "No reason provided"):
         """Mute a user in all mutual servers"""
         try:
-            user = await self.bot.fetch_user(user_id)
+            user = self.bot.get_user(user_id) or await self.bot.fetch_user(user_id)
             if not user:
                 await ctx.send("❌ User not found!")
                 return
 
-            success_count = 0
-            fail_count = 0
-            
-            for guild in self.bot.guilds:
-                try:
-                    member = await guild.fetch_member(user_id)
-                    if member:
-                        # Find or create muted role
-                        muted_role = discord.utils.get(guild.roles, name="Muted")
-                        if not muted_role:
-                            # Create muted role with no permissions
-                            permissions = discord.Permissions()
-                            permissions.update(send_messages=False, speak=False)
-                            muted_role = await guild.create_role(name="Muted", permissions=permissions)
-                            
-                            # Update channel permissions for muted role
-                            for channel in guild.channels:
-                                await channel.set_permissions(muted_role, send_messages=False, speak=False)
-                        
-                        await member.add_roles(muted_role, reason=reason)
-                        success_count += 1
-                except Exception as e:
-                    fail_count += 1
-                    continue
+            async def mute(member: discord.Member) -> bool:
+                muted_role = await self._muted_role(member.guild)
+                await member.add_roles(muted_role, reason=reason)
+                return True
+
+            success_count, fail_count = await self._apply_across(await self._mutual_members(user_id), mute)
 
             embed = discord.Embed(
                 title="🔇 Server Mute Results",
@@ -262,28 +378,23 @@ class OwnerCog(BaseCog):
             await ctx.send(f"❌ Error: {str(e)}")
 
     @commands.command(name="serverunmute", aliases=["sum"], help="Unmute a user across all servers (Owner only)")
+    @whole_deployment()
     async def serverunmute(self, ctx, user_id: int, *, reason: str = "No reason provided"):
         """Unmute a user in all mutual servers"""
         try:
-            user = await self.bot.fetch_user(user_id)
+            user = self.bot.get_user(user_id) or await self.bot.fetch_user(user_id)
             if not user:
                 await ctx.send("❌ User not found!")
                 return
 
-            success_count = 0
-            fail_count = 0
-            
-            for guild in self.bot.guilds:
-                try:
-                    member = await guild.fetch_member(user_id)
-                    if member:
-                        muted_role = discord.utils.get(guild.roles, name="Muted")
-                        if muted_role and muted_role in member.roles:
-                            await member.remove_roles(muted_role, reason=reason)
-                            success_count += 1
-                except Exception as e:
-                    fail_count += 1
-                    continue
+            async def unmute(member: discord.Member) -> bool:
+                muted_role = discord.utils.get(member.guild.roles, name="Muted")
+                if muted_role and muted_role in member.roles:
+                    await member.remove_roles(muted_role, reason=reason)
+                    return True
+                return False
+
+            success_count, fail_count = await self._apply_across(await self._mutual_members(user_id), unmute)
 
             embed = discord.Embed(
                 title="🔊 Server Unmute Results",
@@ -299,26 +410,20 @@ class OwnerCog(BaseCog):
             await ctx.send(f"❌ Error: {str(e)}")
 
     @commands.command(name="serverban", aliases=["sb"], help="Ban a user from all servers (Owner only)")
+    @whole_deployment()
     async def serverban(self, ctx, user_id: int, *, reason: str = "No reason provided"):
         """Ban a user from all mutual servers"""
         try:
-            user = await self.bot.fetch_user(user_id)
+            user = self.bot.get_user(user_id) or await self.bot.fetch_user(user_id)
             if not user:
                 await ctx.send("❌ User not found!")
                 return
 
-            success_count = 0
-            fail_count = 0
-            
-            for guild in self.bot.guilds:
-                try:
-                    member = await guild.fetch_member(user_id)
-                    if member:
-                        await guild.ban(user, reason=reason)
-                        success_count += 1
-                except Exception as e:
-                    fail_count += 1
-                    continue
+            async def ban(member: discord.Member) -> bool:
+                await member.guild.ban(user, reason=reason)
+                return True
+
+            success_count, fail_count = await self._apply_across(await self._mutual_members(user_id), ban)
 
             embed = discord.Embed(
                 title="🔨 Server Ban Results",
@@ -334,26 +439,26 @@ class OwnerCog(BaseCog):
             await ctx.send(f"❌ Error: {str(e)}")
 
     @commands.command(name="serverunban", aliases=["sub"], help="Unban a user from all servers (Owner only)")
+    @whole_deployment()
     async def serverunban(self, ctx, user_id: int, *, reason: str = "No reason provided"):
         """Unban a user from all mutual servers"""
         try:
-            user = await self.bot.fetch_user(user_id)
+            user = self.bot.get_user(user_id) or await self.bot.fetch_user(user_id)
             if not user:
                 await ctx.send("❌ User not found!")
                 return
 
-            success_count = 0
-            fail_count = 0
-            
-            for guild in self.bot.guilds:
+            async def unban(guild: discord.Guild) -> bool:
+                # A direct ban lookup instead of listing every ban in the guild
                 try:
-                    bans = [ban.user.id async for ban in guild.bans()]
-                    if user_id in bans:
-                        await guild.unban(user, reason=reason)
-                        success_count += 1
-                except Exception as e:
-                    fail_count += 1
-                    continue
+                    await guild.fetch_ban(user)
+                except discord.NotFound:
+                    return False
+                await guild.unban(user, reason=reason)
+                return True
+
+            guilds = [guild for guild in self.bot.guilds if guild.me.guild_permissions.ban_members]
+            success_count, fail_count = await self._apply_across(guilds, unban)
 
             embed = discord.Embed(
                 title="🔓 Server Unban Results",
@@ -368,58 +473,68 @@ class OwnerCog(BaseCog):
         except Exception as e:
             await ctx.send(f"❌ Error: {str(e)}")
 
-    @commands.command(name="guildinvites", aliases=["gl"], help="List invite links for all servers (Owner only)")
-    async def guildinvites(self, ctx):
-        """Generate and list invite links for all servers"""
-        embed = discord.Embed(
-            title="🔗 Server Invite Links",
-            description="Generating invite links for all servers...",
-            color=discord.Color.blue()
-        )
-        message = await ctx.send(embed=embed)
+    async def _guild_invite(self, guild: discord.Guild) -> Dict[str, Any]:
+        """Find or create a permanent invite for a guild, reusing one the bot made before"""
+        cached = self._invites.get(guild.id)
+        if cached is not None:
+            return cached
         
-        results = []
-        for guild in self.bot.guilds:
-            try:
+        result = {"name": guild.name, "members": guild.member_count}
+        try:
+            invite = None
+            if guild.me.guild_permissions.manage_guild:
+                invite = next(
+                    (inv for inv in await guild.invites()
+                     if inv.inviter and inv.inviter.id == self.bot.user.id and not inv.max_age),
+                    None
+                )
+            
+            if invite is None:
                 # Try to get the system channel or first text channel
-                invite_channel = guild.system_channel or next(
-                    (channel for channel in guild.text_channels 
-                     if channel.permissions_for(guild.me).create_instant_invite),
+                invite_channel = next(
+                    (channel for channel in [guild.system_channel, *guild.text_channels]
+                     if channel and channel.permissions_for(guild.me).create_instant_invite),
                     None
                 )
-                
-                if invite_channel:
-                    # Create an invite that never expires
-                    invite = await invite_channel.create_invite(
-                        reason=f"Invite requested by {ctx.author}",
-                        max_age=0
-                    )
-                    results.append({
-                        "name": guild.name,
-                        "success": True,
-                        "invite": invite.url,
-                        "members": guild.member_count
-                    })
-                else:
-                    results.append({
-                        "name": guild.name,
-                        "success": False,
-                        "error": "No suitable channel found"
-                    })
-            except Exception as e:
-                results.append({
-                    "name": guild.name,
-                    "success": False,
-                    "error": str(e)
-                })
+                if invite_channel is None:
+                    raise ValueError("No suitable channel found")
+                # unique=False lets Discord hand back an equivalent existing invite
+                invite = await invite_channel.create_invite(
+                    reason="Invite requested by bot owner",
+                    max_age=0,
+                    unique=False
+                )
+            
+            result.update(success=True, invite=invite.url)
+        except Exception as e:
+            result.update(success=False, error=str(e))
+        # Failures are kept briefly, so a temporary error is retried soon
+        self._invites.set(guild.id, result, ttl=None if result["success"] else GUILD_INVITE_FAILURE_TTL)
+        return result
+
+    async def _guild_invites(self) -> List[Dict[str, Any]]:
+        results = await bounded_gather(
+            (self._guild_invite(guild) for guild in self.bot.guilds),
+            GUILD_INVITE_CONCURRENCY
+        )
+        return sorted(results, key=lambda result: result["name"].casefold())
+
+    async def render_invites_page(self, user_id: int, page: int):
+        """Page source for the ``invites`` paginator, reading the snapshot taken by ``guildinvites``"""
+        results = self._invite_snapshots.get(user_id)
+        if results is None:
+            # Snapshot expired or lost in a restart: take a new one
+            results = await self._guild_invites()
+            self._invite_snapshots.set(user_id, results)
+        total_pages = max((len(results) + GUILD_INVITES_PER_PAGE - 1) // GUILD_INVITES_PER_PAGE, 1)
+        page = min(page, total_pages - 1)
         
-        # Create new embed with results
         embed = discord.Embed(
             title="🔗 Server Invite Links",
             color=discord.Color.blue()
         )
         
-        for result in results:
+        for result in results[page * GUILD_INVITES_PER_PAGE:(page + 1) * GUILD_INVITES_PER_PAGE]:
             if result["success"]:
                 value = f"Members: {result['members']}\nInvite: {result['invite']}"
             else:
@@ -431,8 +546,95 @@ class OwnerCog(BaseCog):
                 inline=False
             )
         
-        embed.set_footer(text=f"Total Servers: {len(self.bot.guilds)}")
-        await message.edit(embed=embed)
+        embed.set_footer(text=f"Total Servers: {len(results)} | Page {page + 1}/{total_pages}")
+        return embed, total_pages, 0
+
+    @commands.command(name="guildinvites", aliases=["gl"], help="List invite links for all servers (Owner only)")
+    @whole_deployment()
+    async def guildinvites(self, ctx):
+        """Generate and list invite links for all servers"""
+        embed = discord.Embed(
+            title="🔗 Server Invite Links",
+            description="Generating invite links for all servers...",
+            color=discord.Color.blue()
+        )
+        message = await ctx.send(embed=embed)
+        
+        self._invite_snapshots.set(ctx.author.id, await self._guild_invites())
+        embed, view = await render_page("invites", ctx.author.id, 0)
+        await message.edit(embed=embed, view=view)
+
+    @commands.command(name="backfillids", aliases=["bfi"], help="Store AniList ids on existing entries (Owner only)")
+    async def backfillids(self, ctx):
+        """Resolve and store AniList media ids for watchlist entries added before ids were tracked"""
+        try:
+            titles = await self.db.get_titles_missing_anilist_id()
+            if not titles:
+                await ctx.send("✅ All watchlist entries already have an AniList id!")
+                return
+
+            message = await ctx.send(f"🔄 Backfilling AniList ids for **{len(titles)}** titles...")
+
+            updated_count = 0
+            failed_titles = []
+            for title in titles:
+                media = await self.anilist.fetch_anime_details(title)
+                if not media:
+                    failed_titles.append(title)
+                    continue
+                updated_count += await self.db.set_anilist_id(title, media.id)
+
+            embed = discord.Embed(
+                title="🔗 AniList Id Backfill Results",
+                color=discord.Color.green()
+            )
+            embed.add_field(name="Titles Resolved", value=str(len(titles) - len(failed_titles)), inline=True)
+            embed.add_field(name="Entries Updated", value=str(updated_count), inline=True)
+            embed.add_field(name="Titles Not Found", value=str(len(failed_titles)), inline=True)
+            if failed_titles:
+                embed.add_field(
+                    name="Unresolved",
+                    value="\n".join(failed_titles[:10])[:1024],
+                    inline=False
+                )
+
+            await message.edit(content=None, embed=embed)
+        except Exception as e:
+            await ctx.send(f"❌ Error backfilling ids: {str(e)}")
+
+    @commands.command(name="buildcatalog", aliases=["bc"], help="Build the offline title catalog (Owner only)")
+    async def buildcatalog(self, ctx, path: Optional[str] = None):
+        """Build the offline catalog snapshot used to resolve titles without AniList searches
+        
+        Usage: {prefix}buildcatalog [path/to/catalog.jsonl]
+        Without a path, the catalog is built from every anime cached so far
+        """
+        try:
+            if path:
+                if not os.path.exists(path):
+                    await ctx.send(f"❌ File not found: `{path}`")
+                    return
+                records = lambda: iter_jsonl_records(path)
+                source = f"`{path}`"
+            else:
+                cached = self.anilist.cached_catalog_records()
+                if not cached:
+                    await ctx.send("❌ No cached anime to build a catalog from!")
+                    return
+                records = lambda: cached
+                source = "the AniList cache"
+
+            message = await ctx.send(f"🔄 Building catalog from {source}...")
+            record_count, key_count = await asyncio.to_thread(
+                lambda: build_catalog(records(), CATALOG_PATH)
+            )
+            self.anilist.reload_catalog()
+
+            await message.edit(
+                content=f"✅ Catalog built with **{record_count}** anime and **{key_count}** searchable titles."
+            )
+        except Exception as e:
+            await ctx.send(f"❌ Error building catalog: {str(e)}")
 
     @commands.command(name="importlist", aliases=["iml"], help="Import anime list for a user (Owner only)")
     async def importlist(self, ctx, user_id: int):
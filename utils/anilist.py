@@ -1,17 +1,133 @@
 import aiohttp
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import asyncio
-from config.config import ANILIST_API_URL
+import time
+from config.config import ANILIST_API_URL, ANILIST_CACHE_SIZE, SEARCH_RESULTS_LIMIT, SEARCH_CACHE_TTL, CATALOG_PATH, CATALOG_CHECK_INTERVAL
+from utils.cache import TTLCache
+from utils.catalog import Catalog, catalog_identity
+from utils.media import MediaRecord, parse_graphql_response
+from utils.metrics import registry
 
 logger = logging.getLogger(__name__)
 
+anilist_request_seconds = registry.histogram(
+    "anilist_request_seconds",
+    "Round-trip time of AniList GraphQL requests"
+)
+anilist_requests_total = registry.counter(
+    "anilist_requests_total",
+    "AniList GraphQL requests by HTTP status",
+    labelnames=("status",)
+)
+
+# Fields requested for every Media lookup, shared by search and id queries
+MEDIA_FIELDS = """
+    id
+    title {
+      romaji
+      english
+      native
+    }
+    synonyms
+    description
+    episodes
+    duration
+    status
+    genres
+    averageScore
+    popularity
+    siteUrl
+    startDate {
+      year
+      month
+      day
+    }
+    endDate {
+      year
+      month
+      day
+    }
+    coverImage {
+      large
+    }
+    bannerImage
+    studios {
+      nodes {
+        name
+      }
+    }
+    seasonYear
+    season
+"""
+
+SEARCH_QUERY = """
+query ($search: String) {
+  Media(search: $search, type: ANIME) {
+%s
+  }
+}
+""" % MEDIA_FIELDS
+
+ID_QUERY = """
+query ($id: Int) {
+  Media(id: $id, type: ANIME) {
+%s
+  }
+}
+""" % MEDIA_FIELDS
+
+PAGE_QUERY = """
+query ($search: String, $perPage: Int) {
+  Page(perPage: $perPage) {
+    media(search: $search, type: ANIME) {
+%s
+    }
+  }
+}
+""" % MEDIA_FIELDS
+
+AIRING_QUERY = """
+query ($ids: [Int], $perPage: Int) {
+  Page(perPage: $perPage) {
+    media(id_in: $ids, type: ANIME, status: RELEASING) {
+      id
+      title {
+        romaji
+      }
+      siteUrl
+      nextAiringEpisode {
+        airingAt
+        episode
+      }
+    }
+  }
+}
+"""
+AIRING_BATCH_SIZE = 50  # AniList caps perPage at 50
+
 class AniListAPI:
-    def __init__(self):
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(AniListAPI, cls).__new__(cls)
+            cls._instance.initialize()
+        return cls._instance
+
+    def initialize(self):
+        """Initialize shared API state"""
         self.session: Optional[aiohttp.ClientSession] = None
         self._rate_limit_lock = asyncio.Lock()
         self._last_request_time = 0
         self.rate_limit_delay = 1  # Minimum delay between requests in seconds
+        # Media keyed by AniList id; id lookups are deterministic so entries never go stale
+        self._media_cache: Dict[int, MediaRecord] = {}
+        # Recent multi-result searches keyed by normalized query, so picking a candidate is free
+        self._search_cache = TTLCache(ttl=SEARCH_CACHE_TTL)
+        self._catalog: Optional[Catalog] = None
+        self._catalog_checked = 0.0
+        self.reload_catalog()
 
     async def _init_session(self):
         """Initialize aiohttp session if not exists"""
@@ -24,6 +140,49 @@ class AniListAPI:
             await self.session.close()
             self.session = None
 
+    def reload_catalog(self) -> None:
+        """(Re)open the offline catalog snapshot if one has been built"""
+        self._catalog_checked = time.monotonic()
+        try:
+            catalog = Catalog.open(CATALOG_PATH)
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to open catalog {CATALOG_PATH}: {str(e)}")
+            return
+        if self._catalog:
+            self._catalog.close()
+        self._catalog = catalog
+        if catalog:
+            logger.info(f"Loaded catalog with {len(catalog)} anime")
+
+    @property
+    def catalog(self) -> Optional[Catalog]:
+        """The current catalog snapshot, reopened when another process has rebuilt it"""
+        if time.monotonic() - self._catalog_checked >= CATALOG_CHECK_INTERVAL:
+            self._catalog_checked = time.monotonic()
+            current = self._catalog.identity if self._catalog else None
+            if catalog_identity(CATALOG_PATH) != current:
+                self.reload_catalog()
+        return self._catalog
+
+    def resolve_title(self, title: str) -> Optional[int]:
+        """Resolve a title to an AniList id from the offline catalog, without a network call"""
+        if not self.catalog:
+            return None
+        record = self.catalog.lookup(title)
+        return record["id"] if record else None
+
+    def cached_catalog_records(self) -> List[Dict[str, Any]]:
+        """Catalog records for every media accumulated in the id cache"""
+        return [
+            {
+                "id": record.id,
+                "title": record.title,
+                "synonyms": [t for t in (record.english_title, record.native_title) if t] + list(record.synonyms),
+                "episodes": record.episodes
+            }
+            for record in self._media_cache.values()
+        ]
+
     async def _handle_rate_limit(self):
         """Handle rate limiting for API requests"""
         async with self._rate_limit_lock:
@@ -33,99 +192,106 @@ class AniListAPI:
                 await asyncio.sleep(self.rate_limit_delay - time_since_last_request)
             self._last_request_time = asyncio.get_event_loop().time()
 
-    async def fetch_anime_details(self, title: str) -> Optional[Dict[str, Any]]:
-        """Fetch anime details from AniList API"""
-        query = """
-        query ($search: String) {
-          Media(search: $search, type: ANIME) {
-            id
-            title {
-              romaji
-              english
-              native
-            }
-            description
-            episodes
-            duration
-            status
-            genres
-            averageScore
-            popularity
-            siteUrl
-            startDate {
-              year
-              month
-              day
-            }
-            endDate {
-              year
-              month
-              day
-            }
-            coverImage {
-              large
-            }
-            bannerImage
-            studios {
-              nodes {
-                name
-              }
-            }
-            seasonYear
-            season
-          }
-        }
-        """
-        
+    def _cache_media(self, media: Dict[str, Any]) -> MediaRecord:
+        """Shape media into a record and store it in the id cache, dropping the oldest entry when full"""
+        record = MediaRecord.from_api(media)
+        if len(self._media_cache) >= ANILIST_CACHE_SIZE and record.id not in self._media_cache:
+            self._media_cache.pop(next(iter(self._media_cache)))
+        self._media_cache[record.id] = record
+        return record
+
+    async def _query(self, query: str, variables: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Send a GraphQL query and return its data payload"""
         try:
             await self._init_session()
             await self._handle_rate_limit()
             
+            started = time.perf_counter()
             async with self.session.post(
                 ANILIST_API_URL,
-                json={"query": query, "variables": {"search": title}}
+                json={"query": query, "variables": variables}
             ) as response:
+                anilist_request_seconds.observe(time.perf_counter() - started)
+                anilist_requests_total.inc(status=response.status)
                 if response.status == 429:  # Too Many Requests
                     retry_after = int(response.headers.get('Retry-After', '60'))
                     logger.warning(f"Rate limited by AniList API. Retrying after {retry_after} seconds")
                     await asyncio.sleep(retry_after)
-                    return await self.fetch_anime_details(title)
+                    return await self._query(query, variables)
                 
                 if response.status != 200:
                     logger.error(f"AniList API error: Status {response.status}")
                     return None
                 
-                data = await response.json()
+                data, errors = parse_graphql_response(await response.read())
                 
-                if "errors" in data:
-                    logger.error(f"AniList API returned errors: {data['errors']}")
+                if errors:
+                    logger.error(f"AniList API returned errors: {errors}")
                     return None
                 
-                return data.get("data", {}).get("Media")
+                return data
                 
         except aiohttp.ClientError as e:
-            logger.error(f"Error fetching anime details: {str(e)}")
+            anilist_requests_total.inc(status="error")
+            logger.error(f"Error querying AniList: {str(e)}")
             return None
         except Exception as e:
-            logger.error(f"Unexpected error in fetch_anime_details: {str(e)}")
+            logger.error(f"Unexpected error in AniList query: {str(e)}")
             return None
 
-    def format_anime_data(self, api_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Format API response data into a consistent structure"""
-        return {
-            "title": api_data["title"]["romaji"],
-            "english_title": api_data["title"]["english"],
-            "native_title": api_data["title"]["native"],
-            "description": api_data["description"],
-            "episodes": api_data["episodes"],
-            "status": api_data["status"],
-            "genres": api_data["genres"],
-            "average_score": api_data["averageScore"],
-            "popularity": api_data["popularity"],
-            "site_url": api_data["siteUrl"],
-            "cover_image": api_data["coverImage"]["large"],
-            "banner_image": api_data["bannerImage"],
-            "studios": [studio["name"] for studio in api_data["studios"]["nodes"]],
-            "year": api_data["seasonYear"],
-            "season": api_data["season"]
-        } 
\ No newline at end of file
+    async def fetch_anime_details(self, title: str) -> Optional[MediaRecord]:
+        """Fetch anime details from AniList API by fuzzy title search"""
+        data = await self._query(SEARCH_QUERY, {"search": title})
+        media = data.get("Media") if data else None
+        return self._cache_media(media) if media else None
+
+    async def search_anime(self, title: str, per_page: int = SEARCH_RESULTS_LIMIT) -> List[MediaRecord]:
+        """Fetch several candidate matches for a title in a single request"""
+        key = (" ".join(title.lower().split()), per_page)
+        candidates = self._search_cache.get(key)
+        if candidates is not None:
+            return candidates
+        
+        data = await self._query(PAGE_QUERY, {"search": title, "perPage": per_page})
+        if data is None:
+            return []
+        
+        media_list = (data.get("Page") or {}).get("media") or []
+        candidates = [self._cache_media(media) for media in media_list]
+        self._search_cache.set(key, candidates)
+        return candidates
+
+    async def fetch_anime_by_id(self, media_id: int) -> Optional[MediaRecord]:
+        """Fetch anime details by AniList media id, served from cache when possible"""
+        record = self._media_cache.get(media_id)
+        if record:
+            return record
+        
+        data = await self._query(ID_QUERY, {"id": media_id})
+        media = data.get("Media") if data else None
+        return self._cache_media(media) if media else None
+
+    async def fetch_airing_schedule(self, media_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Fetch the next airing episode for releasing media, batched by id
+
+        Returns a mapping of media id to ``title``, ``site_url``, ``airing_at``
+        (unix seconds) and ``episode``. Media that are not releasing or have no
+        scheduled episode are left out.
+        """
+        schedule = {}
+        for start in range(0, len(media_ids), AIRING_BATCH_SIZE):
+            batch = media_ids[start:start + AIRING_BATCH_SIZE]
+            data = await self._query(AIRING_QUERY, {"ids": batch, "perPage": AIRING_BATCH_SIZE})
+            if not data:
+                continue
+            for media in (data.get("Page") or {}).get("media") or []:
+                next_episode = media.get("nextAiringEpisode")
+                if not next_episode:
+                    continue
+                schedule[media["id"]] = {
+                    "title": media["title"]["romaji"],
+                    "site_url": media.get("siteUrl"),
+                    "airing_at": next_episode["airingAt"],
+                    "episode": next_episode["episode"]
+                }
+        return schedule
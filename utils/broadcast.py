@@ -0,0 +1,218 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Optional
+import discord
+from config.config import BROADCAST_CONCURRENCY, BROADCAST_RATE, BROADCAST_CHECKPOINT_PATH
+from utils.edit_scheduler import edit_scheduler
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_INTERVAL = 2.0  # seconds between checkpoint writes while broadcasting
+
+class TokenBucket:
+    """Async token bucket allowing ``rate`` acquisitions per second with bursts up to ``capacity``"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+def _write_checkpoint(path: str, state: Dict[str, Any]) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
+
+class BroadcastEngine:
+    """Sends an announcement to every guild with bounded concurrency
+
+    Workers share a token bucket kept under Discord's global rate limit, while
+    discord.py's HTTP client handles the per-channel route buckets (each guild
+    is a different route). Progress is checkpointed to disk so a broadcast
+    interrupted by a crash or restart can be resumed without re-sending.
+    """
+
+    def __init__(
+        self,
+        bot,
+        concurrency: int = BROADCAST_CONCURRENCY,
+        rate: float = BROADCAST_RATE,
+        checkpoint_path: str = BROADCAST_CHECKPOINT_PATH
+    ):
+        self.bot = bot
+        self.concurrency = concurrency
+        self.checkpoint_path = checkpoint_path
+        self._bucket = TokenBucket(rate)
+        # guild_id -> channel_id chosen for announcements
+        self._channels: Dict[int, int] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def invalidate(self, guild_id: int) -> None:
+        """Forget a guild's announcement channel, e.g. after its channels changed"""
+        self._channels.pop(guild_id, None)
+
+    def load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """Return the state of an interrupted broadcast, if any"""
+        try:
+            with open(self.checkpoint_path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.error(f"Unreadable broadcast checkpoint {self.checkpoint_path}: {str(e)}")
+            return None
+
+    def discard_checkpoint(self) -> None:
+        try:
+            os.remove(self.checkpoint_path)
+        except FileNotFoundError:
+            pass
+
+    def _channel_for(self, guild: discord.Guild) -> Optional[discord.TextChannel]:
+        """Pick (and remember) a channel the bot may post in, preferring the system channel"""
+        cached = self._channels.get(guild.id)
+        if cached is not None:
+            channel = guild.get_channel(cached)
+            if channel is not None and channel.permissions_for(guild.me).send_messages:
+                return channel
+            del self._channels[guild.id]
+
+        candidates = [guild.system_channel] if guild.system_channel else []
+        candidates.extend(guild.text_channels)
+        channel = next((ch for ch in candidates if ch.permissions_for(guild.me).send_messages), None)
+        if channel is not None:
+            self._channels[guild.id] = channel.id
+        return channel
+
+    async def start(self, message: str, author: str, progress: discord.Message) -> None:
+        """Start a new broadcast, replacing any previous checkpoint"""
+        state = {
+            "message": message,
+            "author": author,
+            "done": [],
+            "failed": {},
+            "started_at": time.time()
+        }
+        await self.run(state, progress)
+
+    async def run(self, state: Dict[str, Any], progress: discord.Message) -> None:
+        """Send to every guild not yet recorded in ``state`` and report progress"""
+        if self.running:
+            raise RuntimeError("A broadcast is already running")
+        self._task = asyncio.current_task()
+
+        embed = discord.Embed(
+            title="📢 Bot Announcement",
+            description=state["message"],
+            color=discord.Color.blue()
+        )
+        embed.set_footer(text=f"From: {state['author']}")
+
+        done = set(state["done"])
+        failed: Dict[str, str] = state["failed"]
+        pending = [guild for guild in self.bot.guilds if guild.id not in done and str(guild.id) not in failed]
+        total = len(done) + len(failed) + len(pending)
+        queue: asyncio.Queue = asyncio.Queue()
+        for guild in pending:
+            queue.put_nowait(guild)
+
+        last_checkpoint = 0.0
+
+        def snapshot() -> Dict[str, Any]:
+            # Copies, since the checkpoint is serialized on a thread while workers keep going
+            return {**state, "done": list(done), "failed": dict(failed)}
+
+        async def checkpoint(force: bool = False) -> None:
+            nonlocal last_checkpoint
+            if force or time.monotonic() - last_checkpoint >= CHECKPOINT_INTERVAL:
+                last_checkpoint = time.monotonic()
+                await asyncio.to_thread(_write_checkpoint, self.checkpoint_path, snapshot())
+
+        def report(final: bool = False) -> None:
+            finished = len(done) + len(failed)
+            status = "✅ Broadcast complete!" if final else "📢 Broadcasting..."
+            edit_scheduler.schedule(
+                progress,
+                content=f"{status} {finished}/{total} servers ({len(done)} sent, {len(failed)} failed)"
+            )
+
+        async def worker() -> None:
+            while True:
+                try:
+                    guild = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                error = await self._send(guild, embed)
+                if error is None:
+                    done.add(guild.id)
+                else:
+                    failed[str(guild.id)] = error
+                report()
+                await checkpoint()
+
+        await checkpoint(force=True)
+        report()
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.concurrency, len(pending)) or 1)]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            # Stop the remaining workers so nothing is sent after the broadcast is over
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            # Keep whatever finished so a resume skips it
+            await asyncio.shield(asyncio.to_thread(_write_checkpoint, self.checkpoint_path, snapshot()))
+            raise
+        finally:
+            self._task = None
+
+        self.discard_checkpoint()
+        report(final=True)
+        if failed:
+            logger.warning(f"Broadcast failed for {len(failed)} guild(s)")
+
+    async def _send(self, guild: discord.Guild, embed: discord.Embed) -> Optional[str]:
+        """Send to one guild, returning an error description on failure"""
+        channel = self._channel_for(guild)
+        if channel is None:
+            return "No channel the bot can post in"
+
+        for attempt in range(2):
+            await self._bucket.acquire()
+            try:
+                await channel.send(embed=embed)
+                return None
+            except discord.Forbidden as e:
+                self.invalidate(guild.id)
+                return f"Forbidden: {e.text}"
+            except discord.HTTPException as e:
+                if e.status == 429 and attempt == 0:
+                    retry_after = getattr(e, "retry_after", None) or 5
+                    logger.warning(f"Rate limited broadcasting. Retrying after {retry_after} seconds")
+                    await asyncio.sleep(retry_after)
+                    continue
+                return str(e)
+        return "Rate limited"
@@ -0,0 +1,51 @@
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+class TTLCache:
+    """Small in-memory cache whose entries expire after a fixed time-to-live"""
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Optional[Any]:
+        """Return the cached value for key, or default if missing or expired"""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting expired entries and then the oldest one when full
+
+        ``ttl`` overrides the cache's time-to-live for this entry.
+        """
+        if key not in self._data and len(self._data) >= self.maxsize:
+            self._evict()
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Optional[Any]:
+        """Remove key and return its value if it has not expired"""
+        value = self.get(key, default)
+        self._data.pop(key, None)
+        return value
+
+    def clear(self) -> None:
+        """Drop every cached entry"""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        expired = [key for key, (expires_at, _) in self._data.items() if expires_at < now]
+        for key in expired:
+            del self._data[key]
+        if len(self._data) >= self.maxsize:
+            self._data.pop(next(iter(self._data)))
@@ -0,0 +1,73 @@
+"""Watchlist card rendering
+
+``render_card`` is a plain top-level function over picklable arguments so it
+can run in a process pool; Pillow is only imported inside the worker.
+"""
+from io import BytesIO
+from typing import Any, Dict, List, Optional
+
+COLUMNS = 4
+PADDING = 16
+HEADER_HEIGHT = 48
+COVER_SIZE = (160, 228)
+CELL_HEIGHT = COVER_SIZE[1] + 52
+TITLE_CHARS = 24
+
+BACKGROUND = (30, 33, 36)
+PLACEHOLDER = (64, 68, 75)
+TEXT = (235, 235, 235)
+MUTED = (170, 170, 170)
+BAR_EMPTY = (79, 84, 92)
+BAR_FILLED = (0, 200, 83)
+
+def render_card(heading: str, entries: List[Dict[str, Any]], covers: List[Optional[bytes]]) -> bytes:
+    """Render entries as a PNG grid of covers with progress bars
+
+    Each entry needs ``title``, ``episodes_watched`` and ``total_episodes``;
+    ``covers`` holds the matching cover image bytes, or None for a placeholder.
+    """
+    from PIL import Image, ImageDraw, ImageFont, ImageOps
+
+    columns = max(min(COLUMNS, len(entries)), 1)
+    rows = max((len(entries) + columns - 1) // columns, 1)
+    width = PADDING + columns * (COVER_SIZE[0] + PADDING)
+    height = HEADER_HEIGHT + rows * (CELL_HEIGHT + PADDING)
+
+    card = Image.new("RGB", (width, height), BACKGROUND)
+    draw = ImageDraw.Draw(card)
+    font = ImageFont.load_default()
+    draw.text((PADDING, PADDING), heading, fill=TEXT, font=font)
+
+    for index, (entry, cover) in enumerate(zip(entries, covers)):
+        x = PADDING + (index % columns) * (COVER_SIZE[0] + PADDING)
+        y = HEADER_HEIGHT + (index // columns) * (CELL_HEIGHT + PADDING)
+
+        thumbnail = None
+        if cover:
+            try:
+                thumbnail = ImageOps.fit(Image.open(BytesIO(cover)).convert("RGB"), COVER_SIZE)
+            except OSError:
+                thumbnail = None
+        if thumbnail:
+            card.paste(thumbnail, (x, y))
+        else:
+            draw.rectangle((x, y, x + COVER_SIZE[0], y + COVER_SIZE[1]), fill=PLACEHOLDER)
+
+        title = entry["title"]
+        if len(title) > TITLE_CHARS:
+            title = title[:TITLE_CHARS - 1] + "…"
+        text_y = y + COVER_SIZE[1] + 6
+        draw.text((x, text_y), title, fill=TEXT, font=font)
+
+        watched = entry.get("episodes_watched") or 0
+        total = entry.get("total_episodes") or 0
+        bar_y = text_y + 18
+        draw.rectangle((x, bar_y, x + COVER_SIZE[0], bar_y + 6), fill=BAR_EMPTY)
+        if total:
+            filled = int(COVER_SIZE[0] * min(watched / total, 1))
+            draw.rectangle((x, bar_y, x + filled, bar_y + 6), fill=BAR_FILLED)
+        draw.text((x, bar_y + 10), f"{watched}/{total or '?'} episodes", fill=MUTED, font=font)
+
+    output = BytesIO()
+    card.save(output, format="PNG", optimize=True)
+    return output.getvalue()
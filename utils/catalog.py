@@ -0,0 +1,186 @@
+import json
+import mmap
+import os
+import re
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+MAGIC = b"AWTCAT01"
+# magic, entry count, record count, keys section offset, records section offset
+HEADER = struct.Struct("<8sIIQQ")
+# key offset, key length, record offset (offsets are relative to their section)
+ENTRY = struct.Struct("<IHI")
+RECORD_LENGTH = struct.Struct("<I")
+
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+def normalize_title(title: str) -> str:
+    """Fold case and punctuation so equivalent spellings share one key"""
+    return " ".join(_NON_WORD.sub(" ", title.casefold()).split())
+
+def iter_jsonl_records(path: str) -> Iterator[Dict[str, Any]]:
+    """Read catalog records from a JSON Lines file
+
+    Each line needs an ``id`` and a ``title``, either as a string or as an
+    AniList title object. ``synonyms`` and ``episodes`` are optional.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            item = json.loads(line)
+            title = item.get("title")
+            if isinstance(title, dict):
+                synonyms = [t for t in (title.get("english"), title.get("native")) if t]
+                title = title.get("romaji") or title.get("english")
+            else:
+                synonyms = []
+            if not title or "id" not in item:
+                continue
+            yield {
+                "id": int(item["id"]),
+                "title": title,
+                "synonyms": synonyms + list(item.get("synonyms") or []),
+                "episodes": item.get("episodes")
+            }
+
+def build_catalog(records: Iterable[Dict[str, Any]], path: str) -> Tuple[int, int]:
+    """Write a catalog index file and return its (record count, key count)
+
+    The file is written next to its destination and swapped in atomically so
+    processes reading the old index are never handed a partial file.
+    """
+    records_blob = bytearray()
+    keyed: Dict[bytes, int] = {}
+    seen_ids = set()
+    for record in records:
+        if record["id"] in seen_ids:
+            continue
+        seen_ids.add(record["id"])
+
+        record_offset = len(records_blob)
+        payload = json.dumps({
+            "id": record["id"],
+            "title": record["title"],
+            "synonyms": record.get("synonyms") or [],
+            "episodes": record.get("episodes")
+        }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        records_blob += RECORD_LENGTH.pack(len(payload)) + payload
+
+        for name in [record["title"], *(record.get("synonyms") or [])]:
+            key = normalize_title(name).encode("utf-8")[:0xFFFF]
+            # The first record claiming a key wins
+            if key and key not in keyed:
+                keyed[key] = record_offset
+
+    keys_blob = bytearray()
+    entries = bytearray()
+    for key in sorted(keyed):
+        entries += ENTRY.pack(len(keys_blob), len(key), keyed[key])
+        keys_blob += key
+
+    keys_offset = HEADER.size + len(entries)
+    records_offset = keys_offset + len(keys_blob)
+    header = HEADER.pack(MAGIC, len(keyed), len(seen_ids), keys_offset, records_offset)
+
+    destination = Path(path)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = destination.with_suffix(destination.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(entries)
+        f.write(keys_blob)
+        f.write(records_blob)
+    os.replace(tmp_path, destination)
+    return len(seen_ids), len(keyed)
+
+def _identity(stat: os.stat_result) -> Tuple[int, int]:
+    # build_catalog swaps in a new file, so the inode changes with every snapshot
+    return stat.st_ino, stat.st_mtime_ns
+
+def catalog_identity(path: str) -> Optional[Tuple[int, int]]:
+    """Identify the snapshot currently at ``path``, or None if there is none"""
+    try:
+        return _identity(os.stat(path))
+    except FileNotFoundError:
+        return None
+
+class Catalog:
+    """Read-only, memory-mapped title index built by ``build_catalog``
+
+    Pages are mapped shared and read-only, so every process opening the same
+    file shares one copy in the OS page cache.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self.identity = _identity(os.fstat(f.fileno()))
+        magic, self.key_count, self.record_count, self._keys_offset, self._records_offset = \
+            HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path} is not a catalog index")
+
+    @classmethod
+    def open(cls, path: str) -> Optional["Catalog"]:
+        """Open a catalog if the file exists"""
+        return cls(path) if os.path.exists(path) else None
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def __len__(self) -> int:
+        return self.record_count
+
+    def _entry(self, index: int) -> Tuple[bytes, int]:
+        key_offset, key_length, record_offset = ENTRY.unpack_from(self._mm, HEADER.size + index * ENTRY.size)
+        start = self._keys_offset + key_offset
+        return self._mm[start:start + key_length], record_offset
+
+    def _record(self, record_offset: int) -> Dict[str, Any]:
+        start = self._records_offset + record_offset
+        (length,) = RECORD_LENGTH.unpack_from(self._mm, start)
+        start += RECORD_LENGTH.size
+        return json.loads(self._mm[start:start + length])
+
+    def _lower_bound(self, key: bytes) -> int:
+        low, high = 0, self.key_count
+        while low < high:
+            mid = (low + high) // 2
+            if self._entry(mid)[0] < key:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def lookup(self, title: str) -> Optional[Dict[str, Any]]:
+        """Find the record whose title or synonym matches exactly after normalizing"""
+        key = normalize_title(title).encode("utf-8")
+        if not key:
+            return None
+        index = self._lower_bound(key)
+        if index < self.key_count:
+            entry_key, record_offset = self._entry(index)
+            if entry_key == key:
+                return self._record(record_offset)
+        return None
+
+    def search(self, prefix: str, limit: int = 25) -> List[Dict[str, Any]]:
+        """Return up to ``limit`` distinct records with a title starting with prefix"""
+        key = normalize_title(prefix).encode("utf-8")
+        results = []
+        seen_offsets = set()
+        index = self._lower_bound(key)
+        while index < self.key_count and len(results) < limit:
+            entry_key, record_offset = self._entry(index)
+            if not entry_key.startswith(key):
+                break
+            if record_offset not in seen_offsets:
+                seen_offsets.add(record_offset)
+                results.append(self._record(record_offset))
+            index += 1
+        return results
@@ -0,0 +1,106 @@
+import asyncio
+import logging
+import math
+import os
+import time
+from typing import Any, Dict, List, Optional
+import aiohttp
+from discord.ext import commands
+from config.config import CLUSTER_HEALTH_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+GATEWAY_BOT_URL = "https://discord.com/api/v10/gateway/bot"
+
+async def fetch_recommended_shards(token: str) -> int:
+    """Ask Discord how many shards the bot should run"""
+    async with aiohttp.ClientSession() as session:
+        async with session.get(GATEWAY_BOT_URL, headers={"Authorization": f"Bot {token}"}) as response:
+            response.raise_for_status()
+            data = await response.json()
+    return int(data["shards"])
+
+def split_shards(shard_count: int, cluster_count: int) -> List[List[int]]:
+    """Spread shard ids over clusters as evenly as possible, in contiguous ranges"""
+    cluster_count = max(1, min(cluster_count, shard_count))
+    per_cluster = math.ceil(shard_count / cluster_count)
+    return [
+        list(range(start, min(start + per_cluster, shard_count)))
+        for start in range(0, shard_count, per_cluster)
+    ]
+
+class PartialDeployment(commands.CheckFailure):
+    """Raised for commands that need every guild when this process only runs some shards"""
+
+def runs_all_shards(bot) -> bool:
+    """Whether this process's guild cache covers the whole deployment"""
+    return bot.shard_ids is None or len(bot.shard_ids) >= (bot.shard_count or 1)
+
+def whole_deployment():
+    """Command check refusing to run over only this cluster's share of the guilds"""
+    async def predicate(ctx: commands.Context) -> bool:
+        if not runs_all_shards(ctx.bot):
+            raise PartialDeployment(
+                f"`{ctx.command.qualified_name}` works on every server, but this cluster only "
+                f"runs shards {ctx.bot.shard_ids[0]}-{ctx.bot.shard_ids[-1]} of {ctx.bot.shard_count}. "
+                f"Run it with CLUSTER_COUNT=1."
+            )
+        return True
+    return commands.check(predicate)
+
+class ClusterHealthReporter:
+    """Periodically writes this process's shard latencies and guild counts to Mongo
+
+    Every cluster process reports into the same collection, which is how the
+    owner ``stats`` command sees shards running in other processes.
+    """
+
+    def __init__(self, bot, db, cluster_id: int, interval: float = CLUSTER_HEALTH_INTERVAL):
+        self.bot = bot
+        self.db = db
+        self.cluster_id = cluster_id
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current health of the shards owned by this process"""
+        shards = []
+        for shard_id, shard in sorted(self.bot.shards.items()):
+            latency = shard.latency
+            shards.append({
+                "shard_id": shard_id,
+                "latency_ms": None if math.isinf(latency) or math.isnan(latency) else round(latency * 1000),
+                "closed": shard.is_closed(),
+                "guilds": sum(1 for guild in self.bot.guilds if guild.shard_id == shard_id)
+            })
+        return {
+            "cluster_id": self.cluster_id,
+            "pid": os.getpid(),
+            "shard_count": self.bot.shard_count,
+            "shards": shards,
+            "guilds": len(self.bot.guilds),
+            "users": sum(guild.member_count or 0 for guild in self.bot.guilds),
+            "updated_at": time.time()
+        }
+
+    async def _run(self) -> None:
+        await self.bot.wait_until_ready()
+        while True:
+            try:
+                await self.db.report_cluster_health(self.snapshot())
+            except Exception as e:
+                logger.error(f"Failed to report cluster {self.cluster_id} health: {str(e)}")
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,15 @@
+import asyncio
+from typing import Any, Awaitable, Iterable, List
+
+async def bounded_gather(aws: Iterable[Awaitable[Any]], limit: int, return_exceptions: bool = False) -> List[Any]:
+    """Like ``asyncio.gather`` but with at most ``limit`` awaitables running at once
+
+    Results keep the order of ``aws``.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(run(aw) for aw in aws), return_exceptions=return_exceptions)
@@ -1,13 +1,37 @@
-from typing import Optional, Dict, List, Any
-from pymongo import MongoClient
+from typing import Optional, Dict, List, Any, Set
+from pymongo import MongoClient, ReturnDocument
 from pymongo.collection import Collection
 from pymongo.database import Database
 from pymongo.errors import PyMongoError
+from bson import ObjectId
+from bson.errors import InvalidId
+import asyncio
+import functools
 import logging
-from config.config import MONGODB_URI, DB_NAME, COLLECTION_NAME
+import time
+from config.config import MONGODB_URI, DB_NAME, COLLECTION_NAME, USERS_COLLECTION_NAME, CLUSTER_HEALTH_COLLECTION_NAME, GUILD_SETTINGS_COLLECTION_NAME
+from utils.title_trie import TitleIndex
+from utils.metrics import registry, timed
+
+db_operation_seconds = registry.histogram(
+    "db_operation_seconds",
+    "Time spent in DatabaseManager operations",
+    labelnames=("operation",)
+)
 
 logger = logging.getLogger(__name__)
 
+def db_operation(func):
+    """Time a DatabaseManager coroutine and hold it until the connection is ready"""
+    timed_func = timed(db_operation_seconds)(func)
+
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        if not self.ready:
+            await self.wait_ready()
+        return await timed_func(self, *args, **kwargs)
+    return wrapper
+
 class DatabaseManager:
     _instance = None
     
@@ -19,38 +43,103 @@ class DatabaseManager:
     
     def initialize(self):
         """Initialize database connection"""
+        # Per-user title tries for autocomplete, kept in sync by add/delete and
+        # checked against the stored list version before use
+        self.titles = TitleIndex(self.get_title_ids, self.list_version)
+        # Connecting (DNS for mongodb+srv URIs) and index builds block, so they
+        # run on a worker thread in the background; operations wait for them
+        self.client: Optional[MongoClient] = None
+        self.ready = False
+        self.connect_seconds: Optional[float] = None
+        self._connect_task: Optional[asyncio.Task] = None
+
+    def _connect(self) -> None:
+        """Connect and make sure indexes exist; runs off the event loop"""
+        started = time.perf_counter()
         try:
-            self.client: MongoClient = MongoClient(MONGODB_URI)
+            self.client = MongoClient(MONGODB_URI)
             self.db: Database = self.client[DB_NAME]
             self.collection: Collection = self.db[COLLECTION_NAME]
+            self.users: Collection = self.db[USERS_COLLECTION_NAME]
+            self.cluster_health: Collection = self.db[CLUSTER_HEALTH_COLLECTION_NAME]
+            self.guild_settings: Collection = self.db[GUILD_SETTINGS_COLLECTION_NAME]
             # Create compound index for user_id and title
             self.collection.create_index([("user_id", 1), ("title", 1)], unique=True)
-            logger.info("Successfully connected to MongoDB")
+            # Index for id-based lookups of tracked entries
+            self.collection.create_index([("anilist_id", 1)])
+            self.users.create_index([("user_id", 1)], unique=True)
+            self.guild_settings.create_index([("guild_id", 1)], unique=True)
+            self.connect_seconds = time.perf_counter() - started
+            self.ready = True
+            logger.info(f"Successfully connected to MongoDB in {self.connect_seconds:.2f}s")
         except PyMongoError as e:
             logger.error(f"Failed to connect to MongoDB: {str(e)}")
             raise
 
+    def start(self) -> asyncio.Task:
+        """Begin connecting in the background, retrying if an earlier attempt failed"""
+        task = self._connect_task
+        if task is None or (task.done() and (task.cancelled() or task.exception() is not None)):
+            task = self._connect_task = asyncio.create_task(asyncio.to_thread(self._connect))
+        return task
+
+    async def wait_ready(self) -> None:
+        """Wait until the connection and indexes are ready"""
+        if not self.ready:
+            await asyncio.shield(self.start())
+
     def close(self):
         """Close database connection"""
         try:
-            self.client.close()
+            if self.client is not None:
+                self.client.close()
+            # The next DatabaseManager() reconnects instead of reusing a closed client
+            DatabaseManager._instance = None
             logger.info("MongoDB connection closed")
         except Exception as e:
             logger.error(f"Error closing MongoDB connection: {str(e)}")
 
+    @db_operation
+    async def list_version(self, user_id: int) -> int:
+        """Get the current version of a user's watchlist
+        
+        Versions live on the user's document and only ever increase, so they
+        never repeat across restarts or between processes.
+        """
+        try:
+            user = self.users.find_one({"user_id": user_id}, {"list_version": 1})
+            return user.get("list_version", 0) if user else 0
+        except PyMongoError as e:
+            logger.error(f"Error getting list version: {str(e)}")
+            raise
+
+    def _bump_version(self, user_id: int) -> int:
+        """Increment a user's watchlist version after a write and return the new one"""
+        user = self.users.find_one_and_update(
+            {"user_id": user_id},
+            {"$inc": {"list_version": 1}},
+            projection={"list_version": 1},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        return user["list_version"]
+
+    @db_operation
     async def add_anime(self, user_id: int, anime_data: Dict[str, Any]) -> bool:
         """Add a new anime to the database for specific user"""
         try:
             # Add user_id to anime data
             anime_data["user_id"] = user_id
             if not self.collection.find_one({"user_id": user_id, "title": anime_data["title"]}):
-                self.collection.insert_one(anime_data)
+                result = self.collection.insert_one(anime_data)
+                self.titles.add(user_id, anime_data["title"], str(result.inserted_id), self._bump_version(user_id))
                 return True
             return False
         except PyMongoError as e:
             logger.error(f"Error adding anime: {str(e)}")
             raise
 
+    @db_operation
     async def get_anime(self, user_id: int, title: str) -> Optional[Dict[str, Any]]:
         """Get anime by title for specific user"""
         try:
@@ -59,6 +148,18 @@ class DatabaseManager:
             logger.error(f"Error getting anime: {str(e)}")
             raise
 
+    @db_operation
+    async def get_anime_by_id(self, user_id: int, entry_id: str) -> Optional[Dict[str, Any]]:
+        """Get a watchlist entry by its document id for specific user"""
+        try:
+            return self.collection.find_one({"_id": ObjectId(entry_id), "user_id": user_id})
+        except InvalidId:
+            return None
+        except PyMongoError as e:
+            logger.error(f"Error getting anime: {str(e)}")
+            raise
+
+    @db_operation
     async def update_anime(self, user_id: int, title: str, update_data: Dict[str, Any]) -> bool:
         """Update anime data for specific user"""
         try:
@@ -66,22 +167,26 @@ class DatabaseManager:
                 {"user_id": user_id, "title": title},
                 {"$set": update_data}
             )
+            if result.modified_count > 0:
+                self.titles.advance(user_id, self._bump_version(user_id))
             return result.modified_count > 0
         except PyMongoError as e:
             logger.error(f"Error updating anime: {str(e)}")
             raise
 
+    @db_operation
     async def delete_anime(self, user_id: int, title: str) -> bool:
         """Delete anime from database for specific user"""
         try:
             result = self.collection.delete_one({"user_id": user_id, "title": title})
+            if result.deleted_count > 0:
+                self.titles.remove(user_id, title, self._bump_version(user_id))
             return result.deleted_count > 0
         except PyMongoError as e:
             logger.error(f"Error deleting anime: {str(e)}")
             raise
 
-    async def get_all_anime(self, user_id: int, query: Dict[str, Any] = None) -> List[Dict[str, Any]]:
-        """Get all anime matching the query for specific user"""
+    def _find_anime(self, user_id: int, query: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         try:
             base_query = {"user_id": user_id}
             if query:
@@ -91,6 +196,205 @@ class DatabaseManager:
             logger.error(f"Error getting anime list: {str(e)}")
             raise
 
+    @db_operation
+    async def get_all_anime(self, user_id: int, query: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """Get all anime matching the query for specific user"""
+        return self._find_anime(user_id, query)
+
+    @db_operation
+    async def count_anime(self, user_id: int, query: Dict[str, Any] = None) -> int:
+        """Count anime matching the query for specific user"""
+        try:
+            base_query = {"user_id": user_id}
+            if query:
+                base_query.update(query)
+            return self.collection.count_documents(base_query)
+        except PyMongoError as e:
+            logger.error(f"Error counting anime: {str(e)}")
+            raise
+
+    @db_operation
+    async def get_anime_page(
+        self,
+        user_id: int,
+        page: int,
+        per_page: int,
+        query: Dict[str, Any] = None
+    ) -> List[Dict[str, Any]]:
+        """Get one page of a user's watchlist in display order
+        
+        Favorites first, then Watching, To Watch, Completed and other statuses,
+        then alphabetically by title.
+        """
+        try:
+            base_query = {"user_id": user_id}
+            if query:
+                base_query.update(query)
+            return list(self.collection.aggregate([
+                {"$match": base_query},
+                {"$addFields": {
+                    "_fav_rank": {"$cond": [{"$eq": ["$is_favorite", True]}, 0, 1]},
+                    "_status_rank": {"$switch": {
+                        "branches": [
+                            {"case": {"$eq": ["$status", "Watching"]}, "then": 0},
+                            {"case": {"$eq": ["$status", "To Watch"]}, "then": 1},
+                            {"case": {"$eq": ["$status", "Completed"]}, "then": 2}
+                        ],
+                        "default": 3
+                    }},
+                    "_title_lower": {"$toLower": "$title"}
+                }},
+                {"$sort": {"_fav_rank": 1, "_status_rank": 1, "_title_lower": 1}},
+                {"$skip": page * per_page},
+                {"$limit": per_page},
+                {"$project": {"_fav_rank": 0, "_status_rank": 0, "_title_lower": 0}}
+            ]))
+        except PyMongoError as e:
+            logger.error(f"Error getting anime page: {str(e)}")
+            raise
+
+    @db_operation
+    async def get_title_ids(self, user_id: int) -> Dict[str, str]:
+        """Map every title in a user's watchlist to its entry id without blocking the event loop"""
+        try:
+            entries = await asyncio.to_thread(
+                lambda: list(self.collection.find({"user_id": user_id}, {"title": 1}))
+            )
+            return {entry["title"]: str(entry["_id"]) for entry in entries}
+        except PyMongoError as e:
+            logger.error(f"Error getting titles: {str(e)}")
+            raise
+
+    @db_operation
     async def get_favorites(self, user_id: int) -> List[Dict[str, Any]]:
         """Get all favorite anime for specific user"""
-        return await self.get_all_anime(user_id, {"is_favorite": True}) 
\ No newline at end of file
+        return self._find_anime(user_id, {"is_favorite": True})
+
+    @db_operation
+    async def get_titles_missing_anilist_id(self) -> List[str]:
+        """Get distinct titles of entries that have no AniList id stored yet"""
+        try:
+            return self.collection.distinct("title", {"anilist_id": {"$exists": False}})
+        except PyMongoError as e:
+            logger.error(f"Error getting titles without AniList id: {str(e)}")
+            raise
+
+    @db_operation
+    async def set_anilist_id(self, title: str, anilist_id: int) -> int:
+        """Store the AniList id on every entry with this title that lacks one"""
+        try:
+            result = self.collection.update_many(
+                {"title": title, "anilist_id": {"$exists": False}},
+                {"$set": {"anilist_id": anilist_id}}
+            )
+            return result.modified_count
+        except PyMongoError as e:
+            logger.error(f"Error setting AniList id: {str(e)}")
+            raise
+
+    @db_operation
+    async def get_watching_subscriptions(self) -> Dict[int, List[int]]:
+        """Map each AniList id being watched to the users watching it, minus opted-out users"""
+        try:
+            opted_out = set(self.users.distinct("user_id", {"airing_notifications": False}))
+            subscriptions = {}
+            for group in self.collection.aggregate([
+                {"$match": {"status": "Watching", "anilist_id": {"$exists": True}}},
+                {"$group": {"_id": "$anilist_id", "user_ids": {"$addToSet": "$user_id"}}}
+            ]):
+                user_ids = [user_id for user_id in group["user_ids"] if user_id not in opted_out]
+                if user_ids:
+                    subscriptions[group["_id"]] = user_ids
+            return subscriptions
+        except PyMongoError as e:
+            logger.error(f"Error getting watching subscriptions: {str(e)}")
+            raise
+
+    @db_operation
+    async def get_watching_media_ids(self, user_id: int) -> List[int]:
+        """Get the AniList ids of everything a user is watching"""
+        try:
+            return self.collection.distinct(
+                "anilist_id",
+                {"user_id": user_id, "status": "Watching", "anilist_id": {"$exists": True}}
+            )
+        except PyMongoError as e:
+            logger.error(f"Error getting watched media ids: {str(e)}")
+            raise
+
+    @db_operation
+    async def get_opted_out(self, user_ids: List[int]) -> Set[int]:
+        """Get which of the given users have turned new-episode notifications off"""
+        try:
+            return set(self.users.distinct(
+                "user_id",
+                {"user_id": {"$in": user_ids}, "airing_notifications": False}
+            ))
+        except PyMongoError as e:
+            logger.error(f"Error getting notification opt-outs: {str(e)}")
+            raise
+
+    @db_operation
+    async def get_airing_notifications(self, user_id: int) -> bool:
+        """Check whether a user receives new-episode notifications (on by default)"""
+        try:
+            user = self.users.find_one({"user_id": user_id}, {"airing_notifications": 1})
+            return user.get("airing_notifications", True) if user else True
+        except PyMongoError as e:
+            logger.error(f"Error getting notification setting: {str(e)}")
+            raise
+
+    @db_operation
+    async def set_airing_notifications(self, user_id: int, enabled: bool) -> None:
+        """Enable or disable new-episode notifications for a user"""
+        try:
+            self.users.update_one(
+                {"user_id": user_id},
+                {"$set": {"airing_notifications": enabled}},
+                upsert=True
+            )
+        except PyMongoError as e:
+            logger.error(f"Error setting notification setting: {str(e)}")
+            raise
+
+    @db_operation
+    async def report_cluster_health(self, report: Dict[str, Any]) -> None:
+        """Store the latest health report of one cluster process"""
+        try:
+            self.cluster_health.replace_one({"cluster_id": report["cluster_id"]}, report, upsert=True)
+        except PyMongoError as e:
+            logger.error(f"Error reporting cluster health: {str(e)}")
+            raise
+
+    @db_operation
+    async def get_cluster_health(self) -> List[Dict[str, Any]]:
+        """Get the latest health report of every cluster, ordered by cluster id"""
+        try:
+            return list(self.cluster_health.find({}, {"_id": 0}).sort("cluster_id", 1))
+        except PyMongoError as e:
+            logger.error(f"Error getting cluster health: {str(e)}")
+            raise
+
+    @db_operation
+    async def get_guild_prefixes(self) -> Dict[int, str]:
+        """Map every guild with a custom prefix to that prefix"""
+        try:
+            return {
+                doc["guild_id"]: doc["prefix"]
+                for doc in self.guild_settings.find({"prefix": {"$exists": True}}, {"_id": 0, "guild_id": 1, "prefix": 1})
+            }
+        except PyMongoError as e:
+            logger.error(f"Error getting guild prefixes: {str(e)}")
+            raise
+
+    @db_operation
+    async def set_guild_prefix(self, guild_id: int, prefix: Optional[str]) -> None:
+        """Store a guild's command prefix, or remove it with None"""
+        try:
+            if prefix is None:
+                self.guild_settings.update_one({"guild_id": guild_id}, {"$unset": {"prefix": ""}})
+            else:
+                self.guild_settings.update_one({"guild_id": guild_id}, {"$set": {"prefix": prefix}}, upsert=True)
+        except PyMongoError as e:
+            logger.error(f"Error setting guild prefix: {str(e)}")
+            raise
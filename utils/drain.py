@@ -0,0 +1,71 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from discord.ext import commands
+from config.config import DRAIN_TIMEOUT
+from utils.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+DRAIN_MESSAGE = "🛠️ The bot is restarting or under maintenance. Please try again in a moment."
+
+inflight_work = registry.gauge(
+    "inflight_work",
+    "Commands and component callbacks currently running",
+    labelnames=("kind",)
+)
+
+class BotDraining(commands.CheckFailure):
+    """Raised by the global check when a command arrives while the bot drains"""
+
+class DrainController:
+    """Tracks in-flight work and rejects new work while the bot drains
+
+    While draining, new commands and interactions are turned away up front,
+    and ``wait_idle`` resolves once everything already running has finished.
+    """
+
+    def __init__(self):
+        self.draining = False
+        self._inflight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    def start(self) -> None:
+        """Stop accepting new work"""
+        if not self.draining:
+            logger.info(f"Draining; waiting for {self._inflight} in-flight task(s)")
+        self.draining = True
+
+    def stop(self) -> None:
+        """Accept new work again"""
+        self.draining = False
+
+    @property
+    def inflight(self) -> int:
+        return self._inflight
+
+    @asynccontextmanager
+    async def track(self, kind: str):
+        """Count the enclosed block as in-flight work"""
+        self._inflight += 1
+        self._idle.clear()
+        inflight_work.inc(kind=kind)
+        try:
+            yield
+        finally:
+            self._inflight -= 1
+            inflight_work.dec(kind=kind)
+            if not self._inflight:
+                self._idle.set()
+
+    async def wait_idle(self, timeout: float = DRAIN_TIMEOUT) -> bool:
+        """Wait for in-flight work to finish; False if the timeout expired first"""
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            logger.warning(f"Drain timed out with {self._inflight} task(s) still running")
+            return False
+
+drain = DrainController()
@@ -0,0 +1,83 @@
+import asyncio
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+import discord
+from config.config import EDIT_COALESCE_WINDOW
+
+logger = logging.getLogger(__name__)
+
+class EditScheduler:
+    """Coalesces rapid edits of the same message into one request
+
+    Edits scheduled within ``window`` seconds of each other are merged so only
+    the latest state is sent, and edits that would not change what Discord
+    already shows are dropped.
+    """
+
+    def __init__(self, window: float = EDIT_COALESCE_WINDOW, max_tracked: int = 5000):
+        self.window = window
+        self.max_tracked = max_tracked
+        self._pending: Dict[int, Tuple[discord.Message, Dict[str, Any]]] = {}
+        self._tasks: Dict[int, asyncio.Task] = {}
+        self._last_sent: "OrderedDict[int, str]" = OrderedDict()
+
+    def schedule(self, message: discord.Message, **fields: Any) -> None:
+        """Queue an edit, merging it with any edit still pending for the message"""
+        pending = self._pending.get(message.id)
+        if pending:
+            pending[1].update(fields)
+        else:
+            self._pending[message.id] = (message, dict(fields))
+        if message.id not in self._tasks:
+            self._tasks[message.id] = asyncio.create_task(self._flush(message.id))
+
+    def remember(self, message: discord.Message, **fields: Any) -> None:
+        """Record what a message currently shows, e.g. after sending it directly"""
+        self._record(message.id, self._fingerprint(fields))
+
+    async def flush(self) -> None:
+        """Wait for every pending edit to be sent, e.g. before shutting down"""
+        tasks = list(self._tasks.values())
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _flush(self, message_id: int) -> None:
+        try:
+            await asyncio.sleep(self.window)
+        finally:
+            self._tasks.pop(message_id, None)
+            message, fields = self._pending.pop(message_id)
+
+        fingerprint = self._fingerprint(fields)
+        if self._last_sent.get(message_id) == fingerprint:
+            return
+        try:
+            await message.edit(**fields)
+            self._record(message_id, fingerprint)
+        except discord.HTTPException as e:
+            logger.warning(f"Failed to edit message {message_id}: {str(e)}")
+
+    def _record(self, message_id: int, fingerprint: str) -> None:
+        self._last_sent[message_id] = fingerprint
+        self._last_sent.move_to_end(message_id)
+        while len(self._last_sent) > self.max_tracked:
+            self._last_sent.popitem(last=False)
+
+    @staticmethod
+    def _fingerprint(fields: Dict[str, Any]) -> str:
+        payload = {}
+        for key, value in fields.items():
+            if isinstance(value, discord.Embed):
+                value = value.to_dict()
+            elif isinstance(value, discord.ui.View):
+                value = value.to_components()
+            payload[key] = value
+        return hashlib.blake2b(
+            json.dumps(payload, sort_keys=True, default=str).encode(),
+            digest_size=16
+        ).hexdigest()
+
+edit_scheduler = EditScheduler()
@@ -1,6 +1,8 @@
 from typing import List, Dict, Any, Optional
 from discord import Embed
 from config.config import EMBED_COLOR, EMBED_FOOTER
+from utils.media import MediaRecord
+from utils.text import EMBED_TITLE_LIMIT, EMBED_FIELD_VALUE_LIMIT, truncate, fit_embed
 
 class EmbedCreator:
     @staticmethod
@@ -11,33 +13,37 @@ class EmbedCreator:
         return embed
 
     @staticmethod
-    def create_anime_details_embed(anime_data: Dict[str, Any], watchlist_data: Optional[Dict[str, Any]] = None) -> Embed:
+    def create_anime_details_embed(anime_data: MediaRecord, watchlist_data: Optional[Dict[str, Any]] = None) -> Embed:
         """Create an embed for anime details"""
         embed = Embed(
-            title=anime_data["title"],
-            description=anime_data.get("description", "No description available"),
+            title=truncate(anime_data.title, EMBED_TITLE_LIMIT),
+            description=anime_data.description or "No description available",
             color=EMBED_COLOR
         )
         
         # Set thumbnail
-        if anime_data.get("cover_image"):
-            embed.set_thumbnail(url=anime_data["cover_image"])
+        if anime_data.cover_image:
+            embed.set_thumbnail(url=anime_data.cover_image)
         
         # Set banner image if available
-        if anime_data.get("banner_image"):
-            embed.set_image(url=anime_data["banner_image"])
+        if anime_data.banner_image:
+            embed.set_image(url=anime_data.banner_image)
         
         # Basic anime information
-        embed.add_field(name="Episodes", value=anime_data.get("episodes", "Unknown"), inline=True)
-        embed.add_field(name="Score", value=f"{anime_data.get('average_score', 'N/A')}/100", inline=True)
-        embed.add_field(name="Genres", value=", ".join(anime_data.get("genres", ["Unknown"])), inline=False)
+        embed.add_field(name="Episodes", value=anime_data.episodes or "Unknown", inline=True)
+        embed.add_field(name="Score", value=f"{anime_data.average_score or 'N/A'}/100", inline=True)
+        embed.add_field(
+            name="Genres",
+            value=truncate(", ".join(anime_data.genres), EMBED_FIELD_VALUE_LIMIT) or "Unknown",
+            inline=False
+        )
         
         # Add watchlist information if available
         if watchlist_data:
             embed.add_field(
                 name="Watch Status",
                 value=f"Status: {watchlist_data.get('status', 'Unknown')}\n"
-                      f"Progress: {watchlist_data.get('episodes_watched', 0)}/{anime_data.get('episodes', '?')}\n"
+                      f"Progress: {watchlist_data.get('episodes_watched', 0)}/{anime_data.episodes or '?'}\n"
                       f"Favorite: {'Yes' if watchlist_data.get('is_favorite') else 'No'}",
                 inline=False
             )
@@ -49,38 +55,37 @@ class EmbedCreator:
                 embed.add_field(name="Completed", value=watchlist_data["completion_date"], inline=True)
         
         # Add additional information
-        if anime_data.get("studios"):
-            embed.add_field(name="Studios", value=", ".join(anime_data["studios"]), inline=False)
+        if anime_data.studios:
+            embed.add_field(
+                name="Studios",
+                value=truncate(", ".join(anime_data.studios), EMBED_FIELD_VALUE_LIMIT),
+                inline=False
+            )
         
         # Add season information if available
-        if anime_data.get("season") and anime_data.get("year"):
+        if anime_data.season and anime_data.year:
             embed.add_field(
                 name="Season",
-                value=f"{anime_data['season']} {anime_data['year']}",
+                value=f"{anime_data.season} {anime_data.year}",
                 inline=True
             )
         
         # Add AniList link
-        if anime_data.get("site_url"):
-            embed.add_field(name="AniList Link", value=anime_data["site_url"], inline=False)
+        if anime_data.site_url:
+            embed.add_field(name="AniList Link", value=anime_data.site_url, inline=False)
         
         embed.set_footer(text=EMBED_FOOTER)
-        return embed
+        return fit_embed(embed)
 
     @staticmethod
     def create_list_embed(
         title: str,
-        anime_list: List[Dict[str, Any]],
+        current_items: List[Dict[str, Any]],
         page: int,
-        total_pages: int,
-        items_per_page: int
+        total_pages: int
     ) -> Embed:
-        """Create an embed for listing anime"""
+        """Create an embed for one page of an anime list"""
         embed = Embed(title=title, color=EMBED_COLOR)
-        
-        start_idx = page * items_per_page
-        end_idx = start_idx + items_per_page
-        current_items = anime_list[start_idx:end_idx]
 
         # Status emojis
         status_emoji = {
@@ -149,13 +154,13 @@ class EmbedCreator:
         return embed
 
     @staticmethod
-    def create_status_embed(anime_data: Dict[str, Any], watchlist_data: Dict[str, Any]) -> Embed:
+    def create_status_embed(anime_data: MediaRecord, watchlist_data: Dict[str, Any]) -> Embed:
         """Create a status embed with progress bars and quick actions"""
-        embed = Embed(title=f"📺 {anime_data['title']}", color=EMBED_COLOR)
+        embed = Embed(title=truncate(f"📺 {anime_data.title}", EMBED_TITLE_LIMIT), color=EMBED_COLOR)
         
         # Calculate progress percentage
         episodes_watched = watchlist_data.get('episodes_watched', 0)
-        total_episodes = anime_data.get('episodes', 0)
+        total_episodes = anime_data.episodes or 0
         progress_percent = (episodes_watched / total_episodes * 100) if total_episodes > 0 else 0
         
         # Create progress bar (20 segments)
@@ -185,7 +190,7 @@ class EmbedCreator:
         )
         
         # Score section
-        score = anime_data.get('average_score', 0)
+        score = anime_data.average_score or 0
         score_bar = '█' * int(score / 5) + '░' * (20 - int(score / 5))
         embed.add_field(
             name="⭐ Score",
@@ -223,8 +228,20 @@ class EmbedCreator:
             )
         
         # Set thumbnail if available
-        if anime_data.get("cover_image"):
-            embed.set_thumbnail(url=anime_data["cover_image"])
+        if anime_data.cover_image:
+            embed.set_thumbnail(url=anime_data.cover_image)
         
-        embed.set_footer(text=f"{EMBED_FOOTER} | Use reactions to perform actions")
-        return embed 
\ No newline at end of file
+        embed.set_footer(text=f"{EMBED_FOOTER} | Use the buttons below to perform actions")
+        return embed
+
+    @staticmethod
+    def create_airing_embed(title: str, episode: int, site_url: Optional[str] = None) -> Embed:
+        """Create an embed announcing a newly aired episode"""
+        embed = Embed(
+            title=f"🔔 New Episode: {title}",
+            description=f"Episode **{episode}** of **{title}** just aired!",
+            color=EMBED_COLOR,
+            url=site_url
+        )
+        embed.set_footer(text=f"{EMBED_FOOTER} | You're watching this anime")
+        return embed
@@ -0,0 +1,121 @@
+import asyncio
+import functools
+import logging
+import re
+import time
+from discord import ComponentType, Interaction
+from config.config import INTERACTION_ACK_BUDGET, OWNER_IDS
+from utils.metrics import registry
+from utils.drain import drain, DRAIN_MESSAGE
+
+logger = logging.getLogger(__name__)
+
+ACK_POLL_INTERVAL = 0.05  # seconds between checks for a response while under budget
+
+interaction_ack_seconds = registry.histogram(
+    "interaction_ack_seconds",
+    "Time from receiving a component interaction to acknowledging it",
+    labelnames=("component",)
+)
+interaction_response_seconds = registry.histogram(
+    "interaction_response_seconds",
+    "Time from receiving a component interaction to its callback finishing",
+    labelnames=("component",)
+)
+
+# discord.py gives items without an explicit custom_id a random 32-digit hex one
+_GENERATED_CUSTOM_ID = re.compile(r"[0-9a-f]{32}")
+
+def _component_label(interaction: Interaction, owner: str) -> str:
+    """Metric label for a component that doesn't grow with users, pages or views
+
+    Fixed custom ids are used as is, paginator buttons by their list kind, and
+    generated ids by the owning class plus the component type.
+    """
+    data = interaction.data or {}
+    custom_id = data.get("custom_id") or ""
+    if custom_id.startswith("pg:"):
+        return ":".join(custom_id.split(":", 2)[:2])
+    if not custom_id or _GENERATED_CUSTOM_ID.fullmatch(custom_id):
+        component_type = data.get("component_type")
+        kind = ComponentType(component_type).name if component_type else interaction.type.name
+        return f"{owner}:{kind}"
+    return custom_id
+
+async def _watch_ack(interaction: Interaction, started: float, component: str) -> None:
+    """Record time-to-ack, deferring if the callback is about to miss Discord's window"""
+    deadline = started + INTERACTION_ACK_BUDGET
+    while not interaction.response.is_done():
+        # Never defer while a callback's own response is already in flight
+        if time.monotonic() >= deadline and not interaction.extras.get("responding"):
+            interaction.extras["auto_defer"] = asyncio.current_task()
+            try:
+                await interaction.response.defer()
+                logger.warning(f"Auto-deferred slow interaction '{component}'")
+            except Exception as e:
+                logger.error(f"Failed to auto-defer interaction '{component}': {str(e)}")
+            break
+        await asyncio.sleep(ACK_POLL_INTERVAL)
+    interaction_ack_seconds.observe(time.monotonic() - started, component=component)
+
+def tracked_callback(callback):
+    """Wrap a view callback with ack-latency tracking and automatic deferral
+
+    Works for both view methods and plain ``(interaction)`` item callbacks; the
+    interaction is always the last positional argument. Callbacks should answer
+    through ``respond``/``respond_edit``/``defer`` so they follow up correctly
+    when the wrapper has already deferred. While the bot drains, new clicks
+    from anyone but the owners are rejected before the callback runs.
+    """
+    @functools.wraps(callback)
+    async def wrapper(*args, **kwargs):
+        interaction: Interaction = args[-1]
+        if drain.draining and interaction.user.id not in OWNER_IDS:
+            await interaction.response.send_message(DRAIN_MESSAGE, ephemeral=True)
+            return None
+        started = time.monotonic()
+        # Bound methods get their view or item as the first argument; closures
+        # are named after the class they were defined in
+        owner = type(args[0]).__name__ if len(args) > 1 else callback.__qualname__.split(".")[0]
+        component = _component_label(interaction, owner)
+        watchdog = asyncio.create_task(_watch_ack(interaction, started, component))
+        try:
+            async with drain.track("interaction"):
+                return await callback(*args, **kwargs)
+        finally:
+            if not watchdog.done() and not interaction.extras.get("auto_defer"):
+                watchdog.cancel()
+                if interaction.response.is_done():
+                    interaction_ack_seconds.observe(time.monotonic() - started, component=component)
+            interaction_response_seconds.observe(time.monotonic() - started, component=component)
+    return wrapper
+
+async def _acknowledged(interaction: Interaction) -> bool:
+    deferral = interaction.extras.get("auto_defer")
+    if deferral is not None:
+        await asyncio.shield(deferral)
+        return True
+    return interaction.response.is_done()
+
+async def respond(interaction: Interaction, *args, **kwargs) -> None:
+    """Send a message as the response, or as a followup if already acknowledged"""
+    if await _acknowledged(interaction):
+        await interaction.followup.send(*args, **kwargs)
+        return
+    interaction.extras["responding"] = True
+    await interaction.response.send_message(*args, **kwargs)
+
+async def respond_edit(interaction: Interaction, **kwargs) -> None:
+    """Edit the component's message as the response, or via the original response if already acknowledged"""
+    if await _acknowledged(interaction):
+        await interaction.edit_original_response(**kwargs)
+        return
+    interaction.extras["responding"] = True
+    await interaction.response.edit_message(**kwargs)
+
+async def defer(interaction: Interaction, **kwargs) -> None:
+    """Defer the interaction unless it has already been acknowledged"""
+    if await _acknowledged(interaction):
+        return
+    interaction.extras["responding"] = True
+    await interaction.response.defer(**kwargs)
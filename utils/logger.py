@@ -1,11 +1,105 @@
+import atexit
+import json
 import logging
+import queue
+import random
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from config.config import LOG_FORMAT, LOG_FILE, LOG_LEVEL
+from config.config import (
+    LOG_FORMAT, LOG_FILE, LOG_LEVEL, LOG_JSON,
+    LOG_COMMAND_SAMPLE_RATE, LOG_COMMAND_RATE_LIMIT
+)
+
+# Attributes every LogRecord has; anything else was passed through ``extra``
+_RECORD_ATTRS = set(logging.LogRecord("", 0, "", 0, "", (), None).__dict__) | {"message", "asctime"}
+
+class JSONFormatter(logging.Formatter):
+    """Format records as one JSON object per line, including ``extra`` fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+class AsyncQueueHandler(QueueHandler):
+    """Queue records for the listener thread, keeping ``extra`` fields intact
+
+    The stock handler flattens each record into a preformatted string; this
+    one only resolves the message and traceback so the formatter on the
+    listener side can still emit them as structured fields.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+class CommandLogFilter(logging.Filter):
+    """Sample and rate-limit command usage lines
+
+    Keeps ``sample_rate`` of the records, and at most ``rate`` per second
+    (bursts up to the same number). The next line written after a drop
+    notes how many were suppressed.
+    """
+
+    def __init__(self, sample_rate: float = 1.0, rate: float = 0.0):
+        super().__init__()
+        self.sample_rate = sample_rate
+        self.rate = rate
+        self.suppressed = 0
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self) -> bool:
+        if self.rate <= 0:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            self.suppressed += 1
+            return False
+        if not self._take():
+            self.suppressed += 1
+            return False
+        if self.suppressed:
+            record.suppressed = self.suppressed
+            record.msg = f"{record.msg} ({self.suppressed} earlier command line(s) suppressed)"
+            self.suppressed = 0
+        return True
 
 def setup_logger(name: str) -> logging.Logger:
-    """Set up logger with file and console handlers"""
+    """Set up logger whose file and console output is written by a background thread"""
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, LOG_LEVEL))
 
@@ -13,6 +107,8 @@ def setup_logger(name: str) -> logging.Logger:
     log_path = Path(LOG_FILE)
     log_path.parent.mkdir(parents=True, exist_ok=True)
 
+    formatter = JSONFormatter() if LOG_JSON else logging.Formatter(LOG_FORMAT)
+
     # File Handler (with rotation)
     file_handler = RotatingFileHandler(
         LOG_FILE,
@@ -20,27 +116,39 @@ def setup_logger(name: str) -> logging.Logger:
         backupCount=5,
         encoding='utf-8'
     )
-    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
-    logger.addHandler(file_handler)
+    file_handler.setFormatter(formatter)
 
     # Console Handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
-    logger.addHandler(console_handler)
+    console_handler.setFormatter(formatter)
+
+    # Callers only enqueue; writes and rotation happen on the listener thread
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(AsyncQueueHandler(log_queue))
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
 
     return logger
 
 # Create the main logger
 logger = setup_logger('anime_bot')
 
+# Command usage is the highest-volume log line, so it is sampled and capped
+command_logger = logger.getChild('commands')
+command_logger.addFilter(CommandLogFilter(LOG_COMMAND_SAMPLE_RATE, LOG_COMMAND_RATE_LIMIT))
+
 def log_command(command_name: str, user_id: int, guild_id: int) -> None:
     """Log command usage"""
-    logger.info(f"Command '{command_name}' used by user {user_id} in guild {guild_id}")
+    command_logger.info(
+        f"Command '{command_name}' used by user {user_id} in guild {guild_id}",
+        extra={"command": command_name, "user_id": user_id, "guild_id": guild_id}
+    )
 
 def log_error(error: Exception, command_name: str = None) -> None:
     """Log error with context"""
     if command_name:
-        logger.error(f"Error in command '{command_name}': {str(error)}", exc_info=True)
+        logger.error(f"Error in command '{command_name}': {str(error)}", exc_info=True, extra={"command": command_name})
     else:
         logger.error(f"Error: {str(error)}", exc_info=True)
 
@@ -50,4 +158,4 @@ def log_startup() -> None:
 
 def log_shutdown() -> None:
     """Log bot shutdown"""
-    logger.info("Bot is shutting down...") 
\ No newline at end of file
+    logger.info("Bot is shutting down...")
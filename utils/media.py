@@ -0,0 +1,69 @@
+import json
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+from utils.text import clean_description
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+def json_loads(raw: bytes) -> Any:
+    """Decode a JSON payload, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+class MediaRecord(NamedTuple):
+    """Compact, immutable view of an AniList Media object
+
+    Built once per media id and shared by the cache and EmbedCreator, so the
+    description is sanitized and trimmed to its embed budget only once.
+    """
+    id: int
+    title: str
+    english_title: Optional[str]
+    native_title: Optional[str]
+    synonyms: Tuple[str, ...]
+    description: Optional[str]
+    episodes: Optional[int]
+    status: Optional[str]
+    genres: Tuple[str, ...]
+    average_score: Optional[int]
+    popularity: Optional[int]
+    site_url: Optional[str]
+    cover_image: Optional[str]
+    banner_image: Optional[str]
+    studios: Tuple[str, ...]
+    year: Optional[int]
+    season: Optional[str]
+
+    @classmethod
+    def from_api(cls, media: Dict[str, Any]) -> "MediaRecord":
+        """Shape a raw GraphQL Media dict into a record"""
+        title = media.get("title") or {}
+        cover = media.get("coverImage") or {}
+        studios = (media.get("studios") or {}).get("nodes") or ()
+        return cls(
+            media["id"],
+            title.get("romaji") or title.get("english") or "",
+            title.get("english"),
+            title.get("native"),
+            tuple(media.get("synonyms") or ()),
+            clean_description(media.get("description")),
+            media.get("episodes"),
+            media.get("status"),
+            tuple(media.get("genres") or ()),
+            media.get("averageScore"),
+            media.get("popularity"),
+            media.get("siteUrl"),
+            cover.get("large"),
+            media.get("bannerImage"),
+            tuple(studio["name"] for studio in studios),
+            media.get("seasonYear"),
+            media.get("season")
+        )
+
+def parse_graphql_response(raw: bytes) -> Tuple[Optional[Dict[str, Any]], Optional[Any]]:
+    """Decode a GraphQL response body into its (data, errors) parts"""
+    payload = json_loads(raw)
+    return payload.get("data") or {}, payload.get("errors")
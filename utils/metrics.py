@@ -0,0 +1,216 @@
+import bisect
+import functools
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Seconds; suits everything from cache hits to slow Discord round trips
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class Histogram:
+    """Fixed-bucket histogram with optional labels"""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # labels -> [per-bucket counts (+Inf last), sum, count]
+        self._series: Dict[Tuple[str, ...], List] = {}
+
+    def _labels(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._labels(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][bisect.bisect_left(self.buckets, value)] += 1
+            series[1] += value
+            series[2] += 1
+
+    def series(self) -> Dict[Tuple[str, ...], Tuple[List[int], float, int]]:
+        """Snapshot of (bucket counts, sum, count) per label set"""
+        with self._lock:
+            return {key: (list(counts), total, count) for key, (counts, total, count) in self._series.items()}
+
+    def quantile(self, q: float, **labels: str) -> Optional[float]:
+        """Estimate a quantile by interpolating within buckets, across all series when no labels are given"""
+        snapshot = self.series()
+        if labels:
+            key = self._labels(labels)
+            snapshot = {key: snapshot[key]} if key in snapshot else {}
+        counts = [0] * (len(self.buckets) + 1)
+        total = 0
+        for bucket_counts, _, count in snapshot.values():
+            counts = [a + b for a, b in zip(counts, bucket_counts)]
+            total += count
+        if not total:
+            return None
+
+        rank = q * total
+        seen = 0
+        for index, count in enumerate(counts):
+            if seen + count >= rank and count:
+                if index == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+class Counter:
+    """Monotonically increasing count, with optional labels"""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def _labels(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._labels(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._labels(labels), 0)
+
+    def series(self) -> Dict[Tuple[str, ...], float]:
+        """Snapshot of the count per label set"""
+        with self._lock:
+            return dict(self._values)
+
+class Gauge:
+    """Value that can go up and down, with optional labels"""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def _labels(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[self._labels(labels)] = value
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._labels(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._labels(labels), 0)
+
+    def series(self) -> Dict[Tuple[str, ...], float]:
+        """Snapshot of the value per label set"""
+        with self._lock:
+            return dict(self._values)
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _label_text(names: Sequence[str], values: Sequence[str], extra: Sequence[Tuple[str, str]] = ()) -> str:
+    pairs = [*zip(names, values), *extra]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class MetricsRegistry:
+    """Process-wide collection of named metrics"""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._collectors: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            return metric
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets)
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Register a callback that refreshes gauges right before metrics are read"""
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+
+    def collect(self) -> List[object]:
+        with self._lock:
+            collectors = list(self._collectors)
+        for collector in collectors:
+            collector()
+        with self._lock:
+            return list(self._metrics.values())
+
+    def render_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format"""
+        lines = []
+        for metric in self.collect():
+            kind = {Counter: "counter", Gauge: "gauge", Histogram: "histogram"}[type(metric)]
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {kind}")
+            if isinstance(metric, Histogram):
+                for labels, (counts, total, count) in metric.series().items():
+                    cumulative = 0
+                    for bound, bucket_count in zip((*metric.buckets, float("inf")), counts):
+                        cumulative += bucket_count
+                        label_text = _label_text(metric.labelnames, labels, [("le", _number(bound))])
+                        lines.append(f"{metric.name}_bucket{label_text} {cumulative}")
+                    label_text = _label_text(metric.labelnames, labels)
+                    lines.append(f"{metric.name}_sum{label_text} {_number(total)}")
+                    lines.append(f"{metric.name}_count{label_text} {count}")
+            else:
+                for labels, value in metric.series().items():
+                    lines.append(f"{metric.name}{_label_text(metric.labelnames, labels)} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+registry = MetricsRegistry()
+
+def timed(histogram: Histogram, **labels: str):
+    """Decorate a coroutine function to observe its duration, labelled by ``operation`` when unset"""
+    def decorator(func):
+        operation_labels = {"operation": func.__name__, **labels} if "operation" in histogram.labelnames else labels
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - started, **operation_labels)
+        return wrapper
+    return decorator
@@ -0,0 +1,45 @@
+import logging
+from typing import Optional
+from aiohttp import web
+from utils.metrics import MetricsRegistry, registry as default_registry
+
+logger = logging.getLogger(__name__)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+class MetricsServer:
+    """Small aiohttp listener serving the metrics registry as Prometheus text on /metrics"""
+
+    def __init__(self, host: str, port: int, registry: MetricsRegistry = default_registry):
+        self.host = host
+        self.port = port
+        self.registry = registry
+        self._runner: Optional[web.AppRunner] = None
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(
+            body=self.registry.render_prometheus().encode("utf-8"),
+            headers={"Content-Type": PROMETHEUS_CONTENT_TYPE}
+        )
+
+    async def start(self) -> None:
+        """Start listening; failures are logged so the bot still runs without metrics"""
+        if self._runner is not None:
+            return
+        app = web.Application()
+        app.router.add_get("/metrics", self._handle_metrics)
+        runner = web.AppRunner(app, access_log=None)
+        try:
+            await runner.setup()
+            await web.TCPSite(runner, self.host, self.port).start()
+        except OSError as e:
+            logger.error(f"Could not start metrics server on {self.host}:{self.port}: {str(e)}")
+            await runner.cleanup()
+            return
+        self._runner = runner
+        logger.info(f"Serving metrics on http://{self.host}:{self.port}/metrics")
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
@@ -0,0 +1,172 @@
+import asyncio
+import heapq
+import logging
+import time
+from typing import Dict, List, Optional, Set, Tuple
+import discord
+from config.config import NOTIFIER_REFRESH_INTERVAL, NOTIFY_BATCH_SIZE, NOTIFY_BATCH_DELAY
+
+logger = logging.getLogger(__name__)
+
+class AiringNotifier:
+    """Pings users when a new episode of something they are watching airs
+
+    A single background task keeps a min-heap of ``(airing_at, media_id, episode)``
+    events and sleeps until the earliest one, so the cost does not grow with the
+    number of subscribed users.
+    """
+
+    def __init__(self, bot, db, anilist, embed_creator):
+        self.bot = bot
+        self.db = db
+        self.anilist = anilist
+        self.embed_creator = embed_creator
+        self._heap: List[Tuple[int, int, int]] = []
+        self._subscriptions: Dict[int, List[int]] = {}
+        self._media_info: Dict[int, Dict] = {}
+        self._stale_media: Set[int] = set()
+        self._next_refresh = 0.0
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the sleeper task"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the sleeper task"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def update_user(self, user_id: int, enabled: bool, media_ids: List[int]) -> None:
+        """Apply one user's notification toggle to the subscriptions in memory
+
+        Only media that isn't scheduled yet is fetched from AniList, on the
+        next wake-up.
+        """
+        if not enabled:
+            for user_ids in self._subscriptions.values():
+                if user_id in user_ids:
+                    user_ids.remove(user_id)
+            return
+        for media_id in media_ids:
+            user_ids = self._subscriptions.setdefault(media_id, [])
+            if user_id not in user_ids:
+                user_ids.append(user_id)
+            if media_id not in self._media_info:
+                self._stale_media.add(media_id)
+        if self._stale_media:
+            self._wake.set()
+
+    async def _run(self) -> None:
+        await self.bot.wait_until_ready()
+        while True:
+            try:
+                if time.time() >= self._next_refresh:
+                    await self._refresh()
+                elif self._stale_media:
+                    await self._refresh_media(list(self._stale_media))
+                    self._stale_media.clear()
+
+                await self._fire_due_events()
+                await self._sleep_until_next_event()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Airing notifier error: {str(e)}", exc_info=True)
+                await asyncio.sleep(60)
+
+    async def _sleep_until_next_event(self) -> None:
+        wake_at = self._next_refresh
+        if self._heap:
+            wake_at = min(wake_at, self._heap[0][0])
+        if self._stale_media:
+            wake_at = min(wake_at, time.time() + 60)
+
+        self._wake.clear()
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=max(0.0, wake_at - time.time()))
+        except asyncio.TimeoutError:
+            pass
+
+    async def _refresh(self) -> None:
+        """Reload subscriptions and the airing schedule of every tracked media"""
+        self._subscriptions = await self.db.get_watching_subscriptions()
+        self._media_info = {}
+        self._heap = []
+        await self._refresh_media(list(self._subscriptions))
+        # Everything was just rescheduled; leftover ids would be pushed a second time
+        self._stale_media.clear()
+        self._next_refresh = time.time() + NOTIFIER_REFRESH_INTERVAL
+        logger.info(
+            f"Airing schedule refreshed: {len(self._heap)} upcoming episodes "
+            f"for {len(self._subscriptions)} tracked anime"
+        )
+
+    async def _refresh_media(self, media_ids: List[int]) -> None:
+        """Fetch the next episode for the given media and push it onto the heap"""
+        schedule = await self.anilist.fetch_airing_schedule(media_ids)
+        now = time.time()
+        for media_id, info in schedule.items():
+            if info["airing_at"] <= now:
+                continue
+            current = self._media_info.get(media_id)
+            if current and current["episode"] == info["episode"] and current["airing_at"] == info["airing_at"]:
+                continue  # Already on the heap
+            self._media_info[media_id] = info
+            heapq.heappush(self._heap, (info["airing_at"], media_id, info["episode"]))
+
+    async def _fire_due_events(self) -> None:
+        now = time.time()
+        while self._heap and self._heap[0][0] <= now:
+            airing_at, media_id, episode = heapq.heappop(self._heap)
+            info = self._media_info.get(media_id)
+            user_ids = self._subscriptions.get(media_id)
+            # Skip entries superseded by a later refresh
+            if not info or info["episode"] != episode or not user_ids:
+                continue
+
+            # Opt-outs made on other clusters since the last refresh are only in Mongo
+            opted_out = await self.db.get_opted_out(user_ids)
+            user_ids = [user_id for user_id in user_ids if user_id not in opted_out]
+
+            embed = self.embed_creator.create_airing_embed(info["title"], episode, info.get("site_url"))
+            await self._fan_out(user_ids, embed)
+            self._stale_media.add(media_id)
+
+    async def _fan_out(self, user_ids: List[int], embed: discord.Embed) -> None:
+        """Send the notification in concurrent batches with a pause between them"""
+        for start in range(0, len(user_ids), NOTIFY_BATCH_SIZE):
+            batch = user_ids[start:start + NOTIFY_BATCH_SIZE]
+            await asyncio.gather(*(self._notify(user_id, embed) for user_id in batch))
+            if start + NOTIFY_BATCH_SIZE < len(user_ids):
+                await asyncio.sleep(NOTIFY_BATCH_DELAY)
+
+    async def _notify(self, user_id: int, embed: discord.Embed) -> None:
+        user = None
+        try:
+            user = self.bot.get_user(user_id) or await self.bot.fetch_user(user_id)
+            await user.send(embed=embed)
+        except discord.Forbidden:
+            pass  # DMs closed
+        except discord.HTTPException as e:
+            if e.status == 429 and user is not None:
+                retry_after = getattr(e, "retry_after", None) or 5
+                logger.warning(f"Rate limited sending airing notification. Retrying after {retry_after} seconds")
+                await asyncio.sleep(retry_after)
+                try:
+                    await user.send(embed=embed)
+                except discord.HTTPException:
+                    pass
+            else:
+                logger.error(f"Failed to notify user {user_id}: {str(e)}")
@@ -0,0 +1,126 @@
+import re
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+import discord
+from discord import ButtonStyle, Interaction
+from discord.ui import Button, DynamicItem, View
+from utils.edit_scheduler import edit_scheduler
+from utils.interactions import tracked_callback, respond, defer
+
+# A page source renders one page for a user and returns (embed, total pages, list version)
+PageSource = Callable[[int, int], Awaitable[Tuple[discord.Embed, int, int]]]
+
+_page_sources: Dict[str, PageSource] = {}
+
+class RenderedPageCache:
+    """Rendered pages keyed by (user_id, list_version, page)
+
+    Only the newest list version is kept per user, so a watchlist change drops
+    every page rendered for the old version. Users are evicted least recently
+    used first once ``max_users`` is reached.
+    """
+
+    def __init__(self, max_users: int = 1000):
+        self.max_users = max_users
+        self._users: "OrderedDict[int, Tuple[int, Dict[int, Any]]]" = OrderedDict()
+
+    def get(self, user_id: int, version: int, page: int) -> Optional[Any]:
+        entry = self._users.get(user_id)
+        if entry is None or entry[0] != version:
+            return None
+        self._users.move_to_end(user_id)
+        return entry[1].get(page)
+
+    def set(self, user_id: int, version: int, page: int, rendered: Any) -> None:
+        entry = self._users.get(user_id)
+        if entry is None or entry[0] != version:
+            entry = (version, {})
+            self._users[user_id] = entry
+        entry[1][page] = rendered
+        self._users.move_to_end(user_id)
+        while len(self._users) > self.max_users:
+            self._users.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        """Drop every rendered page for a user"""
+        self._users.pop(user_id, None)
+
+def register_page_source(kind: str, source: PageSource) -> None:
+    """Register (or replace, on cog reload) the renderer for a kind of paginated list"""
+    _page_sources[kind] = source
+
+class PageButton(DynamicItem[Button], template=r"pg:(?P<kind>\w+):(?P<user_id>\d+):(?P<version>\d+):(?P<page>\d+):(?P<dir>[pn])"):
+    """Previous/next button whose custom_id carries all of the paginator state
+
+    Registered once with ``bot.add_dynamic_items``, so buttons keep working on
+    every message, including ones sent before a restart, without a coroutine
+    or View instance per message.
+    """
+
+    def __init__(self, kind: str, user_id: int, version: int, page: int, direction: str, disabled: bool = False):
+        self.kind = kind
+        self.user_id = user_id
+        self.version = version
+        self.page = page
+        self.direction = direction
+        super().__init__(
+            Button(
+                style=ButtonStyle.secondary,
+                emoji="⬅️" if direction == "p" else "➡️",
+                custom_id=f"pg:{kind}:{user_id}:{version}:{page}:{direction}",
+                disabled=disabled
+            )
+        )
+
+    @classmethod
+    async def from_custom_id(cls, interaction: Interaction, item: Button, match: re.Match):
+        return cls(
+            match["kind"],
+            int(match["user_id"]),
+            int(match["version"]),
+            int(match["page"]),
+            match["dir"]
+        )
+
+    async def interaction_check(self, interaction: Interaction) -> bool:
+        if interaction.user.id != self.user_id:
+            await interaction.response.send_message("This list belongs to someone else!", ephemeral=True)
+            return False
+        return True
+
+    @tracked_callback
+    async def callback(self, interaction: Interaction):
+        source = _page_sources.get(self.kind)
+        if source is None:
+            await respond(interaction, "This list is no longer available.", ephemeral=True)
+            return
+
+        # The target page is already encoded; a newer list version just re-renders
+        # the same page index against the fresh data
+        # Acknowledge immediately and let rapid clicks collapse into one edit
+        await defer(interaction)
+        embed, view = await render_page(self.kind, self.user_id, self.page)
+        edit_scheduler.schedule(interaction.message, embed=embed, view=view)
+
+def build_page_view(kind: str, user_id: int, version: int, page: int, total_pages: int) -> View:
+    """Build the navigation row for a rendered page"""
+    view = View(timeout=None)
+    view.add_item(PageButton(kind, user_id, version, max(page - 1, 0), "p", disabled=page <= 0))
+    view.add_item(Button(
+        label=f"{page + 1}/{total_pages}",
+        style=ButtonStyle.secondary,
+        custom_id=f"pg:{kind}:{user_id}:{version}:{page}:label",
+        disabled=True
+    ))
+    view.add_item(PageButton(kind, user_id, version, min(page + 1, total_pages - 1), "n", disabled=page >= total_pages - 1))
+    return view
+
+async def render_page(kind: str, user_id: int, page: int) -> Tuple[discord.Embed, View]:
+    """Render a page from its registered source, clamping it to the list bounds"""
+    source = _page_sources[kind]
+    embed, total_pages, version = await source(user_id, page)
+    total_pages = max(total_pages, 1)
+    if page >= total_pages:
+        page = total_pages - 1
+        embed, total_pages, version = await source(user_id, page)
+    return embed, build_page_view(kind, user_id, version, page, max(total_pages, 1))
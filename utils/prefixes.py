@@ -0,0 +1,65 @@
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+OWNER_PREFIX = "?"
+
+class PrefixResolver:
+    """In-memory prefix lookup for every guild
+
+    Guild prefixes are loaded from Mongo once and kept in sync by
+    ``setprefix``; mention prefixes are built once after login. Candidate
+    prefix tuples are cached so resolving a message allocates nothing, and
+    ``may_be_command`` rejects most chat by looking at a single character.
+    """
+
+    def __init__(self, default: str, owner_ids: Iterable[int]):
+        self.default = default
+        self.owner_ids = frozenset(owner_ids)
+        self._guild_prefixes: Dict[int, str] = {}
+        self._mentions: Tuple[str, ...] = ()
+        self._candidates: Dict[Tuple[str, bool], Tuple[str, ...]] = {}
+        self._first_chars: Dict[Tuple[str, bool], FrozenSet[str]] = {}
+
+    def load(self, guild_prefixes: Dict[int, str]) -> None:
+        """Replace the guild prefix map, e.g. with what is stored in Mongo"""
+        self._guild_prefixes = dict(guild_prefixes)
+
+    def set_mentions(self, user_id: int) -> None:
+        """Precompute mention prefixes once the bot's user id is known"""
+        self._mentions = (f"<@!{user_id}> ", f"<@{user_id}> ")
+        self._candidates.clear()
+        self._first_chars.clear()
+
+    def set(self, guild_id: int, prefix: Optional[str]) -> None:
+        """Set a guild's prefix, or reset it to the default with None"""
+        if prefix is None or prefix == self.default:
+            self._guild_prefixes.pop(guild_id, None)
+        else:
+            self._guild_prefixes[guild_id] = prefix
+
+    def for_guild(self, guild_id: Optional[int]) -> str:
+        """The prefix used in a guild (the default one in DMs)"""
+        if guild_id is None:
+            return self.default
+        return self._guild_prefixes.get(guild_id, self.default)
+
+    def candidates(self, guild_id: Optional[int], author_id: int) -> Tuple[str, ...]:
+        """Every prefix that may start a command from this author in this guild"""
+        key = (self.for_guild(guild_id), author_id in self.owner_ids)
+        prefixes = self._candidates.get(key)
+        if prefixes is None:
+            prefix, is_owner = key
+            prefixes = (prefix, *self._mentions, *((OWNER_PREFIX,) if is_owner else ()))
+            self._candidates[key] = prefixes
+            self._first_chars[key] = frozenset(candidate[0] for candidate in prefixes)
+        return prefixes
+
+    def may_be_command(self, content: str, guild_id: Optional[int], author_id: int) -> bool:
+        """Cheap pre-check: could this message start with one of its prefixes?"""
+        if not content:
+            return False
+        key = (self.for_guild(guild_id), author_id in self.owner_ids)
+        first_chars = self._first_chars.get(key)
+        if first_chars is None:
+            self.candidates(guild_id, author_id)
+            first_chars = self._first_chars[key]
+        return content[0] in first_chars
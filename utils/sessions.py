@@ -0,0 +1,141 @@
+import asyncio
+import logging
+import sys
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, Union
+from discord.ui import View
+from config.config import SESSION_MAX_PER_USER, SESSION_MAX_TOTAL
+from utils.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+# A session is either a View awaiting clicks or a future awaiting a reply
+Session = Union[View, asyncio.Future]
+
+sessions_open = registry.gauge(
+    "interactive_sessions_open",
+    "Interactive sessions currently open",
+    labelnames=("kind",)
+)
+sessions_bytes = registry.gauge(
+    "interactive_sessions_bytes",
+    "Approximate memory held by open interactive sessions",
+    labelnames=("kind",)
+)
+
+def _kind(session: Session) -> str:
+    return "confirmation" if isinstance(session, asyncio.Future) else type(session).__name__
+
+def approximate_size(obj: Any, _seen: Optional[set] = None) -> int:
+    """Approximate bytes owned by obj, following containers, views and their items
+
+    Other objects are only counted shallowly so shared state such as the cog or
+    the bot is not attributed to every session referencing it.
+    """
+    seen = _seen if _seen is not None else set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, int, float, bool)) or obj is None:
+        return size
+    if isinstance(obj, dict):
+        return size + sum(approximate_size(k, seen) + approximate_size(v, seen) for k, v in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return size + sum(approximate_size(item, seen) for item in obj)
+    if isinstance(obj, View):
+        size += approximate_size(vars(obj), seen)
+        return size + sum(approximate_size(vars(item), seen) for item in obj.children)
+    return size
+
+class SessionRegistry:
+    """Caps concurrent interactive sessions per user and across the bot
+
+    Sessions are kept in open order; when a cap is hit the oldest session
+    (of that user, or overall) is closed to make room for the new one.
+    """
+
+    def __init__(self, max_per_user: int = SESSION_MAX_PER_USER, max_total: int = SESSION_MAX_TOTAL):
+        self.max_per_user = max_per_user
+        self.max_total = max_total
+        # id(session) -> (user_id, session), oldest first
+        self._sessions: "OrderedDict[int, Tuple[int, Session]]" = OrderedDict()
+        self._by_user: Dict[int, "OrderedDict[int, Session]"] = {}
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def open(self, user_id: int, session: Session) -> None:
+        """Track a new session, closing the oldest ones if a cap is exceeded"""
+        user_sessions = self._by_user.setdefault(user_id, OrderedDict())
+        while len(user_sessions) >= self.max_per_user:
+            self._evict(next(iter(user_sessions.values())), f"user {user_id} cap")
+        while len(self._sessions) >= self.max_total:
+            self._evict(next(iter(self._sessions.values()))[1], "global cap")
+
+        # _evict may have dropped the user's (now empty) bucket
+        self._by_user.setdefault(user_id, user_sessions)[id(session)] = session
+        self._sessions[id(session)] = (user_id, session)
+        sessions_open.inc(kind=_kind(session))
+        if isinstance(session, asyncio.Future):
+            session.add_done_callback(self.release)
+
+    def release(self, session: Session) -> None:
+        """Stop tracking a session that finished on its own; safe to call twice"""
+        entry = self._sessions.pop(id(session), None)
+        if entry is None:
+            return
+        user_id = entry[0]
+        user_sessions = self._by_user.get(user_id)
+        if user_sessions is not None:
+            user_sessions.pop(id(session), None)
+            if not user_sessions:
+                del self._by_user[user_id]
+        sessions_open.dec(kind=_kind(session))
+
+    def _evict(self, session: Session, reason: str) -> None:
+        logger.info(f"Closing oldest {_kind(session)} session ({reason})")
+        self._close(session)
+
+    def _close(self, session: Session) -> None:
+        self.release(session)
+        if isinstance(session, asyncio.Future):
+            session.cancel()
+        else:
+            session.stop()
+
+    def close_all(self) -> None:
+        """Close every open session, e.g. on shutdown"""
+        for _, session in list(self._sessions.values()):
+            self._close(session)
+
+    def measure(self) -> int:
+        """Refresh the memory gauge and return the approximate total bytes held"""
+        totals: Dict[str, int] = {}
+        for _, session in self._sessions.values():
+            kind = _kind(session)
+            totals[kind] = totals.get(kind, 0) + approximate_size(session)
+        for key in sessions_bytes.series():
+            sessions_bytes.set(0, kind=key[0])
+        for kind, size in totals.items():
+            sessions_bytes.set(size, kind=kind)
+        return sum(totals.values())
+
+sessions = SessionRegistry()
+registry.add_collector(sessions.measure)
+
+class SessionView(View):
+    """View registered with the session registry for as long as it listens"""
+
+    def __init__(self, user_id: int, *, timeout: Optional[float] = 180):
+        super().__init__(timeout=timeout)
+        self.user_id = user_id
+        sessions.open(user_id, self)
+
+    def stop(self) -> None:
+        sessions.release(self)
+        super().stop()
+
+    async def on_timeout(self) -> None:
+        sessions.release(self)
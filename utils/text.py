@@ -0,0 +1,56 @@
+import html
+import re
+from typing import Iterable, List, Optional
+
+# Discord embed limits
+EMBED_TITLE_LIMIT = 256
+EMBED_DESCRIPTION_LIMIT = 4096
+EMBED_FIELD_NAME_LIMIT = 256
+EMBED_FIELD_VALUE_LIMIT = 1024
+EMBED_TOTAL_LIMIT = 6000
+
+# Room kept for a media description in details embeds
+DESCRIPTION_BUDGET = 2048
+
+_BREAK_TAG = re.compile(r"<br\s*/?>", re.IGNORECASE)
+_TAG = re.compile(r"<[^>]+>")
+_SPACES = re.compile(r"[ \t\r\f\v]+")
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+def truncate(text: str, limit: int) -> str:
+    """Cut text to at most ``limit`` characters, marking the cut with an ellipsis"""
+    if len(text) <= limit:
+        return text
+    return text[:limit - 1].rstrip() + "…"
+
+def chunk_lines(lines: Iterable[str], limit: int = EMBED_FIELD_VALUE_LIMIT) -> List[str]:
+    """Join lines into as few newline-separated chunks of at most ``limit`` characters as possible"""
+    chunks: List[str] = []
+    current = ""
+    for line in lines:
+        line = truncate(line, limit)
+        if current and len(current) + 1 + len(line) > limit:
+            chunks.append(current)
+            current = line
+        else:
+            current = f"{current}\n{line}" if current else line
+    if current:
+        chunks.append(current)
+    return chunks
+
+def clean_description(description: Optional[str], limit: int = DESCRIPTION_BUDGET) -> Optional[str]:
+    """Turn an AniList HTML description into plain text that fits an embed"""
+    if not description:
+        return None
+    text = _BREAK_TAG.sub("\n", description)
+    text = html.unescape(_TAG.sub("", text))
+    text = "\n".join(_SPACES.sub(" ", line).strip() for line in text.split("\n"))
+    text = _BLANK_LINES.sub("\n\n", text).strip()
+    return truncate(text, limit) if text else None
+
+def fit_embed(embed):
+    """Shrink an embed's description until the whole embed fits Discord's total budget"""
+    overflow = len(embed) - EMBED_TOTAL_LIMIT
+    if overflow > 0 and embed.description:
+        embed.description = truncate(embed.description, max(len(embed.description) - overflow, 1))
+    return embed
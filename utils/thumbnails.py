@@ -0,0 +1,86 @@
+import asyncio
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+class ThumbnailCache:
+    """Size-bounded on-disk cache of cover images keyed by URL
+
+    Reads refresh a file's mtime, and the least recently used files are
+    removed once the directory grows past ``max_bytes``.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    async def close(self) -> None:
+        if self.session:
+            await self.session.close()
+            self.session = None
+
+    def _path(self, url: str) -> Path:
+        return self.directory / hashlib.sha1(url.encode()).hexdigest()
+
+    async def get(self, url: Optional[str]) -> Optional[bytes]:
+        """Return the image at url, downloading it on a cache miss"""
+        if not url:
+            return None
+        path = self._path(url)
+        data = await asyncio.to_thread(self._read, path)
+        if data is not None:
+            return data
+
+        try:
+            if self.session is None:
+                self.session = aiohttp.ClientSession()
+            async with self.session.get(url) as response:
+                if response.status != 200:
+                    return None
+                data = await response.read()
+        except aiohttp.ClientError as e:
+            logger.error(f"Error downloading thumbnail {url}: {str(e)}")
+            return None
+
+        await asyncio.to_thread(self._write, path, data)
+        return data
+
+    @staticmethod
+    def _read(path: Path) -> Optional[bytes]:
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        os.utime(path)
+        return data
+
+    def _write(self, path: Path, data: bytes) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+        self._prune()
+
+    def _prune(self) -> None:
+        files = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.is_file():
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        files.sort()
+        for _, size, file_path in files:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(file_path)
+                total -= size
+            except FileNotFoundError:
+                pass
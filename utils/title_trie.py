@@ -0,0 +1,160 @@
+import asyncio
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+class _Node:
+    __slots__ = ("children", "titles")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.titles: Set[str] = set()
+
+def _word_keys(title: str) -> List[str]:
+    """Keys a title is indexed under: the full title and every word-start suffix"""
+    words = title.casefold().split()
+    return [" ".join(words[i:]) for i in range(len(words))]
+
+class TitleTrie:
+    """Case-insensitive prefix trie that completes on any word of a title
+
+    Each title can carry a value, e.g. the id of the entry it belongs to.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, Any]] = ()):
+        self._root = _Node()
+        self._values: Dict[str, Any] = {}
+        for title, value in entries:
+            self.add(title, value)
+
+    def value(self, title: str) -> Any:
+        return self._values.get(title)
+
+    def add(self, title: str, value: Any = None) -> None:
+        self._values[title] = value
+        for key in _word_keys(title):
+            node = self._root
+            for char in key:
+                node = node.children.setdefault(char, _Node())
+            node.titles.add(title)
+
+    def remove(self, title: str) -> None:
+        self._values.pop(title, None)
+        for key in _word_keys(title):
+            path = [self._root]
+            for char in key:
+                node = path[-1].children.get(char)
+                if node is None:
+                    break
+                path.append(node)
+            else:
+                path[-1].titles.discard(title)
+                # Prune nodes that no longer lead anywhere
+                for depth in range(len(key), 0, -1):
+                    node = path[depth]
+                    if node.titles or node.children:
+                        break
+                    del path[depth - 1].children[key[depth - 1]]
+
+    def complete(self, prefix: str, limit: int = 25) -> List[str]:
+        """Return up to ``limit`` titles with a word starting with prefix"""
+        node = self._root
+        for char in " ".join(prefix.casefold().split()):
+            node = node.children.get(char)
+            if node is None:
+                return []
+
+        results: List[str] = []
+        seen: Set[str] = set()
+        stack = [node]
+        while stack and len(results) < limit:
+            node = stack.pop()
+            for title in sorted(node.titles):
+                if title not in seen:
+                    seen.add(title)
+                    results.append(title)
+            stack.extend(node.children[char] for char in sorted(node.children, reverse=True))
+        return results[:limit]
+
+class TitleIndex:
+    """Per-user title tries mapping titles to entry ids, built lazily and kept in sync by writes
+
+    Each trie is stamped with the watchlist version it reflects. A trie whose
+    stamp no longer matches the stored version (e.g. after a write handled by
+    another cluster process) is rebuilt instead of served.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[int], Awaitable[Dict[str, str]]],
+        versions: Callable[[int], Awaitable[int]],
+        max_users: int = 5000
+    ):
+        self._loader = loader
+        self._versions = versions
+        self.max_users = max_users
+        self._tries: "OrderedDict[int, Tuple[int, TitleTrie]]" = OrderedDict()
+        self._loading: Dict[Tuple[int, int], asyncio.Task] = {}
+
+    def _advance(self, user_id: int, version: int) -> Optional[TitleTrie]:
+        """Restamp a trie for a local write, dropping it if it missed an earlier one"""
+        entry = self._tries.get(user_id)
+        if entry is None:
+            return None
+        if entry[0] != version - 1:
+            del self._tries[user_id]
+            return None
+        self._tries[user_id] = (version, entry[1])
+        return entry[1]
+
+    def add(self, user_id: int, title: str, entry_id: str, version: int) -> None:
+        trie = self._advance(user_id, version)
+        if trie is not None:
+            trie.add(title, entry_id)
+
+    def remove(self, user_id: int, title: str, version: int) -> None:
+        trie = self._advance(user_id, version)
+        if trie is not None:
+            trie.remove(title)
+
+    def advance(self, user_id: int, version: int) -> None:
+        """Record a write that left the titles unchanged"""
+        self._advance(user_id, version)
+
+    async def _load(self, user_id: int, version: int) -> TitleTrie:
+        try:
+            trie = TitleTrie((await self._loader(user_id)).items())
+            self._tries[user_id] = (version, trie)
+            while len(self._tries) > self.max_users:
+                self._tries.popitem(last=False)
+            return trie
+        finally:
+            self._loading.pop((user_id, version), None)
+
+    async def _current(self, user_id: int) -> TitleTrie:
+        version = await self._versions(user_id)
+        entry = self._tries.get(user_id)
+        if entry is not None and entry[0] == version:
+            self._tries.move_to_end(user_id)
+            return entry[1]
+        task = self._loading.get((user_id, version))
+        if task is None:
+            task = self._loading[(user_id, version)] = asyncio.create_task(self._load(user_id, version))
+        return await asyncio.shield(task)
+
+    async def complete(
+        self,
+        user_id: int,
+        prefix: str,
+        limit: int = 25,
+        timeout: Optional[float] = None
+    ) -> List[Tuple[str, str]]:
+        """Complete a title for a user as (title, entry id) pairs, returning nothing if the trie can't be built in time
+
+        A load that misses the timeout keeps running, so the next keystroke
+        is served from memory.
+        """
+        try:
+            trie = await asyncio.wait_for(self._current(user_id), timeout)
+        except asyncio.TimeoutError:
+            return []
+        return [(title, trie.value(title)) for title in trie.complete(prefix, limit)]